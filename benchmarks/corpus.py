@@ -0,0 +1,196 @@
+import random
+import zipfile
+from pathlib import Path
+from typing import List
+from xml.sax.saxutils import escape
+
+WORDS = (
+    "vector database embedding retrieval document chunk namespace tenant index "
+    "query language model agent summary context answer citation pipeline batch "
+    "upload parser page section paragraph token latency throughput memory cache"
+).split()
+
+
+def generate_paragraphs(
+        total_paragraphs: int,
+        words_per_paragraph: int = 80,
+        seed: int = 0,
+) -> List[str]:
+    """Generate deterministic pseudo-english paragraphs."""
+    rng = random.Random(seed)
+    paragraphs = []
+    for _ in range(total_paragraphs):
+        words = [rng.choice(WORDS) for _ in range(words_per_paragraph)]
+        words[0] = words[0].capitalize()
+        paragraphs.append(" ".join(words) + ".")
+    return paragraphs
+
+
+def write_text(
+        file_path: str | Path,
+        total_paragraphs: int,
+        seed: int = 0,
+) -> Path:
+    """Write a UTF-8 text file of blank-line separated paragraphs."""
+    file_path = Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_text("\n\n".join(generate_paragraphs(total_paragraphs, seed=seed)) + "\n", encoding="utf-8")
+    return file_path
+
+
+def _escape_pdf_text(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_text_pdf(
+        file_path: str | Path,
+        total_pages: int,
+        lines_per_page: int = 40,
+        seed: int = 0,
+) -> Path:
+    """Write a text-only PDF with ``total_pages`` pages without third-party libraries."""
+    file_path = Path(file_path)
+    rng = random.Random(seed)
+
+    page_streams = []
+    for page_number in range(total_pages):
+        lines = [f"Page {page_number + 1}"]
+        for _ in range(lines_per_page):
+            lines.append(" ".join(rng.choice(WORDS) for _ in range(12)))
+
+        commands = ["BT", "/F1 10 Tf", "12 TL", "50 780 Td"]
+        for line in lines:
+            commands.append(f"({_escape_pdf_text(line)}) Tj T*")
+        commands.append("ET")
+        page_streams.append("\n".join(commands).encode("latin-1"))
+
+    # Object layout: 1 catalog, 2 page tree, 3 font, then a (page, content) pair per page.
+    objects: List[bytes] = [b"", b"", b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for stream in page_streams:
+        page_id = len(objects) + 1
+        content_id = page_id + 1
+        page_ids.append(page_id)
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>".encode("latin-1")
+        )
+        objects.append(
+            f"<< /Length {len(stream)} >>\nstream\n".encode("latin-1") + stream + b"\nendstream"
+        )
+
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode("latin-1")
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for object_id, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f"{object_id} 0 obj\n".encode("latin-1") + body + b"\nendobj\n"
+
+    xref_offset = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n".encode("latin-1")
+    output += b"0000000000 65535 f \n"
+    for offset in offsets:
+        output += f"{offset:010d} 00000 n \n".encode("latin-1")
+    output += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref_offset}\n%%EOF\n"
+    ).encode("latin-1")
+
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(bytes(output))
+    return file_path
+
+
+_DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '</Types>'
+)
+
+_DOCX_PACKAGE_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+_DOCX_DOCUMENT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+_DOCX_NAMESPACE = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+_DOCX_STYLES = (
+    f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:styles {_DOCX_NAMESPACE}>'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Title"><w:name w:val="Title"/></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading2"><w:name w:val="heading 2"/></w:style>'
+    '</w:styles>'
+)
+
+
+def _docx_paragraph(text: str, style: str = "") -> str:
+    properties = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ""
+    return f'<w:p>{properties}<w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p>'
+
+
+def _docx_table(rows: List[List[str]]) -> str:
+    body = "".join(
+        "<w:tr>" + "".join(f"<w:tc>{_docx_paragraph(cell)}</w:tc>" for cell in row) + "</w:tr>"
+        for row in rows
+    )
+    return f"<w:tbl>{body}</w:tbl>"
+
+
+def write_docx(
+        file_path: str | Path,
+        total_sections: int,
+        paragraphs_per_section: int = 6,
+        seed: int = 0,
+) -> Path:
+    """Write a DOCX with a title, headings, paragraphs and one table per section, without third-party libraries."""
+    file_path = Path(file_path)
+    rng = random.Random(seed)
+    paragraphs = iter(generate_paragraphs(total_sections * paragraphs_per_section, seed=seed))
+
+    blocks = [_docx_paragraph(f"Document {seed}", "Title")]
+    for section in range(total_sections):
+        blocks.append(_docx_paragraph(f"Section {section + 1}", "Heading1"))
+        for index in range(paragraphs_per_section):
+            if index == paragraphs_per_section // 2:
+                blocks.append(_docx_paragraph(f"Subsection {section + 1}.1", "Heading2"))
+            blocks.append(_docx_paragraph(next(paragraphs)))
+        blocks.append(_docx_table([
+            [rng.choice(WORDS) for _ in range(4)] for _ in range(5)
+        ]))
+
+    document = (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:document {_DOCX_NAMESPACE}>'
+        f'<w:body>{"".join(blocks)}</w:body></w:document>'
+    )
+
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(file_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", _DOCX_CONTENT_TYPES)
+        archive.writestr("_rels/.rels", _DOCX_PACKAGE_RELS)
+        archive.writestr("word/_rels/document.xml.rels", _DOCX_DOCUMENT_RELS)
+        archive.writestr("word/styles.xml", _DOCX_STYLES)
+        archive.writestr("word/document.xml", document)
+    return file_path
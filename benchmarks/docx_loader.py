@@ -0,0 +1,156 @@
+"""
+Compare the DOCX loaders: import cost and files/sec over a corpus of generated (or
+supplied) documents.
+
+"fast" is DocxFastLoader, "python-docx" a paragraph and table walk with python-docx as a
+baseline, and "accurate" the unstructured-backed loader. Loaders whose dependency is not
+installed are reported as skipped. Import time is measured in a fresh interpreter per
+loader, so modules already imported by another loader do not skew it.
+
+Usage:
+    python -m benchmarks.docx_loader --files 50 --sections 20
+    python -m benchmarks.docx_loader --corpus ./docs --loaders fast accurate
+"""
+import argparse
+import importlib.util
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from benchmarks.corpus import write_docx
+
+LOADERS = ["fast", "python-docx", "accurate"]
+
+_FAST_LOADER_PATH = Path(__file__).resolve().parent.parent / "domains" / "injestion" / "docx_loader.py"
+
+# Statements that import everything a loader needs, timed in a fresh interpreter. The fast
+# loader module is executed from its file so the domains.injestion package (routes, vector
+# stores) is not counted against it.
+_IMPORT_STATEMENTS = {
+    "fast": (
+        "import importlib.util; "
+        f"spec = importlib.util.spec_from_file_location('docx_loader', {str(_FAST_LOADER_PATH)!r}); "
+        "spec.loader.exec_module(importlib.util.module_from_spec(spec))"
+    ),
+    "python-docx": "import docx",
+    "accurate": (
+        "from langchain_community.document_loaders import UnstructuredWordDocumentLoader; "
+        "from unstructured.partition.docx import partition_docx"
+    ),
+}
+
+_REQUIRED_MODULES = {
+    "fast": None,
+    "python-docx": "docx",
+    "accurate": "unstructured",
+}
+
+
+def _load_fast(file_path: str) -> int:
+    from domains.injestion.docx_loader import DocxFastLoader
+
+    return sum(len(document.page_content) for document in DocxFastLoader(file_path).lazy_load())
+
+
+def _load_python_docx(file_path: str) -> int:
+    import docx
+
+    document = docx.Document(file_path)
+    total_characters = sum(len(paragraph.text) for paragraph in document.paragraphs)
+    for table in document.tables:
+        for row in table.rows:
+            total_characters += sum(len(cell.text) for cell in row.cells)
+    return total_characters
+
+
+def _load_accurate(file_path: str) -> int:
+    from langchain_community.document_loaders import UnstructuredWordDocumentLoader
+
+    return sum(len(document.page_content) for document in UnstructuredWordDocumentLoader(file_path).load())
+
+
+_LOAD_FUNCTIONS: Dict[str, Callable[[str], int]] = {
+    "fast": _load_fast,
+    "python-docx": _load_python_docx,
+    "accurate": _load_accurate,
+}
+
+
+def is_available(loader: str) -> bool:
+    module = _REQUIRED_MODULES[loader]
+    return module is None or importlib.util.find_spec(module) is not None
+
+
+def measure_import_seconds(loader: str, repeat: int) -> float:
+    script = (
+        "import time; started = time.perf_counter(); "
+        f"{_IMPORT_STATEMENTS[loader]}; "
+        "print(time.perf_counter() - started)"
+    )
+    return min(
+        float(subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout)
+        for _ in range(repeat)
+    )
+
+
+def run_loader(loader: str, file_paths: List[str], repeat: int) -> Dict[str, float]:
+    load = _LOAD_FUNCTIONS[loader]
+    load(file_paths[0])
+
+    timings = []
+    total_characters = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        total_characters = sum(load(file_path) for file_path in file_paths)
+        timings.append(time.perf_counter() - started)
+
+    best = min(timings)
+    return {
+        "characters": total_characters,
+        "seconds": best,
+        "files_per_second": len(file_paths) / best,
+    }
+
+
+def build_corpus(directory: Path, files: int, sections: int) -> List[str]:
+    # Vary the section count so the corpus mixes short and long documents.
+    return [
+        str(write_docx(directory / f"document_{index:03d}.docx", max(1, sections * (index % 4 + 1) // 2), seed=index))
+        for index in range(files)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="Directory of DOCX files to benchmark; a synthetic corpus is generated otherwise")
+    parser.add_argument("--files", type=int, default=40, help="Files in the synthetic corpus")
+    parser.add_argument("--sections", type=int, default=16, help="Median heading sections per synthetic file")
+    parser.add_argument("--loaders", nargs="+", choices=LOADERS, default=LOADERS)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if args.corpus:
+            file_paths = sorted(str(path) for path in Path(args.corpus).glob("*.docx"))
+        else:
+            file_paths = build_corpus(Path(temp_dir), args.files, args.sections)
+        print(f"{len(file_paths)} files")
+
+        for loader in args.loaders:
+            if not is_available(loader):
+                print(f"{loader:<12} skipped: {_REQUIRED_MODULES[loader]} is not installed")
+                continue
+
+            import_seconds = measure_import_seconds(loader, args.repeat)
+            result = run_loader(loader, file_paths, args.repeat)
+            print(
+                f"{loader:<12} import {import_seconds:7.3f}s  best {result['seconds']:8.3f}s  "
+                f"{result['files_per_second']:9.1f} files/sec  {result['characters']:10d} chars"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Recall vs. latency of shortened embeddings, to pick EMBEDDING_DIMENSION.
+
+text-embedding-3 models shorten a vector by keeping its leading dimensions and
+renormalizing. This benchmark does the same to a set of full-width vectors and, for
+each candidate dimension, reports:
+
+    recall@k against exact search over the full-width vectors, mean and p95 search
+    latency over an exact (brute-force) float32 index, and index / upsert payload size.
+
+Vectors come from a .npy file of real full-width embeddings (rows are documents; the
+last --queries rows are held out as queries), or are synthesized with the energy
+concentrated in the leading dimensions as in Matryoshka-trained models. Synthetic recall
+only shows the trend; measure real vectors before changing a production index.
+
+Usage:
+    python -m benchmarks.embedding_dimension --dimensions 1536 1024 512 256
+    python -m benchmarks.embedding_dimension --vectors embeddings.npy --top-k 5 --output dims.json
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+def synthesize(documents: int, queries: int, dimension: int, seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """Documents with a power-law spectrum, and queries that are noisy copies of random documents."""
+    rng = np.random.default_rng(seed)
+    scale = (1 + np.arange(dimension, dtype=np.float32)) ** -0.5
+    corpus = rng.standard_normal((documents, dimension), dtype=np.float32) * scale
+    picked = corpus[rng.integers(0, documents, queries)]
+    noise = rng.standard_normal((queries, dimension), dtype=np.float32) * scale
+    return corpus, picked + 0.5 * noise
+
+
+def shorten(vectors: np.ndarray, dimension: int) -> np.ndarray:
+    shortened = np.ascontiguousarray(vectors[:, :dimension], dtype=np.float32)
+    return shortened / np.maximum(np.linalg.norm(shortened, axis=1, keepdims=True), 1e-12)
+
+
+def top_k(index: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    scores = queries @ index.T
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    return np.take_along_axis(top, np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1), axis=1)
+
+
+def measure(corpus: np.ndarray, queries: np.ndarray, truth: np.ndarray, dimension: int, k: int) -> Dict[str, Any]:
+    index = shorten(corpus, dimension)
+    shortened_queries = shorten(queries, dimension)
+
+    latencies = []
+    found = np.empty_like(truth)
+    for row, query in enumerate(shortened_queries):
+        started = time.perf_counter()
+        found[row] = top_k(index, query[None, :], k)[0]
+        latencies.append(time.perf_counter() - started)
+
+    recall = np.mean([len(set(expected) & set(actual)) / k for expected, actual in zip(truth, found)])
+    latencies_ms = np.asarray(latencies) * 1000
+    return {
+        "dimension": dimension,
+        f"recall_at_{k}": float(recall),
+        "search_ms_mean": float(latencies_ms.mean()),
+        "search_ms_p95": float(np.percentile(latencies_ms, 95)),
+        "index_mb": index.nbytes / (1024 * 1024),
+        # Pinecone upserts send vector values as JSON floats, about 10 bytes each.
+        "upsert_kb_per_1000_vectors": dimension * 10 * 1000 / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vectors", help=".npy file of full-width embeddings; synthetic vectors otherwise")
+    parser.add_argument("--documents", type=int, default=50_000, help="Synthetic documents")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--full-dimension", type=int, default=1536, help="Width of the synthetic vectors")
+    parser.add_argument("--dimensions", type=int, nargs="+", default=[1536, 1024, 768, 512, 256])
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    if args.vectors:
+        vectors = np.load(args.vectors).astype(np.float32)
+        corpus, queries = vectors[:-args.queries], vectors[-args.queries:]
+    else:
+        corpus, queries = synthesize(args.documents, args.queries, args.full_dimension)
+
+    full_dimension = corpus.shape[1]
+    truth = top_k(shorten(corpus, full_dimension), shorten(queries, full_dimension), args.top_k)
+    results: List[Dict[str, Any]] = [
+        measure(corpus, queries, truth, dimension, args.top_k)
+        for dimension in sorted({min(dimension, full_dimension) for dimension in args.dimensions}, reverse=True)
+    ]
+
+    report = {
+        "source": args.vectors or "synthetic",
+        "documents": len(corpus),
+        "queries": len(queries),
+        "full_dimension": full_dimension,
+        "top_k": args.top_k,
+        "results": results,
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
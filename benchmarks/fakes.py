@@ -0,0 +1,132 @@
+"""
+Offline stand-ins for the embeddings provider and the vector database, so benchmarks
+exercise the injestion code without network calls or cost.
+"""
+import hashlib
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+
+class FakeEmbeddings(Embeddings):
+    """
+    Deterministic embeddings: the vector of a text is seeded from its hash, so equal
+    texts always get equal vectors. ``latency_ms`` is added per call to simulate the
+    provider round-trip. Calls, texts and time spent are counted for stage breakdowns.
+    """
+
+    def __init__(self, dimension: int = 1536, latency_ms: float = 0.0) -> None:
+        self.dimension = dimension
+        self.latency_ms = latency_ms
+        self.calls = 0
+        self.texts = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def _vector(self, text: str) -> List[float]:
+        seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+        vector = np.random.default_rng(seed).standard_normal(self.dimension, dtype=np.float32)
+        return (vector / np.linalg.norm(vector)).tolist()
+
+    def _record(self, started: float, texts: int) -> None:
+        with self._lock:
+            self.calls += 1
+            self.texts += texts
+            self.seconds += time.perf_counter() - started
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        started = time.perf_counter()
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        vectors = [self._vector(text) for text in texts]
+        self._record(started, len(texts))
+        return vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+class InMemoryIndex:
+    """
+    The subset of the Pinecone Index API used by the injestion and retrieval code,
+    backed by dictionaries. ``latency_ms`` is added per upsert to simulate the network.
+    """
+
+    def __init__(self, latency_ms: float = 0.0) -> None:
+        self.latency_ms = latency_ms
+        self.upserts = 0
+        self.seconds = 0.0
+        self._namespaces: Dict[str, Dict[str, Tuple[List[float], dict]]] = {}
+        self._lock = threading.Lock()
+
+    def upsert(self, vectors: List[Dict[str, Any]], namespace: str = "") -> Dict[str, int]:
+        started = time.perf_counter()
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        with self._lock:
+            records = self._namespaces.setdefault(namespace, {})
+            for vector in vectors:
+                records[vector["id"]] = (vector["values"], vector.get("metadata", {}))
+            self.upserts += 1
+            self.seconds += time.perf_counter() - started
+        return {"upserted_count": len(vectors)}
+
+    def delete(
+            self,
+            ids: Optional[List[str]] = None,
+            delete_all: bool = False,
+            namespace: str = "",
+            **kwargs: Any,
+    ) -> Dict[str, Any]:
+        with self._lock:
+            if delete_all:
+                self._namespaces.pop(namespace, None)
+            else:
+                records = self._namespaces.get(namespace, {})
+                for vector_id in ids or []:
+                    records.pop(vector_id, None)
+        return {}
+
+    def describe_index_stats(self, **kwargs: Any) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "namespaces": {
+                    namespace: {"vector_count": len(records)}
+                    for namespace, records in self._namespaces.items()
+                },
+                "total_vector_count": sum(len(records) for records in self._namespaces.values()),
+            }
+
+    def query(
+            self,
+            vector: List[float],
+            top_k: int = 10,
+            namespace: str = "",
+            include_metadata: bool = False,
+            **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Exact cosine search over the namespace."""
+        with self._lock:
+            records = list(self._namespaces.get(namespace, {}).items())
+        if not records:
+            return {"matches": [], "namespace": namespace}
+
+        matrix = np.asarray([values for _, (values, _) in records], dtype=np.float32)
+        # The LangChain Pinecone store sends the query as a one-row list of vectors.
+        query = np.asarray(vector, dtype=np.float32).ravel()
+        scores = matrix @ query / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(query) + 1e-12)
+        top = np.argsort(-scores)[:top_k]
+        return {
+            "matches": [
+                {
+                    "id": records[position][0],
+                    "score": float(scores[position]),
+                    **({"metadata": records[position][1][1]} if include_metadata else {}),
+                }
+                for position in top
+            ],
+            "namespace": namespace,
+        }
@@ -0,0 +1,37 @@
+"""
+Measurement helpers shared by the benchmark scripts: peak memory, a fresh process per
+measured run, and the commit being measured.
+"""
+import multiprocessing
+import resource
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def peak_rss_mb() -> float:
+    """Peak resident memory of this process so far, in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_in_fresh_process(function: Callable[..., T], *args: Any) -> T:
+    """
+    Call ``function`` in a newly spawned interpreter and return its result, so its peak
+    memory and any patches it applies belong to that run alone.
+    """
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(function, *args).result()
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
@@ -0,0 +1,218 @@
+"""
+Offline end-to-end injestion benchmark.
+
+Generates a synthetic PDF/TXT/DOCX corpus, then runs file_loader and push_to_database
+on every file against FakeEmbeddings and an in-memory Pinecone index, so no provider
+or database is called. The run happens in a fresh process and its results are printed
+as JSON (or written to --output) for comparison between commits:
+
+    pages/sec and chunks/sec overall and per file type, peak RSS, and seconds spent
+    parsing, splitting, embedding, upserting and in the rest of push_to_database.
+
+Upserts run on the upsert engine's thread pool, so ``upsert`` is summed thread time and
+can exceed the wall-clock ``push`` time.
+
+Usage:
+    python -m benchmarks.injestion --files 10 --size 40
+    python -m benchmarks.injestion --types pdf --embedding-latency-ms 150 --output before.json
+"""
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from benchmarks.corpus import write_docx, write_text, write_text_pdf
+from benchmarks.harness import git_commit, peak_rss_mb, run_in_fresh_process
+
+FILE_TYPES = ["pdf", "txt", "docx"]
+
+
+def build_corpus(directory: Path, file_types: List[str], files: int, size: int) -> Dict[str, List[str]]:
+    """
+    ``size`` is pages per PDF, heading sections per DOCX and (times ten) paragraphs per
+    TXT file, which gives files of roughly comparable text volume.
+    """
+    writers = {
+        "pdf": lambda path, seed: write_text_pdf(path, size, seed=seed),
+        "txt": lambda path, seed: write_text(path, size * 10, seed=seed),
+        "docx": lambda path, seed: write_docx(path, size, seed=seed),
+    }
+    return {
+        file_type: [
+            str(writers[file_type](directory / f"document_{index:03d}.{file_type}", index))
+            for index in range(files)
+        ]
+        for file_type in file_types
+    }
+
+
+def run_benchmark(
+        state_directory: str,
+        corpus: Dict[str, List[str]],
+        dimension: int,
+        embedding_latency_ms: float,
+        upsert_latency_ms: float,
+) -> Dict[str, Any]:
+    from loguru import logger
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    import domains.injestion  # noqa: F401 -- import order: the package wires the vector db modules
+    import domains.injestion.doc_loader as doc_loader
+    import domains.vector_db.utils as vector_db_utils
+    from benchmarks.fakes import FakeEmbeddings, InMemoryIndex
+    from domains.settings import config_settings
+
+    # Keep the manifest, checkpoints and embedding cache of the run out of the working tree.
+    config_settings.STATE_DIRECTORY = state_directory
+
+    embeddings = FakeEmbeddings(dimension=dimension, latency_ms=embedding_latency_ms)
+    index = InMemoryIndex(latency_ms=upsert_latency_ms)
+    config_settings.VECTOR_DATABASE_TO_USE = "pinecone"
+    vector_db_utils.get_cached_embeddings = lambda *args, **kwargs: embeddings
+    vector_db_utils.pinecone_upsert_engine.get_index = lambda index_name: index
+
+    split_seconds = 0.0
+    split_text = doc_loader.split_text
+
+    def timed_split_text(*args: Any, **kwargs: Any):
+        nonlocal split_seconds
+        started = time.perf_counter()
+        try:
+            return split_text(*args, **kwargs)
+        finally:
+            split_seconds += time.perf_counter() - started
+
+    doc_loader.split_text = timed_split_text
+
+    results: Dict[str, Any] = {}
+    totals = {"files": 0, "pages": 0, "chunks": 0, "load_seconds": 0.0, "push_seconds": 0.0}
+    for file_type, file_paths in corpus.items():
+        pages = chunks = 0
+        load_seconds = push_seconds = 0.0
+        for file_path in file_paths:
+            file_name = Path(file_path).name
+
+            started = time.perf_counter()
+            parsed_documents, loaded_documents = doc_loader.file_loader(
+                pre_signed_url=file_path,
+                file_name=file_name,
+                original_file_name=file_name,
+                file_type=file_type,
+                process_type=file_type,
+            )
+            load_seconds += time.perf_counter() - started
+
+            started = time.perf_counter()
+            push_status = vector_db_utils.push_to_database(
+                texts=parsed_documents,
+                index_name="benchmark",
+                namespace=f"benchmark-{file_type}",
+                drop_namespace=False,
+            )
+            push_seconds += time.perf_counter() - started
+            if not push_status.status:
+                raise RuntimeError(f"push_to_database failed for {file_path}: {push_status.message}")
+
+            pages += len(loaded_documents)
+            chunks += len(parsed_documents)
+
+        elapsed = load_seconds + push_seconds
+        results[file_type] = {
+            "files": len(file_paths),
+            "pages": pages,
+            "chunks": chunks,
+            "seconds": elapsed,
+            "pages_per_second": pages / elapsed if elapsed else 0.0,
+            "chunks_per_second": chunks / elapsed if elapsed else 0.0,
+        }
+        for key, value in (("files", len(file_paths)), ("pages", pages), ("chunks", chunks),
+                           ("load_seconds", load_seconds), ("push_seconds", push_seconds)):
+            totals[key] += value
+
+    elapsed = totals["load_seconds"] + totals["push_seconds"]
+    return {
+        "by_file_type": results,
+        "total": {
+            "files": totals["files"],
+            "pages": totals["pages"],
+            "chunks": totals["chunks"],
+            "seconds": elapsed,
+            "pages_per_second": totals["pages"] / elapsed if elapsed else 0.0,
+            "chunks_per_second": totals["chunks"] / elapsed if elapsed else 0.0,
+        },
+        "stages": {
+            "parse": totals["load_seconds"] - split_seconds,
+            "split": split_seconds,
+            "push": totals["push_seconds"],
+            "embed": embeddings.seconds,
+            "upsert": index.seconds,
+            "push_other": max(0.0, totals["push_seconds"] - embeddings.seconds - index.seconds),
+        },
+        "embedding_calls": embeddings.calls,
+        "upsert_calls": index.upserts,
+        "vectors_stored": index.describe_index_stats()["total_vector_count"],
+        "peak_rss_mb": peak_rss_mb(),
+        "settings": {
+            name: getattr(config_settings, name)
+            for name in (
+                "CHUNK_SIZE", "CHUNK_OVERLAP", "TEXT_SPLITTER_ENGINE", "PDF_PARSER_BACKEND", "EMBEDDING_DIMENSION",
+                "PDF_EXTRACTION_WORKERS", "DOCX_LOADER_MODE", "PINECONE_EMBEDDING_CHUNK_SIZE",
+                "PINECONE_UPSERT_BATCH_SIZE", "PINECONE_UPSERT_POOL_SIZE",
+            )
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--types", nargs="+", choices=FILE_TYPES, default=FILE_TYPES)
+    parser.add_argument("--files", type=int, default=8, help="Files per type")
+    parser.add_argument("--size", type=int, default=30, help="Pages per PDF, sections per DOCX, paragraphs/10 per TXT")
+    parser.add_argument("--dimension", type=int, default=1536, help="Dimension of the fake embeddings")
+    parser.add_argument("--embedding-latency-ms", type=float, default=0.0, help="Simulated latency per embedding call")
+    parser.add_argument("--upsert-latency-ms", type=float, default=0.0, help="Simulated latency per upsert")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        started = time.perf_counter()
+        corpus = build_corpus(Path(temp_dir), args.types, args.files, args.size)
+        corpus_seconds = time.perf_counter() - started
+
+        # A fresh process keeps corpus generation out of the peak RSS and the patches out of this one.
+        result = run_in_fresh_process(
+            run_benchmark, str(Path(temp_dir) / "state"), corpus, args.dimension, args.embedding_latency_ms, args.upsert_latency_ms
+        )
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "corpus": {
+            "types": args.types,
+            "files_per_type": args.files,
+            "size": args.size,
+            "generation_seconds": corpus_seconds,
+        },
+        "fakes": {
+            "dimension": args.dimension,
+            "embedding_latency_ms": args.embedding_latency_ms,
+            "upsert_latency_ms": args.upsert_latency_ms,
+        },
+        **result,
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compare PDF parser backends over a corpus of generated (or supplied) PDFs.
+
+Each backend runs in a fresh process, so the reported peak memory belongs to that
+backend alone.
+
+Usage:
+    python -m benchmarks.pdf_backends --files 20 --pages 50
+    python -m benchmarks.pdf_backends --corpus ./docs --backends pymupdf
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.corpus import write_text_pdf
+from benchmarks.harness import peak_rss_mb, run_in_fresh_process
+from domains.injestion.models import PDF_BACKENDS
+
+
+def run_backend(backend: str, file_paths: List[str], repeat: int) -> Dict[str, float]:
+    from domains.injestion.doc_loader import PDFLoaderExtended
+
+    timings = []
+    total_pages = total_characters = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        total_pages = total_characters = 0
+        for file_path in file_paths:
+            for page in PDFLoaderExtended(file_path, backend=backend).lazy_load():
+                total_pages += 1
+                total_characters += len(page.page_content)
+        timings.append(time.perf_counter() - started)
+
+    best = min(timings)
+    return {
+        "pages": total_pages,
+        "characters": total_characters,
+        "seconds": best,
+        "pages_per_second": total_pages / best,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def build_corpus(directory: Path, files: int, pages: int) -> List[str]:
+    # Vary the page count so the corpus mixes short and long documents.
+    return [
+        str(write_text_pdf(directory / f"document_{index:03d}.pdf", max(1, pages * (index % 4 + 1) // 2), seed=index))
+        for index in range(files)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="Directory of PDFs to benchmark; a synthetic corpus is generated otherwise")
+    parser.add_argument("--files", type=int, default=12, help="Files in the synthetic corpus")
+    parser.add_argument("--pages", type=int, default=40, help="Median pages per synthetic file")
+    parser.add_argument("--backends", nargs="+", choices=PDF_BACKENDS, default=PDF_BACKENDS)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if args.corpus:
+            file_paths = sorted(str(path) for path in Path(args.corpus).glob("*.pdf"))
+        else:
+            file_paths = build_corpus(Path(temp_dir), args.files, args.pages)
+        print(f"{len(file_paths)} files")
+
+        for backend in args.backends:
+            result = run_in_fresh_process(run_backend, backend, file_paths, args.repeat)
+            print(
+                f"{backend:<8} {result['pages']:6d} pages  best {result['seconds']:8.3f}s  "
+                f"{result['pages_per_second']:10.1f} pages/sec  peak {result['peak_rss_mb']:7.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Compare sequential and page-parallel PDF extraction throughput.
+
+Usage:
+    python -m benchmarks.pdf_extraction --pages 500 --workers 4
+    python -m benchmarks.pdf_extraction --file manual.pdf
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.corpus import write_text_pdf
+from domains.injestion.doc_loader import PDFLoaderExtended
+
+
+def measure(label: str, load, total_pages: int, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        documents = load()
+        timings.append(time.perf_counter() - started)
+        assert len(documents) == total_pages, f"{label} returned {len(documents)} pages"
+
+    best = min(timings)
+    pages_per_second = total_pages / best
+    print(f"{label:<12} best {best:8.3f}s  {pages_per_second:10.1f} pages/sec")
+    return pages_per_second
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--file", help="Existing PDF to benchmark; a synthetic one is generated otherwise")
+    parser.add_argument("--pages", type=int, default=400, help="Pages in the synthetic PDF")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = args.file or str(write_text_pdf(Path(temp_dir) / "synthetic.pdf", args.pages))
+
+        import pypdf
+        total_pages = len(pypdf.PdfReader(file_path).pages)
+        print(f"{file_path}: {total_pages} pages, {args.workers} workers")
+
+        sequential = measure(
+            "sequential", lambda: PDFLoaderExtended(file_path).load(), total_pages, args.repeat
+        )
+        parallel = measure(
+            "parallel",
+            lambda: PDFLoaderExtended(file_path).load_parallel(args.workers),
+            total_pages,
+            args.repeat,
+        )
+        print(f"speedup      {parallel / sequential:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Compare peak memory and time of splitting a large text file with TextLoader against the
+memory-mapped MappedTextLoader.
+
+Each loader runs in a fresh process, so the reported peak memory belongs to that loader
+alone. Chunks are counted and discarded as they are produced, as the injestion pipeline
+does.
+
+Usage:
+    python -m benchmarks.text_source --size-mb 256
+    python -m benchmarks.text_source --file ./export.log --loaders mapped
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+from benchmarks.corpus import generate_paragraphs
+from benchmarks.harness import peak_rss_mb, run_in_fresh_process
+
+LOADERS = ["text", "mapped"]
+
+
+def run_loader(loader: str, file_path: str) -> Dict[str, float]:
+    from langchain_community.document_loaders import TextLoader
+
+    from domains.injestion.text_source import MappedTextLoader
+    from domains.injestion.utils import split_documents_lazily
+    from domains.settings import config_settings
+
+    baseline_mb = peak_rss_mb()
+    documents = TextLoader(file_path).lazy_load() if loader == "text" else MappedTextLoader(file_path).lazy_load()
+
+    started = time.perf_counter()
+    total_chunks = 0
+    for _ in split_documents_lazily(documents, config_settings.CHUNK_SIZE, config_settings.CHUNK_OVERLAP):
+        total_chunks += 1
+
+    return {
+        "chunks": total_chunks,
+        "seconds": time.perf_counter() - started,
+        "peak_rss_mb": peak_rss_mb(),
+        "baseline_rss_mb": baseline_mb,
+    }
+
+
+def write_text_file(file_path: Path, size_mb: int) -> Path:
+    paragraphs = "\n\n".join(generate_paragraphs(2000)) + "\n\n"
+    block = paragraphs.encode("utf-8")
+    with open(file_path, "wb") as file:
+        for _ in range(size_mb * 1024 * 1024 // len(block) + 1):
+            file.write(block)
+    return file_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--file", help="Text file to benchmark; a synthetic file is generated otherwise")
+    parser.add_argument("--size-mb", type=int, default=128, help="Size of the synthetic file")
+    parser.add_argument("--loaders", nargs="+", choices=LOADERS, default=LOADERS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(args.file) if args.file else write_text_file(Path(temp_dir) / "large.txt", args.size_mb)
+        print(f"{file_path.stat().st_size / (1024 * 1024):.1f} MB")
+
+        for loader in args.loaders:
+            result = run_in_fresh_process(run_loader, loader, str(file_path))
+            print(
+                f"{loader:<8} {result['chunks']:9d} chunks  {result['seconds']:8.2f}s  "
+                f"peak {result['peak_rss_mb']:8.1f} MB (after imports {result['baseline_rss_mb']:7.1f} MB)"
+            )
+
+
+if __name__ == "__main__":
+    main()
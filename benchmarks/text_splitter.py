@@ -0,0 +1,107 @@
+"""
+Compare FastTextSplitter with RecursiveCharacterTextSplitter.
+
+Checks that both produce identical chunks, first on randomized texts built to hit the
+recursion and overlap edge cases, then on the benchmark text, and reports MB/sec for
+each engine.
+
+Usage:
+    python -m benchmarks.text_splitter --megabytes 8
+    python -m benchmarks.text_splitter --file big.txt --chunk-size 500 --chunk-overlap 50
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from benchmarks.corpus import generate_paragraphs
+from domains.injestion.splitter import FastTextSplitter
+
+FRAGMENTS = ["a", "bb", "word", "x" * 40, " ", "  ", "\t", "\n", "\n\n", "\n\n\n"]
+
+
+def check_equivalence(cases: int, seed: int = 0) -> int:
+    """Split random texts with both engines and return the number of mismatches."""
+    rng = random.Random(seed)
+    mismatches = 0
+    for _ in range(cases):
+        text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 500)))
+        chunk_size = rng.randint(1, 80)
+        chunk_overlap = rng.randint(0, chunk_size)
+
+        expected = RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap).split_text(text)
+        actual = FastTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap).split_text(text)
+        if actual != expected:
+            mismatches += 1
+            if mismatches <= 3:
+                print(f"mismatch: chunk_size={chunk_size} chunk_overlap={chunk_overlap} text={text[:60]!r}")
+    return mismatches
+
+
+def build_text(megabytes: float) -> str:
+    total_paragraphs = max(1, int(megabytes * 1024 * 1024 / 1200))
+    short_paragraphs = generate_paragraphs(total_paragraphs, words_per_paragraph=80)
+    long_paragraphs = iter(generate_paragraphs(total_paragraphs // 8 + 1, words_per_paragraph=1000, seed=1))
+    # Mix paragraph breaks, single newlines and paragraphs longer than a chunk so every
+    # separator level is used.
+    parts = []
+    for index, paragraph in enumerate(short_paragraphs):
+        parts.append(paragraph + ("\n\n" if index % 3 == 0 else "\n"))
+        if index % 8 == 0:
+            parts.append(next(long_paragraphs) + "\n\n")
+    return "".join(parts)
+
+
+def measure(label: str, splitter, text: str, repeat: int) -> list:
+    timings = []
+    chunks = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        chunks = splitter.split_text(text)
+        timings.append(time.perf_counter() - started)
+
+    best = min(timings)
+    print(f"{label:<10} {len(chunks):8d} chunks  best {best:8.3f}s  {len(text) / best / 1024 / 1024:8.2f} MB/sec")
+    return chunks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--file", help="Text file to benchmark; a synthetic text is generated otherwise")
+    parser.add_argument("--megabytes", type=float, default=4, help="Size of the synthetic text")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--chunk-overlap", type=int, default=200)
+    parser.add_argument("--cases", type=int, default=2000, help="Randomized equivalence cases")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    mismatches = check_equivalence(args.cases)
+    print(f"equivalence: {args.cases - mismatches}/{args.cases} randomized cases identical")
+
+    text = Path(args.file).read_text(encoding="utf-8") if args.file else build_text(args.megabytes)
+    print(f"{len(text) / 1024 / 1024:.2f} MB, chunk_size={args.chunk_size}, chunk_overlap={args.chunk_overlap}")
+
+    recursive = measure(
+        "recursive",
+        RecursiveCharacterTextSplitter(chunk_size=args.chunk_size, chunk_overlap=args.chunk_overlap),
+        text,
+        args.repeat,
+    )
+    fast = measure(
+        "fast",
+        FastTextSplitter(chunk_size=args.chunk_size, chunk_overlap=args.chunk_overlap),
+        text,
+        args.repeat,
+    )
+
+    identical = fast == recursive
+    print(f"benchmark text chunks identical: {identical}")
+    if mismatches or not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
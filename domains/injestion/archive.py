@@ -0,0 +1,77 @@
+import os
+import tarfile
+import zipfile
+from pathlib import Path
+from typing import List
+
+from loguru import logger
+
+from domains.injestion.models import FILE_TYPE
+from domains.settings import config_settings
+
+
+def _is_supported_member(name: str) -> bool:
+    base_name = os.path.basename(name)
+    return (
+        not base_name.startswith(".")
+        and base_name.rsplit(".", 1)[-1].lower() in FILE_TYPE
+    )
+
+
+def _safe_target(destination: Path, member_name: str) -> Path:
+    """Resolve an archive member path, rejecting members that escape the destination."""
+    target = (destination / member_name).resolve()
+    if not target.is_relative_to(destination.resolve()):
+        raise ValueError(f"Archive member {member_name} escapes the extraction directory")
+    return target
+
+
+def extract_archive(
+        archive_path: str | Path,
+        destination: str | Path,
+        max_total_bytes: int = config_settings.BULK_INJESTION_MAX_ARCHIVE_BYTES,
+) -> List[Path]:
+    """
+    Extract the supported documents (pdf, txt, docx) of a zip or tar archive.
+
+    Returns the extracted file paths. Other members are skipped, and archives whose
+    supported members exceed ``max_total_bytes`` once uncompressed are rejected.
+    """
+    archive_path = Path(archive_path)
+    destination = Path(destination)
+    destination.mkdir(parents=True, exist_ok=True)
+    extracted: List[Path] = []
+
+    if zipfile.is_zipfile(archive_path):
+        with zipfile.ZipFile(archive_path) as archive:
+            members = [m for m in archive.infolist() if not m.is_dir() and _is_supported_member(m.filename)]
+            if sum(m.file_size for m in members) > max_total_bytes:
+                raise ValueError(f"Archive {archive_path.name} exceeds {max_total_bytes} bytes uncompressed")
+
+            for member in members:
+                target = _safe_target(destination, member.filename)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with archive.open(member) as source, open(target, "wb") as sink:
+                    while block := source.read(1024 * 1024):
+                        sink.write(block)
+                extracted.append(target)
+
+    elif tarfile.is_tarfile(archive_path):
+        with tarfile.open(archive_path) as archive:
+            members = [m for m in archive.getmembers() if m.isfile() and _is_supported_member(m.name)]
+            if sum(m.size for m in members) > max_total_bytes:
+                raise ValueError(f"Archive {archive_path.name} exceeds {max_total_bytes} bytes uncompressed")
+
+            for member in members:
+                target = _safe_target(destination, member.name)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with archive.extractfile(member) as source, open(target, "wb") as sink:
+                    while block := source.read(1024 * 1024):
+                        sink.write(block)
+                extracted.append(target)
+
+    else:
+        raise ValueError(f"{archive_path.name} is not a zip or tar archive")
+
+    logger.info(f"Extracted {len(extracted)} documents from {archive_path.name}")
+    return extracted
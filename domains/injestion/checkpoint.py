@@ -0,0 +1,88 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from domains.settings import config_settings
+from domains.sqlite_store import SQLiteStore
+
+
+def compute_file_hash(file_path: str, block_size: int = 1024 * 1024) -> str:
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        while block := file.read(block_size):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+@dataclass
+class InjestionCheckpoint:
+    checkpoint_key: str
+    last_batch: int
+    document_ids: List[str] = field(default_factory=list)
+
+
+class InjestionCheckpointStore(SQLiteStore):
+    """
+    Local record of the batches of a file that are already in the vector store.
+
+    Callers build the checkpoint key from the target namespace, the file name, the file
+    content hash and everything that decides how the file is cut into batches, so a
+    resubmitted request only resumes when it would produce exactly the same batches.
+    """
+
+    schema = (
+        """
+        CREATE TABLE IF NOT EXISTS checkpoint_batches (
+            checkpoint_key TEXT NOT NULL,
+            batch_index INTEGER NOT NULL,
+            document_ids TEXT NOT NULL,
+            committed_at TEXT NOT NULL,
+            PRIMARY KEY (checkpoint_key, batch_index)
+        )
+        """,
+    )
+
+    def __init__(self, db_path: str = config_settings.INJESTION_CHECKPOINT_PATH) -> None:
+        super().__init__(db_path)
+
+    @staticmethod
+    def make_key(*parts: object) -> str:
+        return hashlib.sha256("\0".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+    def get(self, checkpoint_key: str) -> Optional[InjestionCheckpoint]:
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT batch_index, document_ids FROM checkpoint_batches "
+                "WHERE checkpoint_key = ? ORDER BY batch_index",
+                (checkpoint_key,),
+            ).fetchall()
+
+        # Batches are committed in order, so only a gap-free prefix can be resumed from.
+        last_batch = -1
+        document_ids: List[str] = []
+        for batch_index, batch_ids in rows:
+            if batch_index != last_batch + 1:
+                break
+            last_batch = batch_index
+            document_ids.extend(json.loads(batch_ids))
+
+        if last_batch < 0:
+            return None
+        return InjestionCheckpoint(checkpoint_key, last_batch, document_ids)
+
+    def commit_batch(self, checkpoint_key: str, batch_index: int, document_ids: List[str]) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO checkpoint_batches "
+                "(checkpoint_key, batch_index, document_ids, committed_at) VALUES (?, ?, ?, ?)",
+                (checkpoint_key, batch_index, json.dumps(document_ids), datetime.now().isoformat()),
+            )
+
+    def clear(self, checkpoint_key: str) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM checkpoint_batches WHERE checkpoint_key = ?", (checkpoint_key,))
+
+
+checkpoint_store = InjestionCheckpointStore()
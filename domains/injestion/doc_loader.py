@@ -19,14 +19,23 @@ from langchain_core.document_loaders import BaseLoader
 from langchain_core.documents import Document
 from domains.settings import config_settings
 
-from domains.injestion.models import FILE_TYPE
-
-from typing import Any, Callable, IO, Dict, Iterator, get_args, Tuple, Callable
-
+from domains.injestion.downloader import url_downloader
+from domains.injestion.docx_loader import DocxFastLoader
+from domains.injestion.text_source import MappedTextLoader
+from domains.injestion.models import DOCX_MODES, FILE_TYPE, PDF_BACKENDS
+from domains.pdf_pages import PDF_PAGE_ITERATORS, count_pdf_pages, extract_pdf_page_range
+
+from typing import Any, Callable, IO, Dict, Iterator, get_args, Tuple, Callable, Optional
+
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
 from urllib.parse import urlparse
 from tempfile import NamedTemporaryFile
 from os import remove
-from domains.injestion.utils import split_text
+from domains.injestion.utils import split_text, split_documents_lazily
 
 
 class URLDownloaderMixin:
@@ -37,12 +46,12 @@ class URLDownloaderMixin:
 
     def __init__(self, file_path=None, *args: Any, **kwargs: Any) -> None:
         self._temp_file: IO[bytes] | None = None
-        self.file_path = Path(str(file_path))
+        self.web_path = None
+        self.file_path = str(file_path)
         if isinstance(self, PyMuPDFLoader):
             if file_path is None:
                 raise TypeError("string argument file_path is needed for pdf loader")
             self.file_path = file_path
-            self.web_path = None
             self.headers = kwargs.pop("headers", None)
             self.extract_images = kwargs.pop("extract_images", True)
             self.text_kwargs = kwargs
@@ -55,35 +64,65 @@ class URLDownloaderMixin:
 
         if self._is_valid_url(self.file_path):
             self.web_path = self.file_path
-            self._temp_file = NamedTemporaryFile(delete=False)
+            self._temp_file = NamedTemporaryFile(delete=False, suffix=Path(urlparse(self.web_path).path).suffix)
+            self._temp_file.close()
             self.file_path = self._temp_file.name
+            url_downloader.download(self.web_path, destination=self.file_path)
             return
 
         raise ValueError(f"File path {self.file_path} is not a valid file or url")
 
     def __del__(self) -> None:
         if self._temp_file:
-            self._temp_file.close()
-            remove(self._temp_file.name)
+            Path(self._temp_file.name).unlink(missing_ok=True)
+
+
+def _split_page_range(total_pages: int, parts: int, min_pages_per_part: int = 8) -> List[Tuple[int, int]]:
+    """Split [0, total_pages) into at most ``parts`` contiguous, ordered ranges."""
+    parts = max(1, min(parts, total_pages // min_pages_per_part or 1))
+    size, remainder = divmod(total_pages, parts)
+
+    ranges = []
+    start = 0
+    for index in range(parts):
+        stop = start + size + (1 if index < remainder else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
 
 
 class PDFLoaderExtended(PyPDFLoader):
-    """Extended PDF loader with additional functionality."""
+    """
+    Extended PDF loader with additional functionality.
+
+    ``backend`` selects the parser, "pypdf" or "pymupdf"; both produce the same metadata
+    keys, so chunks from either backend are interchangeable downstream.
+    """
 
     def __init__(
             self,
             file_path: str,
             extract_images: bool = False,
+            backend: Optional[str] = None,
             **kwargs: Any
     ) -> None:
         # Convert Path to string if needed
         self.file_path = str(file_path) if hasattr(file_path, '__fspath__') else file_path
         super().__init__(self.file_path)
         self.extract_images = extract_images
+        self.backend = backend or config_settings.PDF_PARSER_BACKEND
+        if self.backend not in PDF_BACKENDS:
+            raise ValueError(f"Invalid PDF backend: {self.backend}. Supported backends are: {', '.join(PDF_BACKENDS)}")
+
+    def lazy_load(self) -> Iterator[Document]:
+        if self.backend == "pypdf":
+            yield from super().lazy_load()
+        else:
+            yield from PDF_PAGE_ITERATORS[self.backend](self.file_path, 0, None)
 
     def load(self) -> List[Document]:
         try:
-            documents = super().load()
+            documents = list(self.lazy_load())
             if not documents:
                 raise ValueError("No documents loaded from PDF")
             return documents
@@ -91,24 +130,54 @@ class PDFLoaderExtended(PyPDFLoader):
             logger.error(f"Error loading PDF {self.file_path}: {str(e)}")
             raise
 
+    def load_parallel(self, max_workers: int = config_settings.PDF_EXTRACTION_WORKERS) -> List[Document]:
+        documents = list(self.lazy_load_parallel(max_workers))
+        if not documents:
+            raise ValueError("No documents loaded from PDF")
+        return documents
 
-# class PDFLoaderExtended(PyMuPDFLoader):
-#     """Extended PDF loader with additional functionality."""
-#
-#     def __init__(self, file_path: str, extract_images: bool = False):
-#         super().__init__(file_path)
-#         self.extract_images = extract_images
-#         self.parser = PDFMinerParser()  # Add the parser attribute
-#
-#     def load(self):
-#         try:
-#             documents = super().load()
-#             if not documents:
-#                 raise ValueError("No documents loaded from PDF")
-#             return documents
-#         except Exception as e:
-#             logger.error(f"Error loading PDF: {e}")
-#             raise
+    def lazy_load_parallel(self, max_workers: int = config_settings.PDF_EXTRACTION_WORKERS) -> Iterator[Document]:
+        """
+        Extract pages across a process pool and yield them in page order.
+
+        Falls back to the sequential loader for small documents, where starting the
+        pool costs more than it saves.
+        """
+        try:
+            total_pages = count_pdf_pages(self.file_path, self.backend)
+            if max_workers <= 1 or total_pages < config_settings.PDF_PARALLEL_MIN_PAGES:
+                yield from self.lazy_load()
+                return
+
+            page_ranges = _split_page_range(total_pages, max_workers * 4)
+            workers = min(max_workers, len(page_ranges))
+
+            # Spawned rather than forked: the parent may hold threads (HTTP pools, the
+            # embeddings scheduler) whose locks a forked child would inherit mid-use.
+            with ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                def submit(page_range: Tuple[int, int]) -> Future:
+                    return executor.submit(extract_pdf_page_range, str(self.file_path), *page_range, self.backend)
+
+                # Keep two ranges per worker in flight, so extracted pages never pile up far
+                # ahead of a slow consumer.
+                pending_ranges = iter(page_ranges)
+                in_flight: deque[Future] = deque(submit(page_range) for page_range in islice(pending_ranges, workers * 2))
+                while in_flight:
+                    page_documents = in_flight.popleft().result()
+                    next_range = next(pending_ranges, None)
+                    if next_range is not None:
+                        in_flight.append(submit(next_range))
+                    yield from page_documents
+
+            logger.info(
+                f"Extracted {total_pages} pages from {self.file_path} with {self.backend} "
+                f"using {workers} processes"
+            )
+        except Exception as e:
+            logger.error(f"Error loading PDF {self.file_path} in parallel: {str(e)}")
+            raise
 
 
 class DocLoaderExtended(URLDownloaderMixin, UnstructuredWordDocumentLoader):
@@ -135,10 +204,20 @@ class DocLoaderExtended(URLDownloaderMixin, UnstructuredWordDocumentLoader):
 
 
 class FileLoader(BaseLoader):
-    def __init__(self, file_path: str, process_type: str = "txt"):
+    def __init__(
+            self,
+            file_path: str,
+            process_type: str = "txt",
+            pdf_backend: Optional[str] = None,
+            docx_mode: Optional[str] = None,
+    ):
         self.file_path = str(file_path) if hasattr(file_path, '__fspath__') else file_path
         self.process_type = process_type
+        self.pdf_backend = pdf_backend
+        self.docx_mode = docx_mode or config_settings.DOCX_LOADER_MODE
         self._validate_process_type()
+        if self.docx_mode not in DOCX_MODES:
+            raise ValueError(f"Invalid docx mode: {self.docx_mode}. Supported modes are: {', '.join(DOCX_MODES)}")
 
     def _validate_process_type(self) -> None:
         valid_types = FILE_TYPE
@@ -149,26 +228,38 @@ class FileLoader(BaseLoader):
         if not os.path.isfile(self.file_path):
             raise FileNotFoundError(f"File not found: {self.file_path}")
 
+    def _text_loader(self) -> BaseLoader:
+        # TextLoader holds the whole file as one string; large files are streamed instead.
+        if os.path.getsize(self.file_path) >= config_settings.TXT_STREAM_MIN_BYTES:
+            return MappedTextLoader(self.file_path)
+        return TextLoader(file_path=self.file_path)
+
+    def _docx_loader(self) -> BaseLoader:
+        # unstructured is only imported when the accurate loader actually partitions a file.
+        if self.docx_mode == "accurate":
+            return DocLoaderExtended(file_path=self.file_path, extract_images=False)
+        return DocxFastLoader(self.file_path)
+
     def load(self) -> list[Document] | str:
         try:
             logger.info(f"{self.__class__.__name__}.load(): Attempting to load file from {self.file_path}")
             self._validate_file_path()
 
             if self.process_type == "txt":
-                text_loader = TextLoader(file_path=self.file_path)
-                file_contents = text_loader.load()
+                file_contents = self._text_loader().load()
                 logger.info(f"Successfully loaded file from {self.file_path} and total pages in file is {len(file_contents)}")
                 return file_contents
 
             elif self.process_type == "pdf":
-                pdf_loader = PDFLoaderExtended(file_path=self.file_path, extract_images=False)
-                file_contents = pdf_loader.load()
+                pdf_loader = PDFLoaderExtended(
+                    file_path=self.file_path, extract_images=False, backend=self.pdf_backend
+                )
+                file_contents = pdf_loader.load_parallel(config_settings.PDF_EXTRACTION_WORKERS)
                 logger.info(f"Successfully loaded file from {self.file_path} and total pages in file is {len(file_contents)}")
                 return file_contents
 
             elif self.process_type == "docx":
-                doc_loader = DocLoaderExtended(file_path=self.file_path, extract_images=False)
-                file_contents = doc_loader.load()
+                file_contents = self._docx_loader().load()
                 logger.info(f"Successfully loaded file from {self.file_path} and total pages in file is {len(file_contents)}")
                 return file_contents
 
@@ -186,6 +277,26 @@ class FileLoader(BaseLoader):
             logger.error(f"{self.__class__.__name__}.load(): Unexpected error - {e}")
             return "Error: An unexpected error occurred while loading the file."
 
+    def lazy_load(self) -> Iterator[Document]:
+        """Yield pages one at a time; unlike load(), errors are raised to the caller."""
+        logger.info(f"{self.__class__.__name__}.lazy_load(): Attempting to load file from {self.file_path}")
+        self._validate_file_path()
+
+        if self.process_type == "txt":
+            yield from self._text_loader().lazy_load()
+
+        elif self.process_type == "pdf":
+            pdf_loader = PDFLoaderExtended(
+                file_path=self.file_path, extract_images=False, backend=self.pdf_backend
+            )
+            yield from pdf_loader.lazy_load_parallel(config_settings.PDF_EXTRACTION_WORKERS)
+
+        elif self.process_type == "docx":
+            yield from self._docx_loader().lazy_load()
+
+        else:
+            raise ValueError(f"Unsupported process type: {self.process_type}")
+
 
 def file_loader(
     pre_signed_url: str,
@@ -194,6 +305,8 @@ def file_loader(
     file_type: str,
     process_type: str,
     metadata: list[dict[str, str]] = [{}],
+    pdf_backend: Optional[str] = None,
+    docx_mode: Optional[str] = None,
 ) -> Tuple[list[Document], Any]:
 
     if file_type not in FILE_TYPE:
@@ -201,8 +314,8 @@ def file_loader(
 
     loaders: dict[str, Callable[[], BaseLoader]] = {
         "txt": lambda: FileLoader(pre_signed_url, process_type="txt"),
-        "pdf": lambda: FileLoader(pre_signed_url, process_type="pdf"),
-        "docx": lambda: FileLoader(pre_signed_url, process_type="docx"),
+        "pdf": lambda: FileLoader(pre_signed_url, process_type="pdf", pdf_backend=pdf_backend),
+        "docx": lambda: FileLoader(pre_signed_url, process_type="docx", docx_mode=docx_mode),
     }
 
     if (loader := loaders.get(process_type)) is None:
@@ -219,6 +332,80 @@ def file_loader(
 
     logger.info(f"Total number of document chunks {len(parsed_documents)}")
 
+    additional_metadata = _build_additional_metadata(
+        file_name, original_file_name, file_type, process_type, metadata
+    )
+
+    for document in parsed_documents:
+        document.metadata |= additional_metadata | {
+            "title": document.metadata.get("title") or original_file_name
+        }
+
+    return parsed_documents, loaded_documents
+
+
+@dataclass
+class LoadStats:
+    """Counters filled in by lazy_file_loader while its chunks are consumed."""
+    total_pages: int = 0
+    total_chunks: int = 0
+
+
+def lazy_file_loader(
+    pre_signed_url: str,
+    file_name: str,
+    original_file_name: str,
+    file_type: str,
+    process_type: str,
+    metadata: list[dict[str, str]] = [{}],
+    stats: Optional[LoadStats] = None,
+    pdf_backend: Optional[str] = None,
+    docx_mode: Optional[str] = None,
+) -> Iterator[Document]:
+    """
+    Streaming counterpart of file_loader: yields chunks as pages are parsed and split,
+    so neither the pages nor the chunks of a file are ever held in memory at once.
+    """
+    if file_type not in FILE_TYPE:
+        raise Exception(f"{file_type} is not a supported file type")
+
+    if process_type not in FILE_TYPE:
+        raise FileNotFoundError("Unsupported process_type")
+
+    stats = stats if stats is not None else LoadStats()
+    additional_metadata = _build_additional_metadata(
+        file_name, original_file_name, file_type, process_type, metadata
+    )
+
+    def counted_pages() -> Iterator[Document]:
+        loader = FileLoader(pre_signed_url, process_type=process_type, pdf_backend=pdf_backend, docx_mode=docx_mode)
+        for page in loader.lazy_load():
+            stats.total_pages += 1
+            yield page
+
+    for document in split_documents_lazily(
+        documents=counted_pages(),
+        CHUNK_SIZE=config_settings.CHUNK_SIZE,
+        CHUNK_OVERLAP=config_settings.CHUNK_OVERLAP,
+    ):
+        stats.total_chunks += 1
+        document.metadata |= additional_metadata | {
+            "title": document.metadata.get("title") or original_file_name
+        }
+        yield document
+
+    logger.info(
+        f"Streamed {stats.total_pages} pages and {stats.total_chunks} chunks from {pre_signed_url}"
+    )
+
+
+def _build_additional_metadata(
+    file_name: str,
+    original_file_name: str,
+    file_type: str,
+    process_type: str,
+    metadata: list[dict[str, str]],
+) -> dict[str, str]:
     additional_metadata = {
         "original_file_name": original_file_name,
         "file_name": file_name,
@@ -230,12 +417,7 @@ def file_loader(
         for i in metadata:
             additional_metadata.update(i)
 
-    for document in parsed_documents:
-        document.metadata |= additional_metadata | {
-            "title": document.metadata.get("title") or original_file_name
-        }
-
-    return parsed_documents, loaded_documents
+    return additional_metadata
 
 
 if __name__ == "__main__":
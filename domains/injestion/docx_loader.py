@@ -0,0 +1,137 @@
+import re
+import zipfile
+from typing import Dict, Iterator, List, Optional, Tuple
+from xml.etree import ElementTree
+
+from langchain_core.document_loaders import BaseLoader
+from langchain_core.documents import Document
+
+WORD_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_W = f"{{{WORD_NAMESPACE}}}"
+_DC_TITLE = "{http://purl.org/dc/elements/1.1/}title"
+
+_HEADING_STYLE = re.compile(r"^heading\s*(\d)$")
+
+
+def _read_heading_levels(archive: zipfile.ZipFile) -> Dict[str, int]:
+    """Map paragraph style ids to heading levels; "Title" counts as level 0."""
+    if "word/styles.xml" not in archive.namelist():
+        return {}
+
+    levels: Dict[str, int] = {}
+    root = ElementTree.fromstring(archive.read("word/styles.xml"))
+    for style in root.iter(f"{_W}style"):
+        name_element = style.find(f"{_W}name")
+        if name_element is None:
+            continue
+        name = name_element.get(f"{_W}val", "").strip().lower()
+        style_id = style.get(f"{_W}styleId", "")
+        if name == "title":
+            levels[style_id] = 0
+        elif match := _HEADING_STYLE.match(name):
+            levels[style_id] = int(match.group(1))
+    return levels
+
+
+def _read_title(archive: zipfile.ZipFile) -> Optional[str]:
+    if "docProps/core.xml" not in archive.namelist():
+        return None
+    title = ElementTree.fromstring(archive.read("docProps/core.xml")).find(_DC_TITLE)
+    return title.text.strip() if title is not None and title.text and title.text.strip() else None
+
+
+def _paragraph_text(paragraph: ElementTree.Element) -> str:
+    parts = []
+    for element in paragraph.iter():
+        if element.tag == f"{_W}t":
+            parts.append(element.text or "")
+        elif element.tag == f"{_W}tab":
+            parts.append("\t")
+        elif element.tag in (f"{_W}br", f"{_W}cr"):
+            parts.append("\n")
+    return "".join(parts).strip()
+
+
+def _paragraph_style(paragraph: ElementTree.Element) -> str:
+    style = paragraph.find(f"{_W}pPr/{_W}pStyle")
+    return style.get(f"{_W}val", "") if style is not None else ""
+
+
+def _table_text(table: ElementTree.Element) -> str:
+    rows = []
+    for row in table.iter(f"{_W}tr"):
+        cells = [
+            " ".join(text for paragraph in cell.iter(f"{_W}p") if (text := _paragraph_text(paragraph)))
+            for cell in row.iter(f"{_W}tc")
+        ]
+        if any(cells):
+            rows.append(" | ".join(cells))
+    return "\n".join(rows)
+
+
+def _body_blocks(container: ElementTree.Element) -> Iterator[Tuple[str, ElementTree.Element]]:
+    """Yield the top-level paragraphs and tables in document order, unwrapping content controls."""
+    for child in container:
+        if child.tag == f"{_W}p":
+            yield "paragraph", child
+        elif child.tag == f"{_W}tbl":
+            yield "table", child
+        elif child.tag == f"{_W}sdt":
+            content = child.find(f"{_W}sdtContent")
+            if content is not None:
+                yield from _body_blocks(content)
+
+
+class DocxFastLoader(BaseLoader):
+    """
+    DOCX loader that reads ``word/document.xml`` straight from the zip archive.
+
+    Yields one document per section, a section being a heading and everything up to the
+    next heading. Paragraphs are separated by blank lines, table rows become lines of
+    " | "-separated cells, and the section heading and its level are kept in metadata.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path = str(file_path)
+
+    def lazy_load(self) -> Iterator[Document]:
+        with zipfile.ZipFile(self.file_path) as archive:
+            heading_levels = _read_heading_levels(archive)
+            title = _read_title(archive)
+            body = ElementTree.fromstring(archive.read("word/document.xml")).find(f"{_W}body")
+
+        base_metadata = {"source": self.file_path} | ({"title": title} if title else {})
+        section_index = 0
+        heading, heading_level = "", None
+        blocks: List[str] = []
+
+        def build_section() -> Document:
+            return Document(
+                page_content="\n\n".join(blocks),
+                metadata=base_metadata | {
+                    "section": heading,
+                    "heading_level": heading_level if heading_level is not None else -1,
+                    "section_index": section_index,
+                },
+            )
+
+        for kind, element in _body_blocks(body if body is not None else []):
+            if kind == "table":
+                if text := _table_text(element):
+                    blocks.append(text)
+                continue
+
+            text = _paragraph_text(element)
+            if not text:
+                continue
+
+            level = heading_levels.get(_paragraph_style(element))
+            if level is not None:
+                if blocks:
+                    yield build_section()
+                    section_index += 1
+                heading, heading_level, blocks = text, level, []
+            blocks.append(text)
+
+        if blocks:
+            yield build_section()
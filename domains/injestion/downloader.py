@@ -0,0 +1,190 @@
+import asyncio
+import os
+import re
+import threading
+import time
+import uuid
+import weakref
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+from loguru import logger
+
+from domains.settings import config_settings
+
+
+class IncompleteDownloadError(Exception):
+    """Raised when a response ends before the advertised number of bytes arrived."""
+    pass
+
+
+class RangeMismatchError(IncompleteDownloadError):
+    """Raised when a partial response does not continue where the partial file ends."""
+    pass
+
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-\d+/(\d+|\*)")
+
+
+def is_url(value: str) -> bool:
+    parsed = urlparse(value)
+    return parsed.scheme in ("http", "https") and bool(parsed.netloc)
+
+
+class URLDownloader:
+    """
+    Streams pre-signed URLs to local files through pooled HTTP connections.
+
+    Bodies are written in ``chunk_size`` blocks to a ``.part`` file that is renamed once
+    complete. When a transfer breaks, the next attempt asks for the remaining bytes with
+    a Range header and appends them, falling back to a full download if the server
+    ignores the range or answers with one that does not start where the file ends.
+
+    The sync client is shared by all threads. httpx async clients are bound to the event
+    loop that created them, so one async client is kept per running loop.
+    """
+
+    def __init__(
+            self,
+            download_folder: str = config_settings.DOWNLOAD_FOLDER,
+            chunk_size: int = config_settings.DOWNLOAD_CHUNK_SIZE,
+            max_connections: int = config_settings.DOWNLOAD_MAX_CONNECTIONS,
+            timeout: float = config_settings.DOWNLOAD_TIMEOUT,
+            max_retries: int = config_settings.DOWNLOAD_MAX_RETRIES,
+    ) -> None:
+        self.download_folder = download_folder
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        self._timeout = httpx.Timeout(timeout, connect=min(timeout, 10.0))
+        self._client: Optional[httpx.Client] = None
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _get_client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(limits=self._limits, timeout=self._timeout, follow_redirects=True)
+            return self._client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if loop not in self._async_clients:
+                self._async_clients[loop] = httpx.AsyncClient(
+                    limits=self._limits, timeout=self._timeout, follow_redirects=True
+                )
+            return self._async_clients[loop]
+
+    def _destination_for(self, url: str, suffix: Optional[str]) -> Path:
+        os.makedirs(self.download_folder, exist_ok=True)
+        suffix = suffix if suffix is not None else Path(urlparse(url).path).suffix
+        return Path(self.download_folder) / f"{uuid.uuid4().hex}{suffix}"
+
+    @staticmethod
+    def _resume_offset(part_path: Path) -> int:
+        return part_path.stat().st_size if part_path.exists() else 0
+
+    @staticmethod
+    def _range_headers(offset: int) -> Dict[str, str]:
+        return {"Range": f"bytes={offset}-"} if offset else {}
+
+    @staticmethod
+    def _prepare_write(response: httpx.Response, offset: int) -> Tuple[str, Optional[int]]:
+        """Return the file mode for this response and the expected size of the complete file."""
+        if response.status_code == 206:
+            match = _CONTENT_RANGE.match(response.headers.get("content-range", ""))
+            if match is None or int(match.group(1)) != offset:
+                raise RangeMismatchError(
+                    f"Asked for bytes from {offset}, got range {response.headers.get('content-range')!r}"
+                )
+            return "ab", int(match.group(2)) if match.group(2) != "*" else None
+
+        response.raise_for_status()
+        # A 200 to a Range request means the server sent the whole body again.
+        content_length = response.headers.get("content-length")
+        return "wb", int(content_length) if content_length else None
+
+    def _retry_delay(self, error: Exception, attempt: int, part_path: Path) -> float:
+        """Seconds to wait before the next attempt; re-raises ``error`` when it should not be retried."""
+        retryable = isinstance(error, (httpx.TransportError, IncompleteDownloadError)) or (
+            isinstance(error, httpx.HTTPStatusError)
+            and (error.response.status_code in (416, 429) or error.response.status_code >= 500)
+        )
+        if attempt == self.max_retries or not retryable:
+            part_path.unlink(missing_ok=True)
+            raise error
+
+        # 416 and a misplaced range both mean the partial file cannot be continued, so the
+        # next attempt downloads the whole file again.
+        if isinstance(error, RangeMismatchError) or (
+                isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 416
+        ):
+            part_path.unlink(missing_ok=True)
+            logger.warning(f"Download attempt {attempt + 1} cannot be resumed, restarting: {error}")
+            return 0.0
+
+        logger.warning(f"Download attempt {attempt + 1} failed, resuming: {error}")
+        return min(2 ** attempt, 10)
+
+    @staticmethod
+    def _finish(part_path: Path, destination: Path, expected_size: Optional[int]) -> Path:
+        size = part_path.stat().st_size
+        if expected_size is not None and size != expected_size:
+            raise IncompleteDownloadError(f"Received {size} of {expected_size} bytes")
+        os.replace(part_path, destination)
+        return destination
+
+    def download(self, url: str, destination: Optional[str | Path] = None, suffix: Optional[str] = None) -> Path:
+        """Download ``url`` to ``destination`` (a new file in the download folder by default)."""
+        destination = Path(destination) if destination else self._destination_for(url, suffix)
+        part_path = destination.with_name(f"{destination.name}.part")
+        client = self._get_client()
+        started = time.perf_counter()
+
+        for attempt in range(self.max_retries + 1):
+            offset = self._resume_offset(part_path)
+            try:
+                with client.stream("GET", url, headers=self._range_headers(offset)) as response:
+                    mode, expected_size = self._prepare_write(response, offset)
+                    with open(part_path, mode) as file:
+                        for block in response.iter_bytes(self.chunk_size):
+                            file.write(block)
+                path = self._finish(part_path, destination, expected_size)
+                logger.info(f"Downloaded {path.stat().st_size} bytes to {path} in {time.perf_counter() - started:.2f}s")
+                return path
+            except Exception as e:
+                time.sleep(self._retry_delay(e, attempt, part_path))
+
+    async def adownload(
+            self, url: str, destination: Optional[str | Path] = None, suffix: Optional[str] = None
+    ) -> Path:
+        """Async counterpart of download; file writes run in a thread to keep the loop free."""
+        destination = Path(destination) if destination else self._destination_for(url, suffix)
+        part_path = destination.with_name(f"{destination.name}.part")
+        client = self._get_async_client()
+        started = time.perf_counter()
+
+        for attempt in range(self.max_retries + 1):
+            offset = self._resume_offset(part_path)
+            try:
+                async with client.stream("GET", url, headers=self._range_headers(offset)) as response:
+                    mode, expected_size = self._prepare_write(response, offset)
+                    with open(part_path, mode) as file:
+                        async for block in response.aiter_bytes(self.chunk_size):
+                            await asyncio.to_thread(file.write, block)
+                path = self._finish(part_path, destination, expected_size)
+                logger.info(f"Downloaded {path.stat().st_size} bytes to {path} in {time.perf_counter() - started:.2f}s")
+                return path
+            except Exception as e:
+                await asyncio.sleep(self._retry_delay(e, attempt, part_path))
+
+
+url_downloader = URLDownloader()
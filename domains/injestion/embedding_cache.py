@@ -0,0 +1,157 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from typing import Dict, List, Sequence
+
+from langchain_core.embeddings import Embeddings
+from loguru import logger
+
+from domains.settings import config_settings
+from domains.sqlite_store import SQLiteStore
+
+
+class EmbeddingCacheStore(SQLiteStore):
+    """
+    Disk-backed, content-addressed store of embedding vectors.
+
+    Entries are keyed by a hash of (embedding model, text), so identical text uploaded to
+    different namespaces is embedded once. The least recently used entries are evicted
+    once the store grows past ``max_entries``.
+    """
+
+    schema = (
+        """
+        CREATE TABLE IF NOT EXISTS embeddings (
+            key TEXT PRIMARY KEY,
+            vector BLOB NOT NULL,
+            last_access REAL NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_embeddings_last_access ON embeddings (last_access)",
+    )
+
+    def __init__(
+            self,
+            db_path: str = config_settings.EMBEDDING_CACHE_PATH,
+            max_entries: int = config_settings.EMBEDDING_CACHE_MAX_ENTRIES,
+    ) -> None:
+        super().__init__(db_path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model_name: str, text: str) -> str:
+        return hashlib.sha256(f"{model_name}\0{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        unique_keys = list(dict.fromkeys(keys))
+
+        with self._connect() as connection:
+            # Stay well below SQLite's bound-parameter limit.
+            for start in range(0, len(unique_keys), 500):
+                chunk = unique_keys[start:start + 500]
+                rows = connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for key, vector in rows:
+                    found[key] = array("f", vector).tolist()
+
+            if found:
+                now = time.time()
+                connection.executemany(
+                    "UPDATE embeddings SET last_access = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+
+        with self._lock:
+            self.hits += sum(1 for key in keys if key in found)
+            self.misses += sum(1 for key in keys if key not in found)
+
+        return found
+
+    def put_many(self, items: Dict[str, List[float]]) -> None:
+        if not items:
+            return
+
+        now = time.time()
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, last_access) VALUES (?, ?, ?)",
+                [(key, array("f", vector).tobytes(), now) for key, vector in items.items()],
+            )
+            self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        total_entries = connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        overflow = total_entries - self.max_entries
+        if overflow <= 0:
+            return
+
+        # Evict an extra 10% so eviction does not run on every insert once the store is full.
+        to_evict = overflow + self.max_entries // 10
+        connection.execute(
+            "DELETE FROM embeddings WHERE key IN "
+            "(SELECT key FROM embeddings ORDER BY last_access LIMIT ?)",
+            (to_evict,),
+        )
+        logger.info(f"Evicted {to_evict} entries from the embedding cache")
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper that only sends cache misses to the underlying provider."""
+
+    def __init__(self, underlying: Embeddings, model_name: str, store: EmbeddingCacheStore) -> None:
+        self.underlying = underlying
+        self.model_name = model_name
+        self.store = store
+
+    def _split_hits_and_misses(self, texts: List[str]) -> tuple[List[str], Dict[str, List[float]], List[str]]:
+        keys = [self.store.make_key(self.model_name, text) for text in texts]
+        cached = self.store.get_many(keys)
+        missing_texts = list(dict.fromkeys(text for key, text in zip(keys, texts) if key not in cached))
+        return keys, cached, missing_texts
+
+    def _merge(self, keys: List[str], cached: Dict[str, List[float]], missing_texts: List[str],
+               missing_vectors: List[List[float]]) -> List[List[float]]:
+        computed = {
+            self.store.make_key(self.model_name, text): vector
+            for text, vector in zip(missing_texts, missing_vectors)
+        }
+        self.store.put_many(computed)
+        cached.update(computed)
+        return [cached[key] for key in keys]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, cached, missing_texts = self._split_hits_and_misses(texts)
+        missing_vectors = self.underlying.embed_documents(missing_texts) if missing_texts else []
+        logger.debug(f"Embedding cache: {len(texts) - len(missing_texts)} hits, {len(missing_texts)} misses")
+        return self._merge(keys, cached, missing_texts, missing_vectors)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, cached, missing_texts = self._split_hits_and_misses(texts)
+        missing_vectors = await self.underlying.aembed_documents(missing_texts) if missing_texts else []
+        return self._merge(keys, cached, missing_texts, missing_vectors)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.underlying.embed_query(text)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await self.underlying.aembed_query(text)
+
+
+embedding_cache_store = EmbeddingCacheStore()
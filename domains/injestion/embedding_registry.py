@@ -0,0 +1,182 @@
+import asyncio
+import threading
+import weakref
+from typing import Dict, Iterable, Optional, Tuple
+
+import httpx
+from langchain_core.embeddings import Embeddings
+from langchain_google_genai import GoogleGenerativeAIEmbeddings
+from langchain_openai import OpenAIEmbeddings
+from loguru import logger
+
+from domains.settings import config_settings
+
+_OPENAI_DEFAULT_BASE_URL = "https://api.openai.com/v1"
+
+
+class EmbeddingsRegistry:
+    """
+    Process-level registry of embeddings provider clients, one per (provider, model, dimensions).
+    The local provider's model is loaded once and shared by every caller.
+
+    OpenAI-compatible providers share one pooled, keep-alive ``httpx.Client`` for sync
+    calls. httpx async clients are bound to the event loop that created them, so async
+    calls get one pooled ``httpx.AsyncClient`` (and one embeddings object) per running
+    loop. A loop that is about to end closes its client with ``aclose``; ``close`` closes
+    the sync client and whatever async clients are left. Google embeddings keep their own
+    client, which is reused by caching the object.
+    """
+
+    def __init__(
+            self,
+            max_connections: int = config_settings.EMBEDDING_HTTP_MAX_CONNECTIONS,
+            timeout: float = config_settings.EMBEDDING_HTTP_TIMEOUT,
+            connect_timeout: float = config_settings.EMBEDDING_HTTP_CONNECT_TIMEOUT,
+    ) -> None:
+        self._limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self._timeout = httpx.Timeout(timeout, connect=min(timeout, connect_timeout))
+        self._http_client: Optional[httpx.Client] = None
+        self._embeddings: Dict[Tuple[str, str, Optional[int]], Embeddings] = {}
+        self._loop_embeddings: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str, Optional[int]], Embeddings]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _model_name(model_key: str) -> Optional[str]:
+        from domains.injestion.utils import get_embedding_model_name
+
+        return get_embedding_model_name(model_key)
+
+    @staticmethod
+    def _dimensions(model_key: str) -> Optional[int]:
+        from domains.injestion.utils import get_embedding_dimensions
+
+        return get_embedding_dimensions(model_key)
+
+    def _get_http_client(self) -> httpx.Client:
+        if self._http_client is None:
+            self._http_client = httpx.Client(limits=self._limits, timeout=self._timeout)
+        return self._http_client
+
+    def _get_async_client(self, loop: asyncio.AbstractEventLoop) -> httpx.AsyncClient:
+        if loop not in self._async_clients:
+            self._async_clients[loop] = httpx.AsyncClient(limits=self._limits, timeout=self._timeout)
+        return self._async_clients[loop]
+
+    def _build(
+            self,
+            provider: str,
+            model_name: Optional[str],
+            dimensions: Optional[int],
+            loop: Optional[asyncio.AbstractEventLoop],
+    ) -> Optional[Embeddings]:
+        if provider in ("openai", "groq"):
+            api_key = config_settings.OPENAI_API_KEY if provider == "openai" else config_settings.GROQ_API_KEY
+            return OpenAIEmbeddings(
+                model=model_name,
+                dimensions=dimensions,
+                api_key=api_key,
+                http_client=self._get_http_client(),
+                http_async_client=self._get_async_client(loop) if loop is not None else None,
+                # With the scheduler on, rate-limit retries are left to it so callers do not retry in lockstep.
+                **({"max_retries": 0} if config_settings.EMBEDDING_SCHEDULER_STATUS else {}),
+            )
+
+        elif provider == "local":
+            from domains.injestion.local_embeddings import load_local_embeddings
+
+            return load_local_embeddings()
+
+        elif provider == "google":
+            return GoogleGenerativeAIEmbeddings(
+                model=model_name,
+                google_api_key=config_settings.GOOGLE_API_KEY
+            )
+
+        return None
+
+    def get(self, model_key: str = "EMBEDDING_MODEL_NAME") -> Optional[Embeddings]:
+        """Return the shared embeddings for ``model_key`` under the configured embeddings provider."""
+        from domains.injestion.utils import get_embedding_service
+
+        provider = get_embedding_service()
+        key = (provider, self._model_name(model_key), self._dimensions(model_key))
+
+        try:
+            # A local model holds no event-loop-bound client, so one instance serves every loop.
+            loop = asyncio.get_running_loop() if provider != "local" else None
+        except RuntimeError:
+            loop = None
+
+        with self._lock:
+            cache = self._embeddings if loop is None else self._loop_embeddings.setdefault(loop, {})
+            if key not in cache:
+                embeddings = self._build(provider, key[1], key[2], loop)
+                if embeddings is None:
+                    return None
+                cache[key] = embeddings
+                logger.info(f"Created {provider} embeddings client for model {key[1]}")
+            return cache[key]
+
+    def warm(self, model_keys: Iterable[str] = ("EMBEDDING_MODEL_NAME",)) -> None:
+        """
+        Build the clients for ``model_keys`` and open a pooled connection to the provider,
+        so the first real request does not pay for the TCP and TLS handshakes.
+        """
+        for model_key in model_keys:
+            try:
+                embeddings = self.get(model_key)
+            except Exception as e:
+                logger.warning(f"Could not create the embeddings client for {model_key}: {e}")
+                continue
+
+            if not isinstance(embeddings, OpenAIEmbeddings):
+                continue
+
+            base_url = (embeddings.openai_api_base or _OPENAI_DEFAULT_BASE_URL).rstrip("/")
+            try:
+                # Any response will do; the point is the kept-alive connection.
+                self._get_http_client().head(f"{base_url}/models")
+            except httpx.HTTPError as e:
+                logger.warning(f"Could not warm the embeddings connection to {base_url}: {e}")
+
+    async def aclose(self) -> None:
+        """Close the running loop's async client and drop the embeddings bound to it."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._loop_embeddings.pop(loop, None)
+            client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    def close(self) -> None:
+        from domains.injestion.local_embeddings import LocalEmbeddings
+
+        with self._lock:
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
+            for embeddings in self._embeddings.values():
+                if isinstance(embeddings, LocalEmbeddings):
+                    embeddings.close()
+            self._embeddings.clear()
+
+            async_clients = list(self._async_clients.items())
+            self._async_clients.clear()
+            self._loop_embeddings.clear()
+
+        for loop, client in async_clients:
+            if loop.is_closed():
+                # Its connections went with the loop; nothing is left to close.
+                continue
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            else:
+                loop.run_until_complete(client.aclose())
+
+
+embeddings_registry = EmbeddingsRegistry()
@@ -0,0 +1,458 @@
+import asyncio
+import heapq
+import itertools
+import random
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
+
+import httpx
+from langchain_core.embeddings import Embeddings
+from loguru import logger
+from openai import APIConnectionError, InternalServerError
+
+from domains.settings import config_settings
+from domains.sqlite_store import SQLiteStore
+
+T = TypeVar("T")
+
+INTERACTIVE = 0
+BULK = 1
+
+PRIORITIES = {"interactive": INTERACTIVE, "bulk": BULK}
+
+_current_priority: ContextVar[int] = ContextVar("embedding_priority", default=BULK)
+
+
+@contextmanager
+def embedding_priority(priority: str) -> Iterator[None]:
+    """
+    Run document embeddings made in this context (including threads started with
+    asyncio.to_thread) at the given injestion priority, "interactive" or "bulk".
+    """
+    token = _current_priority.set(PRIORITIES[priority])
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def estimate_tokens(texts: List[str]) -> int:
+    """Cheap token estimate (about four characters per token) used for rate budgeting."""
+    return sum(len(text) // 4 + 1 for text in texts)
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    for status in (
+            getattr(error, "status_code", None),
+            getattr(error, "code", None),
+            getattr(getattr(error, "response", None), "status_code", None),
+    ):
+        if isinstance(status, int):
+            return status
+    return None
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    if retry_after_ms := headers.get("retry-after-ms"):
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+
+    if retry_after := headers.get("retry-after"):
+        try:
+            return float(retry_after)
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    return None
+
+
+def rate_limit_delay(error: Exception, attempt: int) -> Optional[float]:
+    """Seconds to back off after ``error``, or None when it is not a rate-limit error."""
+    if _status_code(error) != 429 and "RateLimit" not in type(error).__name__ \
+            and "ResourceExhausted" not in type(error).__name__:
+        return None
+    retry_after = _retry_after_seconds(error)
+    return retry_after if retry_after is not None else min(2 ** attempt, 60)
+
+
+def transient_error_delay(error: Exception, attempt: int) -> Optional[float]:
+    """
+    Seconds to back off after a transient failure (connection reset, timeout, 5xx), or
+    None when retrying would not help. APITimeoutError is an APIConnectionError.
+    """
+    status = _status_code(error)
+    if not (
+            isinstance(error, (APIConnectionError, InternalServerError, httpx.TransportError,
+                               ConnectionError, TimeoutError))
+            or (status is not None and (status >= 500 or status == 408))
+    ):
+        return None
+    # Jitter keeps callers that failed together from retrying together.
+    return min(2 ** attempt, 30) * random.uniform(0.5, 1.0)
+
+
+class LocalBudget:
+    """Token buckets for tokens and requests per minute, held in this process."""
+
+    def __init__(self, tokens_per_minute: int, requests_per_minute: int) -> None:
+        self.tokens_per_minute = tokens_per_minute
+        self.requests_per_minute = requests_per_minute
+        self._tokens = float(tokens_per_minute)
+        self._requests = float(requests_per_minute)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def take(self, tokens: int, requests: int, priority: int) -> float:
+        """Take the budget for a call and return 0, or return the seconds to wait before trying again."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, self._requests = _refill(
+                self._tokens, self._requests, now - self._updated, self.tokens_per_minute, self.requests_per_minute
+            )
+            self._updated = now
+            wait = _wait_time(
+                tokens, requests, self._tokens, self._requests, self._paused_until - now,
+                self.tokens_per_minute, self.requests_per_minute,
+            )
+            if wait <= 0:
+                self._tokens -= tokens
+                self._requests -= requests
+            return wait
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def paused_for(self) -> float:
+        return max(0.0, self._paused_until - time.monotonic())
+
+
+class SharedBudget(SQLiteStore):
+    """
+    Token buckets kept in SQLite, so the API process and every injestion worker draw on
+    one budget. Each take is a short IMMEDIATE transaction on a single row.
+
+    Priority across processes: an interactive caller that has to wait marks the budget
+    as claimed for the length of its wait, and bulk callers in any process hold back
+    until it has gone through.
+    """
+
+    autocommit = True
+    schema = (
+        """
+        CREATE TABLE IF NOT EXISTS embedding_budget (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            tokens REAL NOT NULL,
+            requests REAL NOT NULL,
+            updated_at REAL NOT NULL,
+            paused_until REAL NOT NULL DEFAULT 0,
+            interactive_until REAL NOT NULL DEFAULT 0
+        )
+        """,
+    )
+
+    def __init__(
+            self,
+            tokens_per_minute: int,
+            requests_per_minute: int,
+            db_path: str = config_settings.EMBEDDING_BUDGET_PATH,
+    ) -> None:
+        super().__init__(db_path)
+        self.tokens_per_minute = tokens_per_minute
+        self.requests_per_minute = requests_per_minute
+
+    def _row(self, connection: sqlite3.Connection, now: float) -> sqlite3.Row:
+        connection.execute(
+            "INSERT OR IGNORE INTO embedding_budget (id, tokens, requests, updated_at) VALUES (1, ?, ?, ?)",
+            (self.tokens_per_minute, self.requests_per_minute, now),
+        )
+        return connection.execute("SELECT * FROM embedding_budget WHERE id = 1").fetchone()
+
+    def take(self, tokens: int, requests: int, priority: int) -> float:
+        """Take the budget for a call and return 0, or return the seconds to wait before trying again."""
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                # Wall-clock time, since the row is shared between processes.
+                now = time.time()
+                row = self._row(connection, now)
+                available_tokens, available_requests = _refill(
+                    row["tokens"], row["requests"], max(0.0, now - row["updated_at"]),
+                    self.tokens_per_minute, self.requests_per_minute,
+                )
+                interactive_until = row["interactive_until"]
+
+                if priority != INTERACTIVE and interactive_until > now:
+                    wait = interactive_until - now
+                else:
+                    wait = _wait_time(
+                        tokens, requests, available_tokens, available_requests, row["paused_until"] - now,
+                        self.tokens_per_minute, self.requests_per_minute,
+                    )
+                    if wait <= 0:
+                        available_tokens -= tokens
+                        available_requests -= requests
+                        if priority == INTERACTIVE:
+                            interactive_until = 0.0
+                    elif priority == INTERACTIVE:
+                        # A little slack so the interactive caller is back before bulk callers are let go.
+                        interactive_until = max(interactive_until, now + wait + 0.5)
+
+                connection.execute(
+                    "UPDATE embedding_budget SET tokens = ?, requests = ?, updated_at = ?, interactive_until = ? "
+                    "WHERE id = 1",
+                    (available_tokens, available_requests, now, interactive_until),
+                )
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        with self._connect() as connection:
+            now = time.time()
+            self._row(connection, now)
+            connection.execute(
+                "UPDATE embedding_budget SET paused_until = MAX(paused_until, ?) WHERE id = 1", (now + seconds,)
+            )
+
+    def paused_for(self) -> float:
+        with self._connect() as connection:
+            now = time.time()
+            return max(0.0, self._row(connection, now)["paused_until"] - now)
+
+
+def _refill(
+        tokens: float, requests: float, elapsed: float, tokens_per_minute: int, requests_per_minute: int
+) -> Tuple[float, float]:
+    return (
+        min(tokens_per_minute, tokens + elapsed * tokens_per_minute / 60),
+        min(requests_per_minute, requests + elapsed * requests_per_minute / 60),
+    )
+
+
+def _wait_time(
+        tokens: int, requests: int, available_tokens: float, available_requests: float, paused_for: float,
+        tokens_per_minute: int, requests_per_minute: int,
+) -> float:
+    if paused_for > 0:
+        return paused_for
+    return max(
+        0.0,
+        (tokens - available_tokens) * 60 / tokens_per_minute,
+        (requests - available_requests) * 60 / requests_per_minute,
+    )
+
+
+class EmbeddingScheduler:
+    """
+    Admission control for calls to the embeddings provider.
+
+    Every call takes its estimated tokens and request count out of two token buckets that
+    refill at ``tokens_per_minute`` and ``requests_per_minute``. With a SharedBudget (the
+    default) the buckets are shared by the API process and all injestion workers, so the
+    configured rates hold for the deployment as a whole.
+
+    Callers wait in priority order, so an interactive query waiting on the budget goes
+    ahead of queued injestion batches. When the provider still answers 429, every caller
+    is paused for the Retry-After period (or an exponential backoff) instead of retrying
+    on its own. Transient failures (connection errors, timeouts, 5xx) are retried by the
+    failing caller alone with a jittered backoff, since the provider clients' own retries
+    are turned off under the scheduler.
+    """
+
+    # Async callers cannot wait on the condition, so they poll while another caller is ahead.
+    ASYNC_POLL_INTERVAL = 0.02
+    # Longest single wait, so a missed notification or a pause set by another process
+    # delays a caller by at most this long.
+    MAX_WAIT = 1.0
+
+    def __init__(
+            self,
+            tokens_per_minute: int = config_settings.EMBEDDING_TOKENS_PER_MINUTE,
+            requests_per_minute: int = config_settings.EMBEDDING_REQUESTS_PER_MINUTE,
+            max_retries: int = config_settings.EMBEDDING_SCHEDULER_MAX_RETRIES,
+            budget: Optional[Union[LocalBudget, SharedBudget]] = None,
+    ) -> None:
+        self.tokens_per_minute = tokens_per_minute
+        self.requests_per_minute = requests_per_minute
+        self.max_retries = max_retries
+        self.budget = budget or LocalBudget(tokens_per_minute, requests_per_minute)
+        self.throttled = 0
+        self._waiters: List[tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    def _enqueue(self, priority: int) -> tuple[int, int]:
+        ticket = (priority, next(self._sequence))
+        with self._condition:
+            heapq.heappush(self._waiters, ticket)
+            self._condition.notify_all()
+        return ticket
+
+    def _dequeue(self, ticket: tuple[int, int]) -> None:
+        with self._condition:
+            self._waiters.remove(ticket)
+            heapq.heapify(self._waiters)
+            self._condition.notify_all()
+
+    def _is_head(self, ticket: tuple[int, int]) -> bool:
+        with self._condition:
+            return self._waiters[0] == ticket
+
+    def _clamp(self, tokens: int, requests: int) -> tuple[int, int]:
+        # A call larger than a whole minute of budget is let through once the bucket is full.
+        return min(tokens, self.tokens_per_minute), min(requests, self.requests_per_minute)
+
+    def acquire(self, tokens: int, requests: int = 1, priority: int = BULK) -> None:
+        """Block until the budget covers the call and no caller with a higher priority is waiting."""
+        tokens, requests = self._clamp(tokens, requests)
+        ticket = self._enqueue(priority)
+        try:
+            while True:
+                with self._condition:
+                    while self._waiters[0] != ticket:
+                        self._condition.wait(self.MAX_WAIT)
+
+                # Outside the condition: a shared budget takes another process's SQLite write
+                # lock, and callers in this process must not queue behind it.
+                wait = self.budget.take(tokens, requests, priority)
+                if wait <= 0:
+                    return
+                with self._condition:
+                    self._condition.wait(min(wait, self.MAX_WAIT))
+        finally:
+            self._dequeue(ticket)
+
+    async def aacquire(self, tokens: int, requests: int = 1, priority: int = BULK) -> None:
+        """Like acquire, but waits with asyncio.sleep instead of holding a thread."""
+        tokens, requests = self._clamp(tokens, requests)
+        ticket = self._enqueue(priority)
+        try:
+            while True:
+                if not self._is_head(ticket):
+                    await asyncio.sleep(self.ASYNC_POLL_INTERVAL)
+                    continue
+
+                if isinstance(self.budget, SharedBudget):
+                    # A short SQLite transaction; the thread is released before the wait.
+                    wait = await asyncio.to_thread(self.budget.take, tokens, requests, priority)
+                else:
+                    wait = self.budget.take(tokens, requests, priority)
+                if wait <= 0:
+                    return
+                await asyncio.sleep(min(wait, self.MAX_WAIT))
+        finally:
+            self._dequeue(ticket)
+
+    def pause(self, seconds: float) -> None:
+        self.budget.pause(seconds)
+        with self._condition:
+            self.throttled += 1
+            self._condition.notify_all()
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """Seconds this caller sleeps before retrying ``error``; raises it when it is not retryable."""
+        if attempt < self.max_retries:
+            delay = rate_limit_delay(error, attempt)
+            if delay is not None:
+                logger.warning(f"Embeddings provider rate limited the request, pausing all callers for {delay:.1f}s")
+                self.pause(delay)
+                # The pause is enforced by acquire().
+                return 0.0
+
+            delay = transient_error_delay(error, attempt)
+            if delay is not None:
+                logger.warning(f"Embeddings request failed with {type(error).__name__}, retrying in {delay:.1f}s")
+                return delay
+
+        raise error
+
+    def run(self, call: Callable[[], T], tokens: int, requests: int = 1, priority: int = BULK) -> T:
+        for attempt in range(self.max_retries + 1):
+            self.acquire(tokens, requests, priority)
+            try:
+                return call()
+            except Exception as e:
+                time.sleep(self._retry_delay(e, attempt))
+
+    async def arun(self, call: Callable[[], Awaitable[T]], tokens: int, requests: int = 1, priority: int = BULK) -> T:
+        for attempt in range(self.max_retries + 1):
+            await self.aacquire(tokens, requests, priority)
+            try:
+                return await call()
+            except Exception as e:
+                await asyncio.sleep(self._retry_delay(e, attempt))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "waiting": len(self._waiters),
+                "throttled": self.throttled,
+                "paused_for": self.budget.paused_for(),
+            }
+
+
+class ScheduledEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that sends every provider call through the shared scheduler.
+
+    Document embeddings run at ``priority``, or when it is not given, at the priority of
+    the injestion job in the current context (see ``embedding_priority``). Query
+    embeddings always run as interactive.
+    """
+
+    def __init__(self, underlying: Embeddings, scheduler: EmbeddingScheduler, priority: Optional[int] = None) -> None:
+        self.underlying = underlying
+        self.scheduler = scheduler
+        self.priority = priority
+
+    def _document_priority(self) -> int:
+        return self.priority if self.priority is not None else _current_priority.get()
+
+    def _requests_for(self, texts: List[str]) -> int:
+        # OpenAIEmbeddings sends chunk_size texts per HTTP request.
+        chunk_size = getattr(self.underlying, "chunk_size", None) or len(texts) or 1
+        return max(1, -(-len(texts) // chunk_size))
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        return self.scheduler.run(
+            lambda: self.underlying.embed_documents(texts),
+            estimate_tokens(texts), self._requests_for(texts), self._document_priority(),
+        )
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        return await self.scheduler.arun(
+            lambda: self.underlying.aembed_documents(texts),
+            estimate_tokens(texts), self._requests_for(texts), self._document_priority(),
+        )
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.scheduler.run(lambda: self.underlying.embed_query(text), estimate_tokens([text]), 1, INTERACTIVE)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await self.scheduler.arun(
+            lambda: self.underlying.aembed_query(text), estimate_tokens([text]), 1, INTERACTIVE
+        )
+
+
+embedding_scheduler = EmbeddingScheduler(
+    budget=SharedBudget(config_settings.EMBEDDING_TOKENS_PER_MINUTE, config_settings.EMBEDDING_REQUESTS_PER_MINUTE)
+    if config_settings.EMBEDDING_BUDGET_SHARED_STATUS else None
+)
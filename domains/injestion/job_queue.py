@@ -0,0 +1,246 @@
+import json
+import sqlite3
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from loguru import logger
+
+from domains.injestion.models import INJESTION_PRIORITIES, BulkInjestRequestDto, InjestRequestDto, JobStatusResponseDto
+from domains.models import RequestStatusEnum
+from domains.settings import config_settings
+from domains.sqlite_store import SQLiteStore
+
+
+class InjestionJobQueue(SQLiteStore):
+    """
+    Durable SQLite-backed queue of injestion requests shared by the API and the workers.
+
+    Every job has a priority class, "interactive" or "bulk". Interactive jobs are claimed
+    before any bulk job, and workers can be limited to a set of classes so some capacity
+    is always free for interactive uploads.
+
+    A job injests either one file (an InjestRequestDto) or, for bulk endpoints, the files
+    of one namespace together (a BulkInjestRequestDto); ``kind`` records which.
+    """
+
+    autocommit = True
+    schema = (
+        """
+        CREATE TABLE IF NOT EXISTS injestion_jobs (
+            job_id TEXT PRIMARY KEY,
+            request_id TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            status TEXT NOT NULL,
+            priority TEXT NOT NULL DEFAULT 'bulk',
+            kind TEXT NOT NULL DEFAULT 'file',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            progress TEXT NOT NULL DEFAULT '{}',
+            result TEXT,
+            error_detail TEXT,
+            lease_expires_at TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_injestion_jobs_status ON injestion_jobs (status, created_at)",
+    )
+
+    def __init__(
+            self,
+            db_path: str = config_settings.INJESTION_QUEUE_PATH,
+            max_attempts: int = config_settings.INJESTION_JOB_MAX_ATTEMPTS,
+            lease_seconds: int = config_settings.INJESTION_JOB_LEASE_SECONDS,
+    ) -> None:
+        super().__init__(db_path)
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+
+    def _migrate(self, connection: sqlite3.Connection) -> None:
+        columns = {row["name"] for row in connection.execute("PRAGMA table_info(injestion_jobs)")}
+        if "priority" not in columns:
+            connection.execute("ALTER TABLE injestion_jobs ADD COLUMN priority TEXT NOT NULL DEFAULT 'bulk'")
+        if "kind" not in columns:
+            connection.execute("ALTER TABLE injestion_jobs ADD COLUMN kind TEXT NOT NULL DEFAULT 'file'")
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().isoformat()
+
+    def enqueue(self, request: Union[InjestRequestDto, BulkInjestRequestDto]) -> str:
+        """Persist a request and return the id of the job that will process it."""
+        job_id = uuid.uuid4().hex
+        now = self._now()
+        request = request.model_copy(
+            update={"priority": request.priority or config_settings.INJESTION_DEFAULT_PRIORITY}
+        )
+
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT INTO injestion_jobs "
+                "(job_id, request_id, payload, status, priority, kind, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    str(request.request_id),
+                    request.model_dump_json(),
+                    RequestStatusEnum.QUEUED.value,
+                    request.priority,
+                    "bulk" if isinstance(request, BulkInjestRequestDto) else "file",
+                    now,
+                    now,
+                ),
+            )
+
+        if isinstance(request, BulkInjestRequestDto):
+            logger.info(
+                f"Enqueued {request.priority} injestion job {job_id} for {len(request.files)} files "
+                f"into namespace: {request.namespace}"
+            )
+        else:
+            logger.info(f"Enqueued {request.priority} injestion job {job_id} for file_name: {request.file_name}")
+        return job_id
+
+    def claim_next(
+            self, priorities: Optional[List[str]] = None
+    ) -> Optional[Tuple[str, Union[InjestRequestDto, BulkInjestRequestDto]]]:
+        """
+        Atomically claim the oldest runnable job of the highest priority class.
+
+        A job is runnable when it is queued, or when a previous worker claimed it
+        and its lease expired without the job finishing (e.g. the worker crashed).
+        ``priorities`` restricts the claim to those classes; all classes by default.
+        """
+        now = datetime.now()
+        priorities = priorities or INJESTION_PRIORITIES
+        # INJESTION_PRIORITIES is ordered from most to least urgent.
+        priority_rank = " ".join(
+            f"WHEN '{priority}' THEN {rank}" for rank, priority in enumerate(INJESTION_PRIORITIES)
+        )
+
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    "SELECT job_id, payload, kind, attempts FROM injestion_jobs "
+                    "WHERE (status = ? OR (status = ? AND lease_expires_at < ?)) "
+                    f"AND priority IN ({','.join('?' * len(priorities))}) "
+                    f"ORDER BY CASE priority {priority_rank} ELSE {len(INJESTION_PRIORITIES)} END, created_at "
+                    "LIMIT 1",
+                    (
+                        RequestStatusEnum.QUEUED.value,
+                        RequestStatusEnum.PROCESSING.value,
+                        now.isoformat(),
+                        *priorities,
+                    ),
+                ).fetchone()
+
+                if row is None:
+                    connection.execute("COMMIT")
+                    return None
+
+                attempts = row["attempts"] + 1
+                if attempts > self.max_attempts:
+                    connection.execute(
+                        "UPDATE injestion_jobs SET status = ?, error_detail = ?, "
+                        "lease_expires_at = NULL, updated_at = ? WHERE job_id = ?",
+                        (
+                            RequestStatusEnum.FAILED.value,
+                            f"Job abandoned after {self.max_attempts} attempts",
+                            now.isoformat(),
+                            row["job_id"],
+                        ),
+                    )
+                    connection.execute("COMMIT")
+                    logger.error(f"Injestion job {row['job_id']} exceeded {self.max_attempts} attempts")
+                    return self.claim_next(priorities)
+
+                connection.execute(
+                    "UPDATE injestion_jobs SET status = ?, attempts = ?, "
+                    "lease_expires_at = ?, updated_at = ? WHERE job_id = ?",
+                    (
+                        RequestStatusEnum.PROCESSING.value,
+                        attempts,
+                        (now + timedelta(seconds=self.lease_seconds)).isoformat(),
+                        now.isoformat(),
+                        row["job_id"],
+                    ),
+                )
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+
+        payload_model = BulkInjestRequestDto if row["kind"] == "bulk" else InjestRequestDto
+        return row["job_id"], payload_model.model_validate_json(row["payload"])
+
+    def update_progress(self, job_id: str, progress: Dict[str, Any]) -> None:
+        """Merge progress counters into the job and extend its lease."""
+        now = datetime.now()
+
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT progress FROM injestion_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                connection.execute("COMMIT")
+                return
+
+            merged = json.loads(row["progress"]) | progress
+            connection.execute(
+                "UPDATE injestion_jobs SET progress = ?, lease_expires_at = ?, "
+                "updated_at = ? WHERE job_id = ?",
+                (
+                    json.dumps(merged),
+                    (now + timedelta(seconds=self.lease_seconds)).isoformat(),
+                    now.isoformat(),
+                    job_id,
+                ),
+            )
+            connection.execute("COMMIT")
+
+    def complete(
+            self,
+            job_id: str,
+            status: RequestStatusEnum,
+            result: Optional[Dict[str, Any]] = None,
+            error_detail: Optional[str] = None,
+    ) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE injestion_jobs SET status = ?, result = ?, error_detail = ?, "
+                "lease_expires_at = NULL, updated_at = ? WHERE job_id = ?",
+                (
+                    status.value,
+                    json.dumps(result) if result is not None else None,
+                    error_detail,
+                    self._now(),
+                    job_id,
+                ),
+            )
+
+    def get(self, job_id: str) -> Optional[JobStatusResponseDto]:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT * FROM injestion_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return JobStatusResponseDto(
+            job_id=row["job_id"],
+            request_id=int(row["request_id"]),
+            status=RequestStatusEnum(row["status"]),
+            priority=row["priority"],
+            attempts=row["attempts"],
+            progress=json.loads(row["progress"]),
+            result=json.loads(row["result"]) if row["result"] else None,
+            error_detail=row["error_detail"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
+
+
+job_queue = InjestionJobQueue()
@@ -0,0 +1,196 @@
+import abc
+import asyncio
+import hashlib
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from loguru import logger
+
+from domains.settings import config_settings
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+class LocalEmbeddings(Embeddings):
+    """
+    Base class for embeddings computed on this machine's CPU.
+
+    Texts are embedded in batches of ``batch_size``, and the batches run on a pool of
+    ``threads`` worker threads, started on the first multi-batch call and stopped by
+    ``close``. Subclasses implement ``_embed_batch``, which returns one L2-normalized
+    float32 row per text. Async calls run the same work in a thread.
+    """
+
+    def __init__(self, batch_size: int, threads: int) -> None:
+        self.batch_size = max(1, batch_size)
+        self.threads = threads or os.cpu_count() or 1
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    @abc.abstractmethod
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        """One L2-normalized float32 row per text."""
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="local-embeddings")
+            return self._executor
+
+    def close(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        batches = [texts[start:start + self.batch_size] for start in range(0, len(texts), self.batch_size)]
+        if len(batches) == 1:
+            return self._embed_batch(batches[0]).tolist()
+        return np.concatenate(list(self._get_executor().map(self._embed_batch, batches))).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed_batch([text])[0].tolist()
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await asyncio.to_thread(self.embed_documents, texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await asyncio.to_thread(self.embed_query, text)
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+
+class HashingEmbeddings(LocalEmbeddings):
+    """
+    Deterministic feature-hashing embedder: lower-cased word unigrams and bigrams are
+    hashed into ``dimension`` signed buckets with log term-frequency weights.
+
+    It needs no model files, so it suits tests, benchmarks and offline development.
+    Texts that share words score as similar, but it has no notion of meaning.
+    """
+
+    def __init__(self, dimension: int, batch_size: int, threads: int) -> None:
+        super().__init__(batch_size=batch_size, threads=threads)
+        self.dimension = dimension
+
+    def _features(self, text: str) -> np.ndarray:
+        tokens = _TOKEN.findall(text.lower())
+        features = tokens + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+        if not features:
+            return np.zeros(0, dtype=np.uint64)
+        digests = b"".join(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest() for feature in features)
+        return np.frombuffer(digests, dtype="<u8")
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            hashes = self._features(text)
+            if not hashes.size:
+                continue
+            buckets = (hashes % self.dimension).astype(np.intp)
+            # The top hash bit picks the sign, so collisions cancel out instead of piling up.
+            signs = np.where(hashes >> np.uint64(63), -1.0, 1.0).astype(np.float32)
+            np.add.at(vectors[row], buckets, signs)
+        vectors = np.sign(vectors) * np.log1p(np.abs(vectors))
+        return self._normalize(vectors)
+
+
+class OnnxEmbeddings(LocalEmbeddings):
+    """
+    Sentence-embedding model exported to ONNX, read from a local directory that holds
+    ``model.onnx`` and the Hugging Face ``tokenizer.json``. Token embeddings are mean-pooled
+    over the attention mask and L2-normalized.
+
+    Requires the optional ``onnxruntime`` and ``tokenizers`` packages. Each session runs
+    single-threaded and the batches are spread over the worker threads. With ``dimension``
+    below the model's width, vectors are truncated and renormalized, which only keeps
+    quality for models trained for it (Matryoshka embeddings).
+    """
+
+    def __init__(self, model_path: str, batch_size: int, threads: int, max_length: int,
+                 dimension: Optional[int] = None) -> None:
+        try:
+            import onnxruntime
+            from tokenizers import Tokenizer
+        except ImportError as e:
+            raise ImportError(
+                "The local ONNX embeddings provider needs the onnxruntime and tokenizers packages"
+            ) from e
+
+        super().__init__(batch_size=batch_size, threads=threads)
+        self.model_path = model_path
+        self.dimension = dimension
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_path, "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding()
+
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = 1
+        options.inter_op_num_threads = 1
+        self.session = onnxruntime.InferenceSession(
+            os.path.join(model_path, "model.onnx"), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+
+        width = self.session.get_outputs()[0].shape[-1]
+        if isinstance(width, int) and dimension is not None and width < dimension:
+            raise ValueError(f"The ONNX model at {model_path} returns {width} dimensions, fewer than {dimension}")
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        input_ids = np.asarray([encoding.ids for encoding in encodings], dtype=np.int64)
+        attention_mask = np.asarray([encoding.attention_mask for encoding in encodings], dtype=np.int64)
+
+        inputs = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self.input_names:
+            inputs["token_type_ids"] = np.asarray([encoding.type_ids for encoding in encodings], dtype=np.int64)
+
+        token_embeddings = self.session.run(None, {name: inputs[name] for name in self.input_names})[0]
+        mask = attention_mask[:, :, None].astype(np.float32)
+        pooled = (token_embeddings * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+        if self.dimension is not None and pooled.shape[1] < self.dimension:
+            raise ValueError(
+                f"The ONNX model at {self.model_path} returns {pooled.shape[1]} dimensions, fewer than {self.dimension}"
+            )
+        return self._normalize(pooled[:, :self.dimension].astype(np.float32))
+
+
+def local_embedding_model_name(model_path: Optional[str] = None) -> str:
+    """Identifier of the configured local model, used in cache keys."""
+    model_path = config_settings.LOCAL_EMBEDDING_MODEL_PATH if model_path is None else model_path
+    if not model_path:
+        return f"hashing-{config_settings.EMBEDDING_DIMENSION}"
+    return f"{os.path.basename(os.path.normpath(model_path))}@{config_settings.EMBEDDING_DIMENSION}"
+
+
+def load_local_embeddings(model_path: Optional[str] = None) -> LocalEmbeddings:
+    """The ONNX model at ``model_path``, or the hashing embedder when no path is configured."""
+    model_path = config_settings.LOCAL_EMBEDDING_MODEL_PATH if model_path is None else model_path
+    if not model_path:
+        logger.info(f"Using the hashing embedder with {config_settings.EMBEDDING_DIMENSION} dimensions")
+        return HashingEmbeddings(
+            dimension=config_settings.EMBEDDING_DIMENSION,
+            batch_size=config_settings.LOCAL_EMBEDDING_BATCH_SIZE,
+            threads=config_settings.LOCAL_EMBEDDING_THREADS,
+        )
+
+    logger.info(f"Loading the local ONNX embeddings model from {model_path}")
+    return OnnxEmbeddings(
+        model_path=model_path,
+        batch_size=config_settings.LOCAL_EMBEDDING_BATCH_SIZE,
+        threads=config_settings.LOCAL_EMBEDDING_THREADS,
+        max_length=config_settings.LOCAL_EMBEDDING_MAX_LENGTH,
+        dimension=config_settings.EMBEDDING_DIMENSION,
+    )
@@ -2,7 +2,7 @@ from enum import Enum
 from typing import Any, Literal, Optional, List, TypedDict, Dict
 from pydantic import BaseModel
 from domains.settings import config_settings
-from domains.models import RequestStatus
+from domains.models import RequestStatus, RequestStatusEnum
 
 
 FILE_TYPE = [
@@ -11,6 +11,21 @@ FILE_TYPE = [
     "docx"
 ]
 
+PDF_BACKENDS = [
+    "pypdf",
+    "pymupdf"
+]
+
+INJESTION_PRIORITIES = [
+    "interactive",
+    "bulk"
+]
+
+DOCX_MODES = [
+    "fast",
+    "accurate"
+]
+
 class FileInjestionResponseDto(RequestStatus):
     file_path: Optional[str] = None
     file_name: Optional[str] = None
@@ -27,4 +42,53 @@ class InjestRequestDto(StatusRequestDto):
     original_file_name: str
     file_type: str
     process_type: str
-    namespace: Optional[str] = config_settings.PINECONE_DEFAULT_DEV_NAMESPACE
\ No newline at end of file
+    namespace: Optional[str] = config_settings.PINECONE_DEFAULT_DEV_NAMESPACE
+    pdf_backend: Optional[Literal["pypdf", "pymupdf"]] = None
+    docx_mode: Optional[Literal["fast", "accurate"]] = None
+    priority: Optional[Literal["interactive", "bulk"]] = None
+
+
+class BulkInjestRequestDto(StatusRequestDto):
+    """Payload of a bulk injestion job: files of one namespace, pushed as one chunk stream."""
+    namespace: Optional[str] = config_settings.PINECONE_DEFAULT_DEV_NAMESPACE
+    files: List[InjestRequestDto]
+    priority: Optional[Literal["interactive", "bulk"]] = "bulk"
+    # Directory the files were extracted to, removed once the job is finished.
+    work_directory: Optional[str] = None
+
+
+class BulkInjestionResponseDto(BaseModel):
+    total_files: int = 0
+    completed_files: int = 0
+    failed_files: int = 0
+    files: List[FileInjestionResponseDto] = []
+
+
+class InjestJobResponseDto(RequestStatus):
+    job_id: str
+    file_name: Optional[str] = None
+    original_file_name: Optional[str] = None
+
+
+class BulkInjestJobResponseDto(RequestStatus):
+    job_id: str
+    namespace: Optional[str] = None
+    total_files: int = 0
+
+
+class UploadResponseDto(InjestJobResponseDto):
+    content_hash: Optional[str] = None
+    total_bytes: Optional[int] = None
+
+
+class JobStatusResponseDto(BaseModel):
+    job_id: str
+    request_id: int
+    status: RequestStatusEnum
+    priority: Optional[str] = None
+    attempts: int = 0
+    progress: Dict[str, Any] = {}
+    result: Optional[Dict[str, Any]] = None
+    error_detail: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
@@ -0,0 +1,155 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+from domains.injestion.embedding_scheduler import embedding_priority
+from domains.settings import config_settings
+
+
+class _PendingBatch:
+    def __init__(self, embeddings: Embeddings, deadline: float) -> None:
+        self.embeddings = embeddings
+        self.deadline = deadline
+        self.texts: List[str] = []
+        self.futures: List[Future] = []
+
+
+class QueryEmbeddingBatcher:
+    """
+    Coalesces concurrent query embeddings into batched provider requests.
+
+    The first query for a model opens a batch that is sent ``window_ms`` later, or as soon
+    as it holds ``max_batch_size`` queries. The batch goes out as one embed_documents call
+    at interactive priority, and every waiting caller gets its own vector back. Identical
+    queries in a batch are embedded once.
+
+    Batches are collected from any thread: the vector stores run their sync search in an
+    executor, so most queries arrive through the blocking ``embed``. Async callers await
+    the same futures without holding a thread. One flusher thread sends batches whose
+    window has passed, and the sends run on a small pool so a slow request does not hold
+    back the next batch.
+    """
+
+    def __init__(
+            self,
+            window_ms: float = config_settings.QUERY_EMBEDDING_BATCH_WINDOW_MS,
+            max_batch_size: int = config_settings.QUERY_EMBEDDING_BATCH_MAX_SIZE,
+            max_concurrent_batches: int = config_settings.EMBEDDING_HTTP_MAX_CONNECTIONS,
+    ) -> None:
+        self.window = window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self.max_concurrent_batches = max_concurrent_batches
+        self.queries = 0
+        self.batches = 0
+        self._pending: Dict[str, _PendingBatch] = {}
+        self._condition = threading.Condition()
+        self._flusher: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def submit(self, embeddings: Embeddings, model_name: str, text: str) -> Future:
+        """Add ``text`` to the open batch for ``model_name`` and return the future of its vector."""
+        future: Future = Future()
+        with self._condition:
+            batch = self._pending.get(model_name)
+            if batch is None:
+                batch = self._pending[model_name] = _PendingBatch(embeddings, time.monotonic() + self.window)
+            batch.texts.append(text)
+            batch.futures.append(future)
+
+            if len(batch.texts) >= self.max_batch_size:
+                self._dispatch(self._pending.pop(model_name))
+            else:
+                self._start_flusher()
+                self._condition.notify()
+        return future
+
+    def embed(self, embeddings: Embeddings, model_name: str, text: str) -> List[float]:
+        return self.submit(embeddings, model_name, text).result()
+
+    async def aembed(self, embeddings: Embeddings, model_name: str, text: str) -> List[float]:
+        return await asyncio.wrap_future(self.submit(embeddings, model_name, text))
+
+    def _start_flusher(self) -> None:
+        if self._flusher is None or not self._flusher.is_alive():
+            self._flusher = threading.Thread(target=self._flush_loop, name="query-embedding-batcher", daemon=True)
+            self._flusher.start()
+
+    def _dispatch(self, batch: _PendingBatch) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrent_batches, thread_name_prefix="query-embedding-batch"
+            )
+        self._executor.submit(self._send, batch)
+
+    def _flush_loop(self) -> None:
+        with self._condition:
+            while True:
+                if not self._pending:
+                    self._condition.wait()
+                    continue
+
+                now = time.monotonic()
+                for model_name in [name for name, batch in self._pending.items() if batch.deadline <= now]:
+                    self._dispatch(self._pending.pop(model_name))
+
+                if self._pending:
+                    self._condition.wait(min(batch.deadline for batch in self._pending.values()) - now)
+
+    def _send(self, batch: _PendingBatch) -> None:
+        unique_texts = list(dict.fromkeys(batch.texts))
+        with self._condition:
+            self.queries += len(batch.texts)
+            self.batches += 1
+
+        try:
+            with embedding_priority("interactive"):
+                vectors = dict(zip(unique_texts, batch.embeddings.embed_documents(unique_texts)))
+        except Exception as e:
+            for future in batch.futures:
+                future.set_exception(e)
+            return
+
+        for text, future in zip(batch.texts, batch.futures):
+            future.set_result(vectors[text])
+
+    def stats(self) -> Dict[str, float]:
+        with self._condition:
+            return {
+                "queries": self.queries,
+                "batches": self.batches,
+                "average_batch_size": self.queries / self.batches if self.batches else 0.0,
+            }
+
+
+class CoalescedQueryEmbeddings(Embeddings):
+    """
+    Embeddings whose queries, sync and async, go through the query batcher. Document
+    embeddings are passed straight to the provider.
+
+    Only for providers that embed queries and documents the same way (OpenAI-compatible
+    APIs), since a batched query is sent as a document embedding.
+    """
+
+    def __init__(self, underlying: Callable[[], Embeddings], model_name: str, batcher: QueryEmbeddingBatcher) -> None:
+        self.underlying = underlying
+        self.model_name = model_name
+        self.batcher = batcher
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.underlying().embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.underlying().aembed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.batcher.embed(self.underlying(), self.model_name, text)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await self.batcher.aembed(self.underlying(), self.model_name, text)
+
+
+query_embedding_batcher = QueryEmbeddingBatcher()
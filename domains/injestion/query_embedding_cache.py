@@ -0,0 +1,147 @@
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+from domains.injestion.embedding_cache import EmbeddingCacheStore
+from domains.settings import config_settings
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(text: str) -> str:
+    """NFKC-normalize the query and collapse runs of whitespace, so trivially different spellings share a vector."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+class QueryEmbeddingCache:
+    """
+    In-process LRU cache of query vectors keyed by (embedding model, normalized query).
+
+    Entries expire ``ttl`` seconds after they were computed and the least recently used
+    ones are dropped past ``max_entries``. With ``disk_path`` set, misses fall back to a
+    disk-backed EmbeddingCacheStore before reaching the provider, so popular questions
+    survive restarts and are shared between processes.
+    """
+
+    def __init__(
+            self,
+            max_entries: int = config_settings.QUERY_EMBEDDING_CACHE_MAX_ENTRIES,
+            ttl: float = config_settings.QUERY_EMBEDDING_CACHE_TTL,
+            disk_path: Optional[str] = (
+                    config_settings.QUERY_EMBEDDING_CACHE_PATH
+                    if config_settings.QUERY_EMBEDDING_CACHE_DISK_STATUS else None
+            ),
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.disk_path = disk_path
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, List[float]]]" = OrderedDict()
+        self._disk: Optional[EmbeddingCacheStore] = None
+        self._lock = threading.Lock()
+
+    def _disk_store(self) -> Optional[EmbeddingCacheStore]:
+        if self.disk_path and self._disk is None:
+            self._disk = EmbeddingCacheStore(db_path=self.disk_path, max_entries=self.max_entries * 10)
+        return self._disk
+
+    def get(self, model_name: str, query: str) -> Optional[List[float]]:
+        key = (model_name, query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, vector = entry
+                if expires_at >= time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return vector
+                del self._entries[key]
+
+        disk = self._disk_store()
+        if disk is not None:
+            disk_key = disk.make_key(model_name, query)
+            vector = disk.get_many([disk_key]).get(disk_key)
+            if vector is not None:
+                self._remember(key, vector)
+                with self._lock:
+                    self.disk_hits += 1
+                return vector
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, model_name: str, query: str, vector: List[float]) -> None:
+        self._remember((model_name, query), vector)
+        disk = self._disk_store()
+        if disk is not None:
+            disk.put_many({disk.make_key(model_name, query): vector})
+
+    def _remember(self, key: Tuple[str, str], vector: List[float]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, vector)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            total = self.hits + self.disk_hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "hit_rate": (self.hits + self.disk_hits) / total if total else 0.0,
+            }
+
+
+class CachedQueryEmbeddings(Embeddings):
+    """
+    Embeddings for the retrieval path: queries are normalized and served from the query
+    embedding cache, documents go straight to the provider.
+
+    ``underlying`` is resolved on every call rather than held, so a vector store cached
+    with ``lru_cache`` keeps using the registry's client for the current event loop.
+    """
+
+    def __init__(self, underlying: Callable[[], Embeddings], model_name: str, cache: QueryEmbeddingCache) -> None:
+        self.underlying = underlying
+        self.model_name = model_name
+        self.cache = cache
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.underlying().embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.underlying().aembed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        query = normalize_query(text)
+        vector = self.cache.get(self.model_name, query)
+        if vector is None:
+            vector = self.underlying().embed_query(query)
+            self.cache.put(self.model_name, query, vector)
+        return vector
+
+    async def aembed_query(self, text: str) -> List[float]:
+        query = normalize_query(text)
+        vector = self.cache.get(self.model_name, query)
+        if vector is None:
+            vector = await self.underlying().aembed_query(query)
+            self.cache.put(self.model_name, query, vector)
+        return vector
+
+
+query_embedding_cache = QueryEmbeddingCache()
@@ -1,68 +1,290 @@
 import asyncio
+import os
+import queue
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Literal, Optional, Set, Tuple
 
-from domains.injestion.doc_loader import file_loader
-from domains.injestion.models import InjestRequestDto, FileInjestionResponseDto
+from langchain_core.documents import Document
+
+from domains.injestion.archive import extract_archive
+from domains.injestion.checkpoint import checkpoint_store, compute_file_hash
+
+from domains.injestion.doc_loader import LoadStats, lazy_file_loader
+from domains.injestion.downloader import is_url, url_downloader
+from domains.injestion.embedding_scheduler import embedding_priority
+from domains.injestion.job_queue import job_queue
+from domains.injestion.upload import UploadTooLargeError, remove_spooled_upload, spool_upload
+from domains.injestion.models import (
+    BulkInjestJobResponseDto,
+    BulkInjestRequestDto,
+    BulkInjestionResponseDto,
+    FileInjestionResponseDto,
+    InjestJobResponseDto,
+    InjestRequestDto,
+    JobStatusResponseDto,
+    UploadResponseDto,
+)
 from domains.models import RequestStatus, ApiNameEnum, RequestStatusEnum
 from domains.injestion.utils import update_status
-from domains.vector_db.utils import push_to_database
+from domains.vector_db.utils import push_to_database_in_batches
 from domains.settings import config_settings
-from domains.status_util import call_update_status_api
+from domains.status_util import call_update_status_api, report_progress
 
 from loguru import logger
 
-from fastapi import APIRouter, BackgroundTasks
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
 
 router = APIRouter(tags=["injestion"])
 
 
 @router.post(
     "/injest-doc",
-    summary="Injests a document into the database",
-    description="Injests a document into the database",
+    summary="Queues a document for injestion into the database",
+    description="Queues a document for injestion and returns the id of the job processing it",
 )
 async def injest_doc(
         request: InjestRequestDto,
-) -> FileInjestionResponseDto:
+) -> InjestJobResponseDto:
     logger.info(f"injest-doc request: {request.model_dump_json()}")
 
     try:
-        logger.info(f"Processing file: {request.file_name}")
+        job_id = job_queue.enqueue(request)
 
-        response = await load_file_push_to_db(request)
+        return InjestJobResponseDto(
+            request_id=request.request_id,
+            status=RequestStatusEnum.QUEUED,
+            job_id=job_id,
+            file_name=request.file_name,
+            original_file_name=request.original_file_name,
+            api_name=ApiNameEnum.INJEST_DOC,
+        )
 
-        if response.status == RequestStatusEnum.COMPLETED:
-            return FileInjestionResponseDto(
-                request_id=request.request_id,
-                status=RequestStatusEnum.COMPLETED,
-                file_path=request.pre_signed_url,
-                file_name=request.file_name,
-                original_file_name=request.original_file_name,
-                total_pages=response.data_json.get("total_pages", 0),
-                api_name=ApiNameEnum.INJEST_DOC,
-            )
+    except Exception as e:
+        logger.exception("Failed to queue file")
+        raise HTTPException(status_code=500, detail=f"Failed to queue file: {e}")
 
-        elif response.status == RequestStatusEnum.FAILED:
-            return FileInjestionResponseDto(
-                request_id=request.request_id,
-                status=RequestStatusEnum.FAILED,
-                file_name=request.file_name,
-                original_file_name=request.original_file_name,
-                error_detail=response.error_detail,
-                total_pages=0,
-                api_name=ApiNameEnum.INJEST_DOC
+
+@router.post(
+    "/upload",
+    summary="Streams a document to disk and queues it for injestion",
+    description="Takes the document as a multipart file part or as the raw request body, "
+                "spools it to disk while hashing it and queues it for injestion",
+)
+async def upload_doc(
+        request: Request,
+        request_id: int,
+        file_name: Optional[str] = None,
+        namespace: Optional[str] = config_settings.PINECONE_DEFAULT_DEV_NAMESPACE,
+        priority: Literal["interactive", "bulk"] = "interactive",
+) -> UploadResponseDto:
+    logger.info(f"upload request for {file_name or 'multipart file'} into namespace: {namespace}")
+
+    try:
+        upload = await spool_upload(request, file_name=file_name)
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid upload: {e}")
+
+    file_type = upload.file_name.rsplit(".", 1)[-1].lower()
+    try:
+        job_id = job_queue.enqueue(
+            InjestRequestDto(
+                request_id=request_id,
+                pre_signed_url=str(upload.path),
+                file_name=upload.file_name,
+                original_file_name=upload.file_name,
+                file_type=file_type,
+                process_type=file_type,
+                namespace=namespace,
+                priority=priority,
             )
+        )
+    except Exception as e:
+        logger.exception("Failed to queue uploaded file")
+        remove_spooled_upload(str(upload.path))
+        raise HTTPException(status_code=500, detail=f"Failed to queue file: {e}")
+
+    return UploadResponseDto(
+        request_id=request_id,
+        status=RequestStatusEnum.QUEUED,
+        job_id=job_id,
+        file_name=upload.file_name,
+        original_file_name=upload.file_name,
+        api_name=ApiNameEnum.INJEST_DOC,
+        content_hash=upload.content_hash,
+        total_bytes=upload.total_bytes,
+    )
+
 
+@router.get(
+    "/jobs/{job_id}",
+    summary="Reports the progress of an injestion job",
+    description="Reports the status, progress counters and result of an injestion job",
+)
+async def get_job_status(job_id: str) -> JobStatusResponseDto:
+    job_status = job_queue.get(job_id)
+
+    if job_status is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+    return job_status
+
+
+@router.post(
+    "/injest-docs",
+    summary="Queues many documents for injestion into the database",
+    description="Queues one bulk job per namespace; the files of a job are parsed concurrently "
+                "and pushed in shared embedding batches. Poll /jobs/{job_id} for the result",
+)
+async def injest_docs(
+        requests: List[InjestRequestDto],
+) -> List[BulkInjestJobResponseDto]:
+    logger.info(f"injest-docs request for {len(requests)} files")
+
+    requests_by_namespace: Dict[str, List[InjestRequestDto]] = {}
+    for request in requests:
+        namespace = request.namespace or config_settings.PINECONE_DEFAULT_DEV_NAMESPACE
+        requests_by_namespace.setdefault(namespace, []).append(
+            request.model_copy(update={"namespace": namespace, "priority": "bulk"})
+        )
+
+    try:
+        return [
+            _enqueue_bulk_job(BulkInjestRequestDto(request_id=files[0].request_id, namespace=namespace, files=files))
+            for namespace, files in requests_by_namespace.items()
+        ]
     except Exception as e:
-        logger.exception("Failed to process file")
-        return FileInjestionResponseDto(
+        logger.exception("Failed to queue files")
+        raise HTTPException(status_code=500, detail=f"Failed to queue files: {e}")
+
+
+@router.post(
+    "/injest-archive",
+    summary="Queues every document of a zip or tar archive for injestion",
+    description="Takes the archive as the raw request body, extracts its pdf, txt and docx members "
+                "and queues them as one bulk job. Poll /jobs/{job_id} for the result",
+)
+async def injest_archive(
+        request: Request,
+        archive_name: str,
+        request_id: int,
+        namespace: Optional[str] = config_settings.PINECONE_DEFAULT_DEV_NAMESPACE,
+) -> BulkInjestJobResponseDto:
+    logger.info(f"injest-archive request for {archive_name} into namespace: {namespace}")
+
+    await asyncio.to_thread(os.makedirs, config_settings.UPLOAD_FOLDER, exist_ok=True)
+    work_dir = await asyncio.to_thread(tempfile.mkdtemp, dir=config_settings.UPLOAD_FOLDER)
+    queued = False
+    try:
+        archive_path = Path(work_dir) / Path(archive_name).name
+        try:
+            await _receive_archive(request, archive_path)
+        except UploadTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+
+        files_dir = Path(work_dir) / "files"
+        try:
+            file_paths = await asyncio.to_thread(extract_archive, archive_path, files_dir)
+        except (ValueError, OSError) as e:
+            raise HTTPException(status_code=400, detail=f"Invalid archive: {e}")
+        await asyncio.to_thread(archive_path.unlink)
+
+        files = [
+            InjestRequestDto(
+                request_id=request_id,
+                pre_signed_url=str(file_path),
+                file_name=file_path.relative_to(files_dir).as_posix(),
+                original_file_name=file_path.relative_to(files_dir).as_posix(),
+                file_type=file_path.suffix.lstrip(".").lower(),
+                process_type=file_path.suffix.lstrip(".").lower(),
+                namespace=namespace,
+                priority="bulk",
+            )
+            for file_path in file_paths
+        ]
+
+        try:
+            response = _enqueue_bulk_job(
+                BulkInjestRequestDto(request_id=request_id, namespace=namespace, files=files, work_directory=work_dir)
+            )
+        except Exception as e:
+            logger.exception("Failed to queue archive")
+            raise HTTPException(status_code=500, detail=f"Failed to queue archive: {e}")
+
+        # The extracted files belong to the job from here on; the worker removes them.
+        queued = True
+        return response
+    finally:
+        if not queued:
+            await asyncio.to_thread(shutil.rmtree, work_dir, ignore_errors=True)
+
+
+def _enqueue_bulk_job(request: BulkInjestRequestDto) -> BulkInjestJobResponseDto:
+    return BulkInjestJobResponseDto(
+        request_id=request.request_id,
+        status=RequestStatusEnum.QUEUED,
+        api_name=ApiNameEnum.INJEST_DOC,
+        job_id=job_queue.enqueue(request),
+        namespace=request.namespace,
+        total_files=len(request.files),
+    )
+
+
+async def _receive_archive(
+        request: Request,
+        archive_path: Path,
+        max_bytes: int = config_settings.BULK_INJESTION_MAX_ARCHIVE_BYTES,
+        chunk_size: int = config_settings.UPLOAD_SPOOL_CHUNK_SIZE,
+) -> None:
+    """Write the request body to ``archive_path`` from a thread, failing once it passes ``max_bytes``."""
+    archive_file = await asyncio.to_thread(open, archive_path, "wb")
+    try:
+        total_bytes = 0
+        buffer = bytearray()
+        async for block in request.stream():
+            total_bytes += len(block)
+            if total_bytes > max_bytes:
+                raise UploadTooLargeError(f"Archive exceeds {max_bytes} bytes")
+            buffer += block
+            if len(buffer) >= chunk_size:
+                await asyncio.to_thread(archive_file.write, bytes(buffer))
+                buffer.clear()
+        if buffer:
+            await asyncio.to_thread(archive_file.write, bytes(buffer))
+    finally:
+        await asyncio.to_thread(archive_file.close)
+
+
+def _build_bulk_response(
+        requests: List[InjestRequestDto],
+        statuses: List[RequestStatus],
+) -> BulkInjestionResponseDto:
+    files = [
+        FileInjestionResponseDto(
             request_id=request.request_id,
-            status=RequestStatusEnum.FAILED,
+            status=status.status,
+            api_name=ApiNameEnum.INJEST_DOC,
+            file_path=request.pre_signed_url,
             file_name=request.file_name,
             original_file_name=request.original_file_name,
-            error_detail=str(e),
-            total_pages=0,
-            api_name=ApiNameEnum.INJEST_DOC
+            total_pages=(status.data_json or {}).get("total_pages", 0),
+            error_detail=status.error_detail,
         )
+        for request, status in zip(requests, statuses)
+    ]
+    completed_files = sum(1 for file in files if file.status == RequestStatusEnum.COMPLETED)
+
+    return BulkInjestionResponseDto(
+        total_files=len(files),
+        completed_files=completed_files,
+        failed_files=len(files) - completed_files,
+        files=files,
+    )
 
 
 def sanitize_file_path(file_path: str) -> str:
@@ -72,43 +294,122 @@ def sanitize_file_path(file_path: str) -> str:
 
 
 async def load_file_push_to_db(
-        request: InjestRequestDto
+        request: InjestRequestDto,
+        progress_callback: Optional[Callable[[dict], None]] = None,
 ):
     status = None
+    downloaded_path = None
     try:
         logger.debug(f"load_file_push_to_db(): Attempting to load file from {request.pre_signed_url}")
 
         file_path = sanitize_file_path(request.pre_signed_url)
+        if is_url(file_path):
+            downloaded_path = await url_downloader.adownload(file_path, suffix=f".{request.file_type}")
+            file_path = str(downloaded_path)
+
+        namespace = request.namespace or config_settings.PINECONE_DEFAULT_DEV_NAMESPACE
+        checkpoint_key = None
+        start_batch = 0
+        if config_settings.INJESTION_CHECKPOINT_STATUS:
+            checkpoint_key = checkpoint_store.make_key(
+                config_settings.PINECONE_INDEX_NAME,
+                namespace,
+                request.file_name,
+                await asyncio.to_thread(compute_file_hash, file_path),
+                request.file_type,
+                request.pdf_backend or config_settings.PDF_PARSER_BACKEND,
+                request.docx_mode or config_settings.DOCX_LOADER_MODE,
+                config_settings.CHUNK_SIZE,
+                config_settings.CHUNK_OVERLAP,
+                config_settings.TEXT_SPLITTER_ENGINE,
+                config_settings.INJESTION_BATCH_SIZE,
+            )
+            checkpoint = checkpoint_store.get(checkpoint_key)
+            if checkpoint:
+                start_batch = checkpoint.last_batch + 1
+                logger.info(f"Resuming {request.file_name} after committed batch {checkpoint.last_batch}")
+                if progress_callback:
+                    progress_callback({"stage": "resuming", "resumed_from_batch": start_batch})
+
+        def on_batch_committed(batch_index: int, document_ids: List[str]) -> None:
+            if checkpoint_key:
+                checkpoint_store.commit_batch(checkpoint_key, batch_index, document_ids)
 
-        chunked_documents, non_chunked_docs = file_loader(
+        load_stats = LoadStats()
+        chunked_documents = lazy_file_loader(
             pre_signed_url=file_path,
             file_name=request.file_name,
             original_file_name=request.file_name,
             file_type=request.file_type,
             process_type=request.file_type,
+            stats=load_stats,
+            pdf_backend=request.pdf_backend,
+            docx_mode=request.docx_mode,
         )
-        logger.info(f"Successfully loaded file from {request.pre_signed_url} and total pages in file is {len(non_chunked_docs)}")
 
-        push_status = push_to_database(
-            texts=chunked_documents,
-            index_name=config_settings.PINECONE_INDEX_NAME,
-            namespace=request.namespace
-        )
+        def on_batch_pushed(total_documents: int) -> None:
+            progress = {
+                "stage": "pushing",
+                "pages_parsed": load_stats.total_pages,
+                "chunks_pushed": total_documents,
+            }
+            if progress_callback:
+                progress_callback(progress)
+            report_progress(
+                status_api_path="/injest-doc",
+                request_status=RequestStatus(
+                    request_id=request.request_id,
+                    api_name=ApiNameEnum.INJEST_DOC,
+                    status=RequestStatusEnum.PROCESSING,
+                    data_json=progress,
+                ),
+            )
+
+        # Parsing, embedding and upserting are blocking, keep them off the event loop.
+        # The worker thread inherits the context, so its embedding calls run at the job's priority.
+        with embedding_priority(request.priority or config_settings.INJESTION_DEFAULT_PRIORITY):
+            push_status = await asyncio.to_thread(
+                push_to_database_in_batches,
+                documents=chunked_documents,
+                index_name=config_settings.PINECONE_INDEX_NAME,
+                namespace=namespace,
+                # A resumed request must not wipe the batches it already committed.
+                drop_namespace=config_settings.DELETE_NAMESPACE_STATUS and start_batch == 0,
+                on_batch_pushed=on_batch_pushed,
+                start_batch=start_batch,
+                on_batch_committed=on_batch_committed,
+            )
+        logger.info(f"Successfully loaded file from {request.pre_signed_url} and total pages in file is {load_stats.total_pages}")
 
         if not push_status.status:
-            return RequestStatus(
+            status = RequestStatus(
                 request_id=request.request_id,
                 api_name=ApiNameEnum.INJEST_DOC,
                 status=RequestStatusEnum.FAILED,
                 error_detail=push_status.message,
             )
+            return status
+
+        if checkpoint_key:
+            checkpoint_store.clear(checkpoint_key)
+
+        if progress_callback:
+            progress_callback({
+                "stage": "pushed",
+                "total_pages": load_stats.total_pages,
+                "total_chunks": load_stats.total_chunks,
+            })
 
         # Create success status
         status = RequestStatus(
             request_id=request.request_id,
             api_name=ApiNameEnum.INJEST_DOC,
             status=RequestStatusEnum.COMPLETED,
-            data_json={"total_pages": len(non_chunked_docs)},
+            data_json={
+                "total_pages": load_stats.total_pages,
+                "total_chunks": load_stats.total_chunks,
+                "resumed_from_batch": start_batch,
+            },
         )
         logger.info("Processing completed successfully")
 
@@ -123,6 +424,9 @@ async def load_file_push_to_db(
         )
 
     finally:
+        if downloaded_path:
+            downloaded_path.unlink(missing_ok=True)
+
         if status:
             logger.info(
                 f"Completed injest-doc for file_name: {request.file_name}"
@@ -135,6 +439,209 @@ async def load_file_push_to_db(
     return status
 
 
+def bulk_load_files_push_to_db(
+        requests: List[InjestRequestDto],
+        progress_callback: Optional[Callable[[dict], None]] = None,
+        completed_files: Optional[Dict[str, dict]] = None,
+) -> List[RequestStatus]:
+    """
+    Injest many files, returning one status per request in request order.
+
+    Files of a namespace are parsed concurrently and their chunks are pushed as one
+    stream, so embedding requests are filled with chunks from several files instead of
+    one partially filled batch per file.
+
+    A file is completed once the batch holding its last chunk is committed: its status is
+    reported then, and ``progress_callback`` gets ``completed_files`` (file name to page
+    and chunk counts). Files already in ``completed_files``, from an earlier attempt of
+    the same job, are not injested again. When a batch fails to push, the files committed
+    before it stay completed and the others fail with the batch named.
+    """
+    completed_files = dict(completed_files or {})
+    statuses: List[Optional[RequestStatus]] = [None] * len(requests)
+    batch_size = config_settings.INJESTION_BATCH_SIZE
+
+    def report(index: int, status: RequestStatus) -> None:
+        logger.info(f"Completed injest-doc for file_name: {requests[index].file_name} with status: {status.status}")
+        call_update_status_api(status_api_path="/injest-doc", request_status=status)
+        statuses[index] = status
+
+    indexes_by_namespace: Dict[str, List[int]] = {}
+    resumed_namespaces: Set[str] = set()
+    for index, request in enumerate(requests):
+        if request.file_name in completed_files:
+            # Reported by the attempt that completed it.
+            statuses[index] = RequestStatus(
+                request_id=request.request_id,
+                api_name=ApiNameEnum.INJEST_DOC,
+                status=RequestStatusEnum.COMPLETED,
+                data_json=completed_files[request.file_name],
+            )
+            resumed_namespaces.add(request.namespace)
+        else:
+            indexes_by_namespace.setdefault(request.namespace, []).append(index)
+
+    for namespace, indexes in indexes_by_namespace.items():
+        load_stats = {index: LoadStats() for index in indexes}
+        parse_errors: Dict[int, str] = {}
+
+        # Parse threads stream their chunks through a bounded queue, so a namespace never
+        # holds more than a few batches of chunks in memory at once.
+        chunk_queue: "queue.Queue[Tuple[int, Optional[Document]]]" = queue.Queue(
+            maxsize=batch_size * 2
+        )
+        stop_parsing = threading.Event()
+        # Files that did not yield all their chunks; their stored chunks must survive the stale sweep.
+        incomplete_files: Set[str] = set()
+
+        # Index of the batch holding each fully parsed file's last chunk, and of the last
+        # committed batch. Both are only touched by the thread running the push.
+        last_batches: Dict[int, int] = {}
+        committed = {"through": -1}
+
+        def complete_finished_files() -> None:
+            finished = [
+                index for index, last_batch in last_batches.items()
+                if last_batch <= committed["through"] and statuses[index] is None
+            ]
+            for index in finished:
+                request = requests[index]
+                counts = {
+                    "total_pages": load_stats[index].total_pages,
+                    "total_chunks": load_stats[index].total_chunks,
+                }
+                completed_files[request.file_name] = counts
+                report(index, RequestStatus(
+                    request_id=request.request_id,
+                    api_name=ApiNameEnum.INJEST_DOC,
+                    status=RequestStatusEnum.COMPLETED,
+                    data_json=counts,
+                ))
+            if finished and progress_callback:
+                progress_callback({"completed_files": completed_files})
+
+        def parse_file(index: int) -> None:
+            request = requests[index]
+            file_path = sanitize_file_path(request.pre_signed_url)
+
+            # Each parse thread fetches its own URL, so downloads run concurrently and
+            # parsing of a file starts as soon as its download is complete.
+            downloaded_path = None
+            try:
+                if is_url(file_path):
+                    downloaded_path = url_downloader.download(file_path, suffix=f".{request.file_type}")
+                    file_path = str(downloaded_path)
+
+                for chunk in lazy_file_loader(
+                        pre_signed_url=file_path,
+                        file_name=request.file_name,
+                        original_file_name=request.file_name,
+                        file_type=request.file_type,
+                        process_type=request.file_type,
+                        stats=load_stats[index],
+                        pdf_backend=request.pdf_backend,
+                        docx_mode=request.docx_mode,
+                ):
+                    if stop_parsing.is_set():
+                        incomplete_files.add(request.file_name)
+                        break
+                    chunk_queue.put((index, chunk))
+            except Exception as e:
+                logger.error(f"Failed to parse {request.file_name}: {e}")
+                incomplete_files.add(request.file_name)
+                parse_errors[index] = f"Failed when process_type is {request.process_type}: {e}"
+            finally:
+                if downloaded_path:
+                    downloaded_path.unlink(missing_ok=True)
+                chunk_queue.put((index, None))
+
+        def parsed_chunks() -> Iterator[Document]:
+            with ThreadPoolExecutor(max_workers=config_settings.BULK_INJESTION_PARSE_WORKERS) as executor:
+                for index in indexes:
+                    executor.submit(parse_file, index)
+
+                remaining = len(indexes)
+                position = 0
+                try:
+                    while remaining:
+                        index, chunk = chunk_queue.get()
+                        if chunk is None:
+                            remaining -= 1
+                            if index not in parse_errors and requests[index].file_name not in incomplete_files:
+                                # The push batches the stream in order, so the file's last chunk
+                                # is in this batch (-1 when it had no chunks at all).
+                                last_batches[index] = (position - 1) // batch_size
+                                complete_finished_files()
+                            continue
+                        position += 1
+                        yield chunk
+                finally:
+                    # When the push stops early, unblock the parse threads and let them finish.
+                    stop_parsing.set()
+                    while remaining:
+                        if chunk_queue.get()[1] is None:
+                            remaining -= 1
+
+        def on_batch_committed(batch_index: int, document_ids: List[str]) -> None:
+            committed["through"] = batch_index
+            complete_finished_files()
+
+        def on_batch_pushed(total_documents: int) -> None:
+            if progress_callback:
+                progress_callback({"stage": "pushing", "namespace": namespace, "chunks_pushed": total_documents})
+
+        push_error = None
+        try:
+            push_status = push_to_database_in_batches(
+                documents=parsed_chunks(),
+                index_name=config_settings.PINECONE_INDEX_NAME,
+                namespace=namespace,
+                # A resumed job must not wipe the files it already committed.
+                drop_namespace=config_settings.DELETE_NAMESPACE_STATUS and namespace not in resumed_namespaces,
+                batch_size=batch_size,
+                on_batch_pushed=on_batch_pushed,
+                on_batch_committed=on_batch_committed,
+                incomplete_files=incomplete_files,
+            )
+            if not push_status.status:
+                push_error = push_status.message
+        except Exception as e:
+            logger.exception(f"Bulk push to namespace {namespace} failed")
+            push_error = str(e)
+
+        if push_error:
+            push_error = f"Batch {committed['through'] + 1} of namespace {namespace} failed to push: {push_error}"
+        else:
+            # Every batch is committed, so every fully parsed file is complete.
+            complete_finished_files()
+
+        for index in indexes:
+            if statuses[index] is None:
+                report(index, RequestStatus(
+                    request_id=requests[index].request_id,
+                    api_name=ApiNameEnum.INJEST_DOC,
+                    status=RequestStatusEnum.FAILED,
+                    error_detail=parse_errors.get(index) or push_error,
+                ))
+
+    return statuses
+
+
+def run_bulk_job(
+        request: BulkInjestRequestDto,
+        progress_callback: Optional[Callable[[dict], None]] = None,
+        completed_files: Optional[Dict[str, dict]] = None,
+) -> BulkInjestionResponseDto:
+    """Run a queued bulk injestion job; ``completed_files`` comes from the job's progress when it is retried."""
+    with embedding_priority(request.priority or "bulk"):
+        statuses = bulk_load_files_push_to_db(
+            request.files,
+            progress_callback=progress_callback,
+            completed_files=completed_files,
+        )
+    return _build_bulk_response(request.files, statuses)
+
+
 if __name__ == "__main__":
 
     import os
@@ -0,0 +1,143 @@
+import copy
+import re
+from bisect import bisect_left, bisect_right
+from typing import Any, List, Optional, Tuple
+
+from langchain_core.documents import Document
+from langchain_text_splitters import TextSplitter
+
+
+DEFAULT_SEPARATORS = ["\n\n", "\n", " ", ""]
+
+
+class FastTextSplitter(TextSplitter):
+    """
+    Drop-in replacement for RecursiveCharacterTextSplitter with its default settings.
+
+    Produces exactly the same chunks (literal separators kept at the start of each
+    piece, whitespace stripped, ``len`` as the length function), but works on offsets
+    into the original text: each recursion level finds its separator positions in one
+    regex scan, and pieces are merged with binary searches over those positions instead
+    of building and re-joining lists of substrings. Chunk offsets are therefore exact,
+    and ``add_start_index`` records them without searching for the chunk text.
+    """
+
+    def __init__(
+            self,
+            chunk_size: int = 4000,
+            chunk_overlap: int = 200,
+            separators: Optional[List[str]] = None,
+            add_start_index: bool = False,
+    ) -> None:
+        super().__init__(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            keep_separator="start",
+            add_start_index=add_start_index,
+        )
+        self._separators = separators or DEFAULT_SEPARATORS
+        self._patterns = {
+            separator: re.compile(re.escape(separator))
+            for separator in self._separators
+            if separator
+        }
+
+    def split_text(self, text: str) -> List[str]:
+        return [text[start:end] for start, end in self.split_text_with_offsets(text)]
+
+    def split_text_with_offsets(self, text: str) -> List[Tuple[int, int]]:
+        """Return the (start, end) offsets of each chunk in ``text``."""
+        spans: List[Tuple[int, int]] = []
+        self._split_span(text, 0, len(text), self._separators, spans)
+        return spans
+
+    def create_documents(
+            self, texts: List[str], metadatas: Optional[List[dict[Any, Any]]] = None
+    ) -> List[Document]:
+        metadatas = metadatas or [{}] * len(texts)
+        documents = []
+        for text, metadata in zip(texts, metadatas):
+            for start, end in self.split_text_with_offsets(text):
+                chunk_metadata = copy.deepcopy(metadata)
+                if self._add_start_index:
+                    chunk_metadata["start_index"] = start
+                documents.append(Document(page_content=text[start:end], metadata=chunk_metadata))
+        return documents
+
+    def _piece_boundaries(
+            self, text: str, start: int, end: int, separators: List[str]
+    ) -> Tuple[List[int], List[str]]:
+        """Boundaries of the pieces of text[start:end] for the first separator present in it."""
+        for index, separator in enumerate(separators):
+            if not separator:
+                return list(range(start, end + 1)), []
+
+            positions = [match.start() for match in self._patterns[separator].finditer(text, start, end)]
+            if positions:
+                boundaries = positions if positions[0] == start else [start] + positions
+                boundaries.append(end)
+                return boundaries, separators[index + 1:]
+
+        return [start, end], []
+
+    def _split_span(
+            self, text: str, start: int, end: int, separators: List[str], spans: List[Tuple[int, int]]
+    ) -> None:
+        if end <= start:
+            return
+
+        boundaries, remaining_separators = self._piece_boundaries(text, start, end, separators)
+
+        run_start = None
+        for index in range(len(boundaries) - 1):
+            piece_start, piece_end = boundaries[index], boundaries[index + 1]
+            if piece_end - piece_start < self._chunk_size:
+                if run_start is None:
+                    run_start = index
+                continue
+
+            if run_start is not None:
+                self._merge_run(text, boundaries, run_start, index, spans)
+                run_start = None
+
+            if remaining_separators:
+                self._split_span(text, piece_start, piece_end, remaining_separators, spans)
+            else:
+                spans.append((piece_start, piece_end))
+
+        if run_start is not None:
+            self._merge_run(text, boundaries, run_start, len(boundaries) - 1, spans)
+
+    def _merge_run(
+            self, text: str, boundaries: List[int], low: int, high: int, spans: List[Tuple[int, int]]
+    ) -> None:
+        """
+        Merge pieces [low, high) into chunks the way TextSplitter._merge_splits does.
+
+        The current chunk is always the contiguous pieces [first, index), so its length is
+        a difference of boundaries. Both the piece that overflows it and the pieces
+        _merge_splits pops one at a time to keep the overlap are found with binary searches.
+        """
+        first = low
+        while True:
+            # Pieces [first, index) fit in one chunk; piece ``index`` would overflow it.
+            index = bisect_right(boundaries, boundaries[first] + self._chunk_size, first + 1, high + 1) - 1
+            if index >= high:
+                break
+
+            self._append_stripped(text, boundaries[first], boundaries[index], spans)
+            within_overlap = bisect_left(boundaries, boundaries[index] - self._chunk_overlap, first, index + 1)
+            fits_next_piece = bisect_left(
+                boundaries, boundaries[index + 1] - self._chunk_size, first, index + 1
+            )
+            first = max(within_overlap, min(fits_next_piece, index))
+
+        self._append_stripped(text, boundaries[first], boundaries[high], spans)
+
+    @staticmethod
+    def _append_stripped(text: str, start: int, end: int, spans: List[Tuple[int, int]]) -> None:
+        chunk = text[start:end]
+        stripped = chunk.strip()
+        if stripped:
+            start += len(chunk) - len(chunk.lstrip())
+            spans.append((start, start + len(stripped)))
@@ -0,0 +1,119 @@
+import codecs
+import mmap
+import os
+from typing import Iterator
+
+from langchain_core.document_loaders import BaseLoader
+from langchain_core.documents import Document
+from loguru import logger
+
+from domains.settings import config_settings
+
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def detect_encoding(sample: bytes) -> str:
+    """
+    Guess the encoding of a file from a sample of its first bytes.
+
+    A byte order mark wins, then UTF-8 (the sample may end inside a character, so it is
+    decoded incrementally), then charset_normalizer's best guess, then latin-1, which
+    decodes any byte sequence.
+    """
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+
+    try:
+        from charset_normalizer import from_bytes
+    except ImportError:
+        return "latin-1"
+
+    match = from_bytes(sample).best()
+    return match.encoding if match is not None else "latin-1"
+
+
+def _cut_position(text: str) -> int:
+    """Where to end a block so the splitter never sees a paragraph or line cut in half."""
+    for separator in ("\n\n", "\n"):
+        position = text.rfind(separator)
+        if position > 0:
+            return position + len(separator)
+    return len(text)
+
+
+class MappedTextLoader(BaseLoader):
+    """
+    Text loader for files too large to hold in memory as one string.
+
+    The file is memory-mapped and decoded ``block_size`` bytes at a time with an
+    incremental decoder, so multi-byte characters split across blocks are decoded
+    correctly. Each document ends at the last paragraph (or line) break of its block and
+    the remainder is carried into the next one, so documents can be split one by one
+    without cutting through a paragraph. Memory use depends on ``block_size``, not on
+    the file size.
+    """
+
+    def __init__(
+            self,
+            file_path: str,
+            encoding: str | None = None,
+            block_size: int = config_settings.TXT_STREAM_BLOCK_SIZE,
+            sample_size: int = config_settings.TXT_ENCODING_SAMPLE_BYTES,
+    ) -> None:
+        self.file_path = str(file_path)
+        self.encoding = encoding
+        self.block_size = block_size
+        self.sample_size = sample_size
+
+    @staticmethod
+    def _release(mapped: mmap.mmap, start: int, end: int) -> int:
+        """
+        Drop decoded pages in ``[start, end)`` from the process, which would otherwise keep
+        every page it has read resident. Returns the offset released up to.
+        """
+        end = min(end, len(mapped)) // mmap.PAGESIZE * mmap.PAGESIZE
+        if end > start and hasattr(mmap, "MADV_DONTNEED"):
+            mapped.madvise(mmap.MADV_DONTNEED, start, end - start)
+            return end
+        return start
+
+    def lazy_load(self) -> Iterator[Document]:
+        if os.path.getsize(self.file_path) == 0:
+            return
+
+        with open(self.file_path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, "madvise"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+            encoding = self.encoding or detect_encoding(mapped[:max(self.sample_size, len(codecs.BOM_UTF32))])
+            decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+            logger.info(f"Streaming {self.file_path} ({len(mapped)} bytes) as {encoding}")
+
+            carry = ""
+            block_index = released = 0
+            for offset in range(0, len(mapped), self.block_size):
+                end = offset + self.block_size
+                text = carry + decoder.decode(mapped[offset:end], final=end >= len(mapped))
+                released = self._release(mapped, released, end)
+                cut = _cut_position(text) if end < len(mapped) else len(text)
+                carry = text[cut:]
+
+                if text[:cut].strip():
+                    yield Document(
+                        page_content=text[:cut],
+                        metadata={"source": self.file_path, "block_index": block_index, "encoding": encoding},
+                    )
+                    block_index += 1
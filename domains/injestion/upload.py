@@ -0,0 +1,210 @@
+import asyncio
+import hashlib
+import os
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from fastapi import Request
+from loguru import logger
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from domains.injestion.models import FILE_TYPE
+from domains.settings import config_settings
+
+
+class UploadTooLargeError(ValueError):
+    """Raised when an upload exceeds its size limit (UPLOAD_MAX_BYTES for /upload)."""
+    pass
+
+
+@dataclass
+class SpooledUpload:
+    path: Path
+    file_name: str
+    content_hash: str
+    total_bytes: int
+
+
+class _SpoolWriter:
+    """
+    Writes an upload to the spool folder in fixed-size blocks, hashing it on the way.
+
+    ``feed`` only buffers and never touches the disk, so it is safe to call from the
+    synchronous multipart callbacks; ``flush`` writes the full blocks from a thread.
+    """
+
+    def __init__(self, file_name: str, chunk_size: int, max_bytes: int) -> None:
+        self.file_name = file_name
+        self.chunk_size = chunk_size
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._hash = hashlib.sha256()
+        self._buffer = bytearray()
+
+        os.makedirs(config_settings.UPLOAD_SPOOL_FOLDER, exist_ok=True)
+        self.path = Path(config_settings.UPLOAD_SPOOL_FOLDER) / f"{uuid.uuid4().hex}{Path(file_name).suffix.lower()}"
+        self._file = open(self.path, "wb", buffering=0)
+
+    def feed(self, data: bytes) -> None:
+        self.total_bytes += len(data)
+        if self.total_bytes > self.max_bytes:
+            raise UploadTooLargeError(f"Upload exceeds {self.max_bytes} bytes")
+        self._hash.update(data)
+        self._buffer += data
+
+    def _write_blocks(self, final: bool) -> None:
+        written = 0
+        while len(self._buffer) - written >= self.chunk_size:
+            self._file.write(self._buffer[written:written + self.chunk_size])
+            written += self.chunk_size
+        if final and written < len(self._buffer):
+            self._file.write(self._buffer[written:])
+            written = len(self._buffer)
+        del self._buffer[:written]
+
+    async def flush(self, final: bool = False) -> None:
+        if len(self._buffer) >= self.chunk_size or final:
+            await asyncio.to_thread(self._write_blocks, final)
+
+    async def close(self) -> SpooledUpload:
+        await self.flush(final=True)
+        self._file.close()
+        return SpooledUpload(
+            path=self.path,
+            file_name=self.file_name,
+            content_hash=self._hash.hexdigest(),
+            total_bytes=self.total_bytes,
+        )
+
+    def discard(self) -> None:
+        self._file.close()
+        self.path.unlink(missing_ok=True)
+
+
+def _validate_file_name(file_name: Optional[str]) -> str:
+    if not file_name:
+        raise ValueError("A file name is required")
+
+    file_name = Path(file_name).name
+    if file_name.rsplit(".", 1)[-1].lower() not in FILE_TYPE:
+        raise ValueError(f"{file_name} is not a supported file type. Supported types are: {', '.join(FILE_TYPE)}")
+    return file_name
+
+
+async def _spool_raw_body(request: Request, file_name: Optional[str], chunk_size: int, max_bytes: int) -> SpooledUpload:
+    writer = _SpoolWriter(_validate_file_name(file_name), chunk_size, max_bytes)
+    try:
+        async for block in request.stream():
+            writer.feed(block)
+            await writer.flush()
+        return await writer.close()
+    except BaseException:
+        writer.discard()
+        raise
+
+
+async def _spool_multipart_body(
+        request: Request,
+        boundary: bytes,
+        file_name: Optional[str],
+        chunk_size: int,
+        max_bytes: int,
+) -> SpooledUpload:
+    """Spool the first file part of a multipart/form-data body; other parts are ignored."""
+    state = {"header_field": b"", "header_value": b"", "headers": {}, "capturing": False, "done": False}
+    writers = []
+
+    def on_part_begin() -> None:
+        state["headers"] = {}
+
+    def on_header_field(data: bytes, start: int, end: int) -> None:
+        state["header_field"] += data[start:end]
+
+    def on_header_value(data: bytes, start: int, end: int) -> None:
+        state["header_value"] += data[start:end]
+
+    def on_header_end() -> None:
+        state["headers"][state["header_field"].lower()] = state["header_value"]
+        state["header_field"] = state["header_value"] = b""
+
+    def on_headers_finished() -> None:
+        _, options = parse_options_header(state["headers"].get(b"content-disposition", b""))
+        part_file_name = options.get(b"filename")
+        if part_file_name is not None and not state["done"]:
+            writers.append(_SpoolWriter(
+                _validate_file_name(file_name or part_file_name.decode("utf-8", "replace")),
+                chunk_size,
+                max_bytes,
+            ))
+            state["capturing"] = True
+
+    def on_part_data(data: bytes, start: int, end: int) -> None:
+        if state["capturing"]:
+            writers[0].feed(data[start:end])
+
+    def on_part_end() -> None:
+        if state["capturing"]:
+            state["capturing"] = False
+            state["done"] = True
+
+    parser = MultipartParser(boundary, callbacks={
+        "on_part_begin": on_part_begin,
+        "on_header_field": on_header_field,
+        "on_header_value": on_header_value,
+        "on_header_end": on_header_end,
+        "on_headers_finished": on_headers_finished,
+        "on_part_data": on_part_data,
+        "on_part_end": on_part_end,
+    })
+
+    try:
+        async for block in request.stream():
+            parser.write(block)
+            if writers:
+                await writers[0].flush()
+        parser.finalize()
+
+        if not state["done"]:
+            raise ValueError("The multipart body has no complete file part")
+        return await writers[0].close()
+    except BaseException:
+        if writers:
+            writers[0].discard()
+        raise
+
+
+async def spool_upload(
+        request: Request,
+        file_name: Optional[str] = None,
+        chunk_size: int = config_settings.UPLOAD_SPOOL_CHUNK_SIZE,
+        max_bytes: int = config_settings.UPLOAD_MAX_BYTES,
+) -> SpooledUpload:
+    """
+    Stream an upload to the spool folder without holding it in memory.
+
+    Accepts either a multipart/form-data body, whose first file part is stored, or the
+    raw file as the body, in which case ``file_name`` is required.
+    """
+    content_type, options = parse_options_header(request.headers.get("content-type", ""))
+
+    if content_type == b"multipart/form-data":
+        if b"boundary" not in options:
+            raise ValueError("The multipart body has no boundary")
+        upload = await _spool_multipart_body(request, options[b"boundary"], file_name, chunk_size, max_bytes)
+    else:
+        upload = await _spool_raw_body(request, file_name, chunk_size, max_bytes)
+
+    logger.info(f"Spooled {upload.file_name} ({upload.total_bytes} bytes, sha256 {upload.content_hash}) to {upload.path}")
+    return upload
+
+
+def is_spooled_upload(file_path: str) -> bool:
+    return Path(file_path).resolve().is_relative_to(Path(config_settings.UPLOAD_SPOOL_FOLDER).resolve())
+
+
+def remove_spooled_upload(file_path: str) -> None:
+    """Delete a spooled upload once its job is finished; paths outside the spool folder are left alone."""
+    if is_spooled_upload(file_path):
+        Path(file_path).unlink(missing_ok=True)
@@ -1,40 +1,190 @@
-from langchain_openai import OpenAIEmbeddings
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
-from domains.settings import config_settings
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+from functools import lru_cache
+from typing import Iterable, Iterator
+
+from domains.settings import DEFAULT_EMBEDDING_DIMENSION, config_settings
+from langchain_text_splitters import RecursiveCharacterTextSplitter, TextSplitter
 from langchain_core.documents import Document
 from domains.models import RequestStatus
 from domains.status_util import call_update_status_api
 
 
-def split_text(text: list[Document], CHUNK_SIZE: int, CHUNK_OVERLAP: int) -> list[Document]:
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=CHUNK_SIZE,
-        chunk_overlap=CHUNK_OVERLAP
+@lru_cache(maxsize=8)
+def _build_text_splitter(CHUNK_SIZE: int, CHUNK_OVERLAP: int, engine: str) -> TextSplitter:
+    if engine == "fast":
+        from domains.injestion.splitter import FastTextSplitter
+
+        return FastTextSplitter(chunk_size=int(CHUNK_SIZE), chunk_overlap=int(CHUNK_OVERLAP))
+
+    return RecursiveCharacterTextSplitter(
+        chunk_size=int(CHUNK_SIZE),
+        chunk_overlap=int(CHUNK_OVERLAP)
     )
-    return text_splitter.split_documents(text)
+
+
+def get_text_splitter(CHUNK_SIZE: int, CHUNK_OVERLAP: int) -> TextSplitter:
+    """Shared splitter for the configured TEXT_SPLITTER_ENGINE; both engines produce the same chunks."""
+    return _build_text_splitter(CHUNK_SIZE, CHUNK_OVERLAP, config_settings.TEXT_SPLITTER_ENGINE)
+
+
+def split_text(text: list[Document], CHUNK_SIZE: int, CHUNK_OVERLAP: int) -> list[Document]:
+    return get_text_splitter(CHUNK_SIZE, CHUNK_OVERLAP).split_documents(text)
+
+
+def split_documents_lazily(
+        documents: Iterable[Document],
+        CHUNK_SIZE: int,
+        CHUNK_OVERLAP: int
+) -> Iterator[Document]:
+    """Split documents one at a time, yielding chunks as soon as each page is split."""
+    text_splitter = get_text_splitter(CHUNK_SIZE, CHUNK_OVERLAP)
+    for document in documents:
+        yield from text_splitter.split_documents([document])
+
+
+def get_embedding_service() -> str:
+    """The embeddings provider: EMBEDDING_SERVICE when set, otherwise LLM_SERVICE."""
+    return config_settings.EMBEDDING_SERVICE or config_settings.LLM_SERVICE
+
+
+def get_embedding_model_name(
+        model_key: str = "EMBEDDING_MODEL_NAME"
+) -> str | None:
+    if get_embedding_service() == "local":
+        from domains.injestion.local_embeddings import local_embedding_model_name
+
+        return local_embedding_model_name()
+    if get_embedding_service() == "google":
+        return config_settings.GOOGLE_MODEL_SETTINGS.get(model_key, None)
+    return config_settings.LLMS.get(model_key, None)
+
+
+# Native widths of the models that accept a ``dimensions`` parameter and return shortened vectors.
+SHORTENABLE_EMBEDDING_MODELS = {
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+}
+
+
+def get_embedding_dimensions(
+        model_key: str = "EMBEDDING_MODEL_NAME"
+) -> int | None:
+    """
+    The ``dimensions`` to request from the provider: EMBEDDING_DIMENSION when the model
+    can shorten its vectors and it differs from the native width, otherwise None.
+    """
+    if get_embedding_service() not in ("openai", "groq"):
+        return None
+    native_dimension = SHORTENABLE_EMBEDDING_MODELS.get(get_embedding_model_name(model_key))
+    if native_dimension is None or native_dimension == config_settings.EMBEDDING_DIMENSION:
+        return None
+    return config_settings.EMBEDDING_DIMENSION
+
+
+def validate_embedding_dimension(
+        model_key: str = "EMBEDDING_MODEL_NAME"
+) -> None:
+    """
+    Raise at startup when the embeddings model cannot return EMBEDDING_DIMENSION wide
+    vectors, instead of failing on the first upsert into an index of that width.
+
+    text-embedding-3 models shorten to any width up to their native one. Other models
+    (ada-002, non-OpenAI providers) always return their native width, so only the
+    default is accepted for them. Local models check their own width when loaded.
+    """
+    service = get_embedding_service()
+    if service == "local":
+        return
+
+    dimension = config_settings.EMBEDDING_DIMENSION
+    model_name = get_embedding_model_name(model_key)
+    native_dimension = SHORTENABLE_EMBEDDING_MODELS.get(model_name) if service in ("openai", "groq") else None
+    if native_dimension is not None:
+        if not 0 < dimension <= native_dimension:
+            raise ValueError(
+                f"EMBEDDING_DIMENSION={dimension} is out of range for {model_name}, "
+                f"which can return at most {native_dimension} dimensions"
+            )
+    elif dimension != DEFAULT_EMBEDDING_DIMENSION:
+        raise ValueError(
+            f"EMBEDDING_DIMENSION={dimension} needs a model that can shorten its vectors "
+            f"({', '.join(SHORTENABLE_EMBEDDING_MODELS)}); {service} model {model_name} "
+            f"returns its native width, so leave EMBEDDING_DIMENSION unset"
+        )
+
+
+def get_embedding_cache_name(
+        model_key: str = "EMBEDDING_MODEL_NAME"
+) -> str:
+    """Identifier of the embedding model in cache keys; shortened vectors get their own entries."""
+    dimensions = get_embedding_dimensions(model_key)
+    suffix = f"@{dimensions}" if dimensions else ""
+    return f"{get_embedding_service()}:{get_embedding_model_name(model_key)}{suffix}"
 
 
 def get_embeddings(
         model_key: str = "EMBEDDING_MODEL_NAME"
 ):
-    if config_settings.LLM_SERVICE == "openai":
-        return OpenAIEmbeddings(
-            model=config_settings.LLMS.get(model_key, None),
-            api_key=config_settings.OPENAI_API_KEY,
-        )
+    """
+    Shared provider embeddings from the embeddings registry, routed through the
+    process-wide embedding scheduler when it is enabled.
+    """
+    from domains.injestion.embedding_registry import embeddings_registry
 
-    elif config_settings.LLM_SERVICE == "groq":
-        return OpenAIEmbeddings(
-            model=config_settings.LLMS.get(model_key, None),
-            api_key=config_settings.GROQ_API_KEY,
-        )
+    embeddings = embeddings_registry.get(model_key=model_key)
+    # Local embeddings have no provider rate limits to schedule around.
+    if not config_settings.EMBEDDING_SCHEDULER_STATUS or embeddings is None or get_embedding_service() == "local":
+        return embeddings
 
-    elif config_settings.LLM_SERVICE == "google":
-        return GoogleGenerativeAIEmbeddings(
-            model=config_settings.GEMINI.get(model_key, None),
-            google_api_key=config_settings.GOOGLE_API_KEY
-        )
+    from domains.injestion.embedding_scheduler import ScheduledEmbeddings, embedding_scheduler
+
+    return ScheduledEmbeddings(underlying=embeddings, scheduler=embedding_scheduler)
+
+
+def get_cached_embeddings(
+        model_key: str = "EMBEDDING_MODEL_NAME"
+):
+    """Embeddings for injestion, served from the shared embedding cache when it is enabled."""
+    embeddings = get_embeddings(model_key=model_key)
+    if not config_settings.EMBEDDING_CACHE_STATUS or embeddings is None:
+        return embeddings
+
+    from domains.injestion.embedding_cache import CachedEmbeddings, embedding_cache_store
+
+    return CachedEmbeddings(
+        underlying=embeddings,
+        model_name=get_embedding_cache_name(model_key),
+        store=embedding_cache_store,
+    )
+
+
+def get_query_embeddings(
+        model_key: str = "EMBEDDING_MODEL_NAME"
+):
+    """
+    Embeddings for retrieval. Query vectors are served from the query embedding cache,
+    and concurrent async queries that miss it are coalesced into batched requests, when
+    those are enabled.
+    """
+    embeddings = get_embeddings(model_key=model_key)
+    if embeddings is None:
+        return None
+
+    model_name = get_embedding_cache_name(model_key)
+    resolve = lambda: get_embeddings(model_key=model_key)
+
+    # Google embeds queries with a different task type than documents, so they cannot be batched as documents.
+    if config_settings.QUERY_EMBEDDING_BATCH_STATUS and get_embedding_service() in ("openai", "groq", "local"):
+        from domains.injestion.query_batcher import CoalescedQueryEmbeddings, query_embedding_batcher
+
+        embeddings = CoalescedQueryEmbeddings(underlying=resolve, model_name=model_name, batcher=query_embedding_batcher)
+        resolve = lambda: embeddings
+
+    if not config_settings.QUERY_EMBEDDING_CACHE_STATUS:
+        return embeddings
+
+    from domains.injestion.query_embedding_cache import CachedQueryEmbeddings, query_embedding_cache
+
+    return CachedQueryEmbeddings(underlying=resolve, model_name=model_name, cache=query_embedding_cache)
 
 
 
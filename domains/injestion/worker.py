@@ -0,0 +1,178 @@
+import argparse
+import asyncio
+import multiprocessing
+import shutil
+import signal
+import time
+from typing import TYPE_CHECKING, List, Optional
+
+from loguru import logger
+
+from domains.models import RequestStatus, RequestStatusEnum
+from domains.settings import config_settings
+
+if TYPE_CHECKING:
+    from domains.injestion.models import InjestRequestDto
+
+
+def run_worker(worker_index: int, poll_interval: float, priorities: Optional[List[str]] = None) -> None:
+    """
+    Drain the injestion queue until the process is asked to stop.
+
+    ``priorities`` limits the worker to those job classes; by default it takes every
+    class, interactive jobs first.
+    """
+    # Imported here so every worker process builds its own vector store clients.
+    from domains.injestion.embedding_registry import embeddings_registry
+    from domains.injestion.job_queue import job_queue
+    from domains.injestion.models import BulkInjestRequestDto
+    from domains.injestion.routes import load_file_push_to_db, run_bulk_job
+    from domains.injestion.upload import remove_spooled_upload
+    from domains.status_outbox import status_outbox
+
+    stop_requested = False
+
+    def request_stop(signum, frame) -> None:
+        nonlocal stop_requested
+        logger.info(f"Worker {worker_index} received signal {signum}, stopping after current job")
+        stop_requested = True
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    async def process(job_id: str, request: "InjestRequestDto") -> RequestStatus:
+        try:
+            return await load_file_push_to_db(
+                request,
+                progress_callback=lambda progress: job_queue.update_progress(job_id, progress),
+            )
+        finally:
+            # Every job runs on a new event loop, so its async embeddings client is closed with it.
+            await embeddings_registry.aclose()
+
+    status_outbox.start()
+    if config_settings.EMBEDDING_WARMUP_STATUS:
+        embeddings_registry.warm()
+    logger.info(f"Injestion worker {worker_index} started for {', '.join(priorities or ['all'])} jobs")
+
+    while not stop_requested:
+        claimed = job_queue.claim_next(priorities)
+        if claimed is None:
+            time.sleep(poll_interval)
+            continue
+
+        job_id, request = claimed
+
+        if isinstance(request, BulkInjestRequestDto):
+            logger.info(f"Worker {worker_index} processing bulk job {job_id} for {len(request.files)} files")
+            try:
+                response = run_bulk_job(
+                    request,
+                    progress_callback=lambda progress: job_queue.update_progress(job_id, progress),
+                    # Files an earlier attempt of this job committed are not injested again.
+                    completed_files=job_queue.get(job_id).progress.get("completed_files"),
+                )
+                job_queue.complete(
+                    job_id,
+                    status=RequestStatusEnum.FAILED if response.failed_files else RequestStatusEnum.COMPLETED,
+                    result=response.model_dump(mode="json"),
+                    error_detail=(
+                        f"{response.failed_files} of {response.total_files} files failed"
+                        if response.failed_files else None
+                    ),
+                )
+            except Exception as e:
+                logger.exception(f"Worker {worker_index} failed job {job_id}")
+                job_queue.complete(job_id, status=RequestStatusEnum.FAILED, error_detail=str(e))
+
+            for file in request.files:
+                remove_spooled_upload(file.pre_signed_url)
+            if request.work_directory:
+                shutil.rmtree(request.work_directory, ignore_errors=True)
+            continue
+
+        logger.info(f"Worker {worker_index} processing job {job_id} for file_name: {request.file_name}")
+
+        try:
+            status = asyncio.run(process(job_id, request))
+            job_queue.complete(
+                job_id,
+                status=status.status,
+                result=status.data_json,
+                error_detail=status.error_detail,
+            )
+        except Exception as e:
+            logger.exception(f"Worker {worker_index} failed job {job_id}")
+            job_queue.complete(job_id, status=RequestStatusEnum.FAILED, error_detail=str(e))
+
+        # The job is finished either way, so a file spooled by /upload is no longer needed.
+        remove_spooled_upload(request.pre_signed_url)
+
+    status_outbox.stop()
+    embeddings_registry.close()
+    logger.info(f"Injestion worker {worker_index} stopped")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run injestion queue workers")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=config_settings.INJESTION_WORKER_COUNT,
+        help="Number of worker processes taking jobs of any priority",
+    )
+    parser.add_argument(
+        "--interactive-workers",
+        type=int,
+        default=config_settings.INJESTION_INTERACTIVE_WORKER_COUNT,
+        help="Number of additional worker processes reserved for interactive jobs",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=config_settings.INJESTION_WORKER_POLL_INTERVAL,
+        help="Seconds to wait before polling an empty queue again",
+    )
+    args = parser.parse_args()
+
+    from domains.injestion.utils import validate_embedding_dimension
+
+    validate_embedding_dimension()
+
+    processes = [
+        multiprocessing.Process(
+            target=run_worker,
+            args=(index, args.poll_interval),
+            name=f"injestion-worker-{index}",
+        )
+        for index in range(args.workers)
+    ] + [
+        multiprocessing.Process(
+            target=run_worker,
+            args=(index, args.poll_interval, ["interactive"]),
+            name=f"injestion-interactive-worker-{index}",
+        )
+        for index in range(args.workers, args.workers + args.interactive_workers)
+    ]
+
+    for process in processes:
+        process.start()
+
+    def stop_workers(signum, frame) -> None:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    signal.signal(signal.SIGTERM, stop_workers)
+
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        stop_workers(signal.SIGINT, None)
+        for process in processes:
+            process.join()
+
+
+if __name__ == "__main__":
+    main()
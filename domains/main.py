@@ -19,7 +19,7 @@ from logging.handlers import RotatingFileHandler
 
 from domains.injestion.models import InjestRequestDto, FileInjestionResponseDto
 from domains.models import RequestStatusEnum
-from domains.injestion.routes import injest_doc
+from domains.injestion.routes import load_file_push_to_db
 from domains.agents.routes import react_orchestrator
 from domains.retreival.models import Message
 
@@ -238,9 +238,10 @@ async def handle_file_upload(file, file_path):
         file_type=file.name.split('.')[-1],
         namespace=str(st.session_state.user),
         process_type=file.name.split('.')[-1],
+        priority="interactive",
     )
 
-    response = await injest_doc(request)
+    response = await load_file_push_to_db(request)
 
     # If ingestion was successful, add to tracked files
     if response.status == RequestStatusEnum.COMPLETED:
@@ -3,6 +3,7 @@ from enum import Enum
 
 
 class RequestStatusEnum(str, Enum):
+    QUEUED = "QUEUED"
     PROCESSING = "PROCESSING"
     COMPLETED = "COMPLETED"
     FAILED = "FAILED"
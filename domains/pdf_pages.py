@@ -0,0 +1,108 @@
+"""
+Page extraction for the PDF loaders.
+
+Kept apart from the injestion package so the spawned extraction processes only import
+the PDF parsers, not the vector store and embeddings clients that package sets up.
+"""
+from typing import Callable, Dict, Iterator, List, Optional
+
+from langchain_community.document_loaders.parsers.pdf import _purge_metadata, _validate_metadata
+from langchain_core.documents import Document
+
+
+def pdf_document_metadata(file_path: str, raw_metadata: dict, total_pages: int, producer: str) -> dict:
+    return _purge_metadata(
+        {"producer": producer, "creator": producer, "creationdate": ""}
+        | raw_metadata
+        | {
+            "source": file_path,
+            "total_pages": total_pages,
+        }
+    )
+
+
+def iter_pypdf_pages(file_path: str, start: int, stop: Optional[int]) -> Iterator[Document]:
+    """Yield pages [start, stop) with the same content and metadata as PyPDFLoader in page mode."""
+    import pypdf
+
+    pdf_reader = pypdf.PdfReader(file_path)
+    total_pages = len(pdf_reader.pages)
+    doc_metadata = pdf_document_metadata(
+        file_path, dict(pdf_reader.metadata or {}), total_pages, producer="PyPDF"
+    )
+
+    for page_number in range(start, total_pages if stop is None else stop):
+        page = pdf_reader.pages[page_number]
+        yield Document(
+            page_content=page.extract_text(extraction_mode="plain").strip(),
+            metadata=_validate_metadata(
+                doc_metadata
+                | {
+                    "page": page_number,
+                    "page_label": pdf_reader.page_labels[page_number],
+                }
+            ),
+        )
+
+
+# PyMuPDF reports document info without the PDF "/" prefix and with its own key names;
+# map them back so both backends go through the same metadata normalization.
+_PYMUPDF_METADATA_KEYS = {
+    "title": "/Title",
+    "author": "/Author",
+    "subject": "/Subject",
+    "keywords": "/Keywords",
+    "creator": "/Creator",
+    "producer": "/Producer",
+    "creationDate": "/CreationDate",
+    "modDate": "/ModDate",
+}
+
+
+def iter_pymupdf_pages(file_path: str, start: int, stop: Optional[int]) -> Iterator[Document]:
+    """Yield pages [start, stop) with PyMuPDF, using the same metadata keys as the pypdf backend."""
+    import pymupdf
+
+    with pymupdf.open(file_path) as pdf_document:
+        total_pages = pdf_document.page_count
+        raw_metadata = {
+            pdf_key: value
+            for key, pdf_key in _PYMUPDF_METADATA_KEYS.items()
+            if (value := (pdf_document.metadata or {}).get(key))
+        }
+        doc_metadata = pdf_document_metadata(file_path, raw_metadata, total_pages, producer="PyMuPDF")
+
+        for page_number in range(start, total_pages if stop is None else stop):
+            page = pdf_document[page_number]
+            yield Document(
+                page_content=page.get_text().strip(),
+                metadata=_validate_metadata(
+                    doc_metadata
+                    | {
+                        "page": page_number,
+                        "page_label": page.get_label() or str(page_number + 1),
+                    }
+                ),
+            )
+
+
+PDF_PAGE_ITERATORS: Dict[str, Callable[[str, int, Optional[int]], Iterator[Document]]] = {
+    "pypdf": iter_pypdf_pages,
+    "pymupdf": iter_pymupdf_pages,
+}
+
+
+def count_pdf_pages(file_path: str, backend: str) -> int:
+    if backend == "pymupdf":
+        import pymupdf
+
+        with pymupdf.open(file_path) as pdf_document:
+            return pdf_document.page_count
+
+    import pypdf
+
+    return len(pypdf.PdfReader(file_path).pages)
+
+
+def extract_pdf_page_range(file_path: str, start: int, stop: int, backend: str = "pypdf") -> List[Document]:
+    return list(PDF_PAGE_ITERATORS[backend](file_path, start, stop))
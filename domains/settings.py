@@ -5,6 +5,10 @@ from pydantic_settings import BaseSettings
 from typing import ClassVar
 
 
+# native width of text-embedding-3-small and ada-002, and of the indexes created before it was configurable
+DEFAULT_EMBEDDING_DIMENSION = 1536
+
+
 class LLMServiceType(str, Enum):
     OPENAI = "openai"
     GROQ = "groq"
@@ -34,6 +38,15 @@ class Settings(BaseSettings):
         os.environ.get("THRESHOLD_MESSAGE_TO_SUMMARIZE", 10)
     )
     API_HOSTNAME: str = os.environ.get("API_HOSTNAME", "https://dummyjson.com/c")
+    # the SQLite state files (job queue, caches, manifest, checkpoints, outbox) live here;
+    # relative *_PATH settings below resolve against it when the store is first used
+    STATE_DIRECTORY: str = os.environ.get("STATE_DIRECTORY", ".")
+    STATUS_OUTBOX_STATUS: bool = os.environ.get("STATUS_OUTBOX_STATUS", True)
+    STATUS_OUTBOX_PATH: str = os.environ.get("STATUS_OUTBOX_PATH", "state/status_outbox.db")
+    STATUS_OUTBOX_BATCH_SIZE: int = int(os.environ.get("STATUS_OUTBOX_BATCH_SIZE", 50))
+    STATUS_OUTBOX_MAX_ATTEMPTS: int = int(os.environ.get("STATUS_OUTBOX_MAX_ATTEMPTS", 8))
+    STATUS_OUTBOX_TIMEOUT: float = float(os.environ.get("STATUS_OUTBOX_TIMEOUT", 10))
+    STATUS_OUTBOX_FLUSH_INTERVAL: float = float(os.environ.get("STATUS_OUTBOX_FLUSH_INTERVAL", 1))
 
     MAX_TOKEN_LIMIT: int = os.environ.get("MAX_TOKEN_LIMIT", 1500)
 
@@ -61,6 +74,15 @@ class Settings(BaseSettings):
     WEAVIATE_FILTER_RESULTS_PARAMETER: str = os.environ.get(
         "WEAVIATE_FILTER_RESULTS_PARAMETER", "file_name"
     )
+    WEAVIATE_BATCH_MODE: str = os.environ.get("WEAVIATE_BATCH_MODE", "dynamic")
+    WEAVIATE_BATCH_SIZE: int = int(os.environ.get("WEAVIATE_BATCH_SIZE", 200))
+    WEAVIATE_BATCH_CONCURRENT_REQUESTS: int = int(
+        os.environ.get("WEAVIATE_BATCH_CONCURRENT_REQUESTS", 4)
+    )
+    WEAVIATE_EMBEDDING_CHUNK_SIZE: int = int(
+        os.environ.get("WEAVIATE_EMBEDDING_CHUNK_SIZE", 1000)
+    )
+    WEAVIATE_BATCH_MAX_RETRIES: int = int(os.environ.get("WEAVIATE_BATCH_MAX_RETRIES", 3))
 
 
     # pinecone
@@ -73,10 +95,15 @@ class Settings(BaseSettings):
     PINECONE_INDEX_REGION_NAME: str = os.environ.get("PINECONE_INDEX_REGION_NAME", "us-east-1")
     PINECONE_DEFAULT_DEV_NAMESPACE: str = os.environ.get("PINECONE_DEFAULT_DEV_NAMESPACE", "default_dev")
     PINECONE_DROP_INDEX_NAME_STATUS: bool = os.environ.get("PINECONE_DROP_INDEX_NAME_STATUS", False)
-    DELETE_NAMESPACE_STATUS: bool = os.environ.get("DELETE_NAMESPACE_STATUS", True)
+    DELETE_NAMESPACE_STATUS: bool = os.environ.get("DELETE_NAMESPACE_STATUS", False)
     PINECONE_TOTAL_DOCS_TO_RETRIEVE: int = os.environ.get(
         "PINECONE_TOTAL_DOCS_TO_RETRIEVE", 10
     )
+    PINECONE_UPSERT_BATCH_SIZE: int = int(os.environ.get("PINECONE_UPSERT_BATCH_SIZE", 100))
+    PINECONE_EMBEDDING_CHUNK_SIZE: int = int(
+        os.environ.get("PINECONE_EMBEDDING_CHUNK_SIZE", 1000)
+    )
+    PINECONE_UPSERT_POOL_SIZE: int = int(os.environ.get("PINECONE_UPSERT_POOL_SIZE", 8))
 
     # chunk setting
     NUMBER_OF_RETRIEVAL_RESULTS: int = os.environ.get(
@@ -84,6 +111,107 @@ class Settings(BaseSettings):
     )
     CHUNK_SIZE: int = os.environ.get("CHUNK_SIZE", 1000)
     CHUNK_OVERLAP: int = os.environ.get("CHUNK_OVERLAP", 200)
+    TEXT_SPLITTER_ENGINE: str = os.environ.get("TEXT_SPLITTER_ENGINE", "fast")
+    INJESTION_BATCH_SIZE: int = int(os.environ.get("INJESTION_BATCH_SIZE", 256))
+
+    # bulk injestion
+    BULK_INJESTION_PARSE_WORKERS: int = int(os.environ.get("BULK_INJESTION_PARSE_WORKERS", 4))
+    # limit on an uploaded archive and, separately, on the documents extracted from it
+    BULK_INJESTION_MAX_ARCHIVE_BYTES: int = int(
+        os.environ.get("BULK_INJESTION_MAX_ARCHIVE_BYTES", 2 * 1024 ** 3)
+    )
+
+    # incremental injestion
+    INCREMENTAL_INJESTION_STATUS: bool = os.environ.get("INCREMENTAL_INJESTION_STATUS", True)
+    INJESTION_MANIFEST_PATH: str = os.environ.get(
+        "INJESTION_MANIFEST_PATH", "state/namespace_manifest.db"
+    )
+    INJESTION_CHECKPOINT_STATUS: bool = os.environ.get("INJESTION_CHECKPOINT_STATUS", True)
+    INJESTION_CHECKPOINT_PATH: str = os.environ.get(
+        "INJESTION_CHECKPOINT_PATH", "state/injestion_checkpoints.db"
+    )
+
+    # pdf extraction
+    PDF_EXTRACTION_WORKERS: int = int(
+        os.environ.get("PDF_EXTRACTION_WORKERS", os.cpu_count() or 1)
+    )
+    PDF_PARALLEL_MIN_PAGES: int = int(os.environ.get("PDF_PARALLEL_MIN_PAGES", 50))
+    PDF_PARSER_BACKEND: str = os.environ.get("PDF_PARSER_BACKEND", "pypdf")
+
+    # txt files above TXT_STREAM_MIN_BYTES are memory-mapped and decoded block by block
+    TXT_STREAM_MIN_BYTES: int = int(os.environ.get("TXT_STREAM_MIN_BYTES", 32 * 1024 * 1024))
+    TXT_STREAM_BLOCK_SIZE: int = int(os.environ.get("TXT_STREAM_BLOCK_SIZE", 1024 * 1024))
+    TXT_ENCODING_SAMPLE_BYTES: int = int(os.environ.get("TXT_ENCODING_SAMPLE_BYTES", 64 * 1024))
+
+    # docx extraction: "fast" reads the document XML directly, "accurate" uses unstructured
+    DOCX_LOADER_MODE: str = os.environ.get("DOCX_LOADER_MODE", "fast")
+
+    # embedding cache
+    EMBEDDING_CACHE_STATUS: bool = os.environ.get("EMBEDDING_CACHE_STATUS", True)
+    EMBEDDING_CACHE_PATH: str = os.environ.get("EMBEDDING_CACHE_PATH", "state/embedding_cache.db")
+    EMBEDDING_CACHE_MAX_ENTRIES: int = int(
+        os.environ.get("EMBEDDING_CACHE_MAX_ENTRIES", 1_000_000)
+    )
+
+    # query embedding cache on the retrieval path: in memory, optionally backed by disk
+    QUERY_EMBEDDING_CACHE_STATUS: bool = os.environ.get("QUERY_EMBEDDING_CACHE_STATUS", True)
+    QUERY_EMBEDDING_CACHE_MAX_ENTRIES: int = int(os.environ.get("QUERY_EMBEDDING_CACHE_MAX_ENTRIES", 10_000))
+    QUERY_EMBEDDING_CACHE_TTL: float = float(os.environ.get("QUERY_EMBEDDING_CACHE_TTL", 24 * 60 * 60))
+    QUERY_EMBEDDING_CACHE_DISK_STATUS: bool = os.environ.get("QUERY_EMBEDDING_CACHE_DISK_STATUS", False)
+    QUERY_EMBEDDING_CACHE_PATH: str = os.environ.get(
+        "QUERY_EMBEDDING_CACHE_PATH", "state/query_embedding_cache.db"
+    )
+
+    # concurrent async query embeddings are coalesced into one provider request per window
+    QUERY_EMBEDDING_BATCH_STATUS: bool = os.environ.get("QUERY_EMBEDDING_BATCH_STATUS", True)
+    QUERY_EMBEDDING_BATCH_WINDOW_MS: float = float(os.environ.get("QUERY_EMBEDDING_BATCH_WINDOW_MS", 5))
+    QUERY_EMBEDDING_BATCH_MAX_SIZE: int = int(os.environ.get("QUERY_EMBEDDING_BATCH_MAX_SIZE", 64))
+
+    # vector db control-plane metadata (collections, tenants, namespaces) cache
+    VECTOR_DB_METADATA_CACHE_STATUS: bool = os.environ.get("VECTOR_DB_METADATA_CACHE_STATUS", True)
+    VECTOR_DB_METADATA_CACHE_TTL: float = float(os.environ.get("VECTOR_DB_METADATA_CACHE_TTL", 300))
+
+    # embeddings provider clients: one pooled HTTP client per process, warmed at startup
+    EMBEDDING_HTTP_MAX_CONNECTIONS: int = int(os.environ.get("EMBEDDING_HTTP_MAX_CONNECTIONS", 20))
+    EMBEDDING_HTTP_TIMEOUT: float = float(os.environ.get("EMBEDDING_HTTP_TIMEOUT", 60))
+    EMBEDDING_HTTP_CONNECT_TIMEOUT: float = float(os.environ.get("EMBEDDING_HTTP_CONNECT_TIMEOUT", 10))
+    EMBEDDING_WARMUP_STATUS: bool = os.environ.get("EMBEDDING_WARMUP_STATUS", True)
+
+    # width of stored vectors: text-embedding-3 models are shortened to it, indexes are created with it
+    EMBEDDING_DIMENSION: int = int(os.environ.get("EMBEDDING_DIMENSION", DEFAULT_EMBEDDING_DIMENSION))
+
+    # embeddings provider: empty follows LLM_SERVICE, "local" embeds on this machine's CPU
+    EMBEDDING_SERVICE: str = os.environ.get("EMBEDDING_SERVICE", "")
+    # directory with model.onnx and tokenizer.json; empty uses the deterministic hashing embedder
+    LOCAL_EMBEDDING_MODEL_PATH: str = os.environ.get("LOCAL_EMBEDDING_MODEL_PATH", "")
+    LOCAL_EMBEDDING_BATCH_SIZE: int = int(os.environ.get("LOCAL_EMBEDDING_BATCH_SIZE", 32))
+    LOCAL_EMBEDDING_THREADS: int = int(os.environ.get("LOCAL_EMBEDDING_THREADS", 0))
+    LOCAL_EMBEDDING_MAX_LENGTH: int = int(os.environ.get("LOCAL_EMBEDDING_MAX_LENGTH", 512))
+
+    # embedding scheduler: one rate budget for every embeddings call in the process
+    EMBEDDING_SCHEDULER_STATUS: bool = os.environ.get("EMBEDDING_SCHEDULER_STATUS", True)
+    EMBEDDING_TOKENS_PER_MINUTE: int = int(os.environ.get("EMBEDDING_TOKENS_PER_MINUTE", 1_000_000))
+    EMBEDDING_REQUESTS_PER_MINUTE: int = int(os.environ.get("EMBEDDING_REQUESTS_PER_MINUTE", 3000))
+    EMBEDDING_SCHEDULER_MAX_RETRIES: int = int(os.environ.get("EMBEDDING_SCHEDULER_MAX_RETRIES", 6))
+    # share the budget between the API process and the injestion workers through SQLite
+    EMBEDDING_BUDGET_SHARED_STATUS: bool = os.environ.get("EMBEDDING_BUDGET_SHARED_STATUS", True)
+    EMBEDDING_BUDGET_PATH: str = os.environ.get("EMBEDDING_BUDGET_PATH", "state/embedding_budget.db")
+
+    # injestion job queue
+    INJESTION_QUEUE_PATH: str = os.environ.get(
+        "INJESTION_QUEUE_PATH", "queue/injestion_jobs.db"
+    )
+    INJESTION_WORKER_COUNT: int = int(os.environ.get("INJESTION_WORKER_COUNT", 2))
+    # workers that only take interactive jobs, so uploads never wait behind a backfill
+    INJESTION_INTERACTIVE_WORKER_COUNT: int = int(os.environ.get("INJESTION_INTERACTIVE_WORKER_COUNT", 1))
+    INJESTION_DEFAULT_PRIORITY: str = os.environ.get("INJESTION_DEFAULT_PRIORITY", "bulk")
+    INJESTION_WORKER_POLL_INTERVAL: float = float(
+        os.environ.get("INJESTION_WORKER_POLL_INTERVAL", 1.0)
+    )
+    INJESTION_JOB_MAX_ATTEMPTS: int = int(os.environ.get("INJESTION_JOB_MAX_ATTEMPTS", 3))
+    INJESTION_JOB_LEASE_SECONDS: int = int(
+        os.environ.get("INJESTION_JOB_LEASE_SECONDS", 3600)
+    )
 
     # classification
     CLASSIFICATION_MODEL: str = os.environ.get("CLASSIFICATION_MODEL", "gpt-4o")
@@ -110,6 +238,14 @@ class Settings(BaseSettings):
     MINIMUM_SCORE: float = float(os.environ.get("MINIMUM_SCORE", 0.5))
 
     UPLOAD_FOLDER: str = os.environ.get("UPLOAD_FOLDER", "uploads")
+    UPLOAD_SPOOL_FOLDER: str = os.environ.get("UPLOAD_SPOOL_FOLDER", "uploads/spool")
+    UPLOAD_SPOOL_CHUNK_SIZE: int = int(os.environ.get("UPLOAD_SPOOL_CHUNK_SIZE", 1024 * 1024))
+    UPLOAD_MAX_BYTES: int = int(os.environ.get("UPLOAD_MAX_BYTES", 2 * 1024 * 1024 * 1024))
+    DOWNLOAD_FOLDER: str = os.environ.get("DOWNLOAD_FOLDER", "uploads/downloads")
+    DOWNLOAD_CHUNK_SIZE: int = int(os.environ.get("DOWNLOAD_CHUNK_SIZE", 1024 * 1024))
+    DOWNLOAD_MAX_CONNECTIONS: int = int(os.environ.get("DOWNLOAD_MAX_CONNECTIONS", 20))
+    DOWNLOAD_TIMEOUT: float = float(os.environ.get("DOWNLOAD_TIMEOUT", 60))
+    DOWNLOAD_MAX_RETRIES: int = int(os.environ.get("DOWNLOAD_MAX_RETRIES", 3))
     LOGS_FOLDER: str = os.environ.get("LOGS_FOLDER", "logs")
 
     VECTOR_DATABASE_TO_USE: str = os.environ.get(
@@ -0,0 +1,84 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import ClassVar, Iterator, Optional, Tuple
+
+from domains.settings import config_settings
+
+
+class SQLiteStore:
+    """
+    Base class of the local SQLite stores (job queue, caches, manifest, checkpoints, outbox).
+
+    Every operation opens a short-lived connection, so a store can be shared by threads
+    and processes. Nothing touches the disk until the first operation: the directory,
+    the WAL journal and the ``schema`` statements are set up then, once per instance.
+    A relative ``db_path`` is resolved against STATE_DIRECTORY at that point, and the
+    store keeps using that file afterwards.
+
+    With ``autocommit`` connections run in autocommit mode and return ``sqlite3.Row``
+    rows, and callers issue ``BEGIN IMMEDIATE`` themselves where they need a transaction.
+    Otherwise every ``_connect`` block is one transaction, committed when it exits.
+    """
+
+    schema: ClassVar[Tuple[str, ...]] = ()
+    autocommit: ClassVar[bool] = False
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        self._path: Optional[str] = None
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        if self._path is None:
+            self._path = os.path.join(config_settings.STATE_DIRECTORY, self.db_path)
+        return self._path
+
+    def _open(self) -> sqlite3.Connection:
+        if self.autocommit:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.row_factory = sqlite3.Row
+            return connection
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _ensure_schema(self) -> None:
+        if self._schema_ready:
+            return
+
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            connection = self._open()
+            try:
+                connection.execute("PRAGMA journal_mode=WAL")
+                for statement in self.schema:
+                    connection.execute(statement)
+                self._migrate(connection)
+                connection.commit()
+            finally:
+                connection.close()
+            self._schema_ready = True
+
+    def _migrate(self, connection: sqlite3.Connection) -> None:
+        """Schema changes that ``CREATE ... IF NOT EXISTS`` cannot express, e.g. added columns."""
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self._ensure_schema()
+        connection = self._open()
+        try:
+            if self.autocommit:
+                yield connection
+            else:
+                with connection:
+                    yield connection
+        finally:
+            connection.close()
@@ -0,0 +1,218 @@
+import asyncio
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+import httpx
+from loguru import logger
+
+from domains.models import RequestStatus
+from domains.settings import config_settings
+from domains.sqlite_store import SQLiteStore
+
+
+class StatusOutbox(SQLiteStore):
+    """
+    Durable outbox for status updates sent to API_HOSTNAME.
+
+    Updates are written to SQLite and returned from immediately; a daemon thread with its
+    own event loop delivers them through a pooled async client with timeouts. Each cycle
+    claims a batch of due updates, at most the oldest one per request so a request's
+    updates arrive in order, and posts them concurrently. Failed deliveries are retried
+    with exponential backoff up to ``max_attempts`` and survive restarts.
+
+    Progress updates for a request replace its previous undelivered progress update, so a
+    slow status API receives the latest progress instead of a backlog of stale counters.
+    """
+
+    autocommit = True
+    schema = (
+        """
+        CREATE TABLE IF NOT EXISTS status_outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            request_id TEXT NOT NULL,
+            status_api_path TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            is_progress INTEGER NOT NULL DEFAULT 0,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at TEXT NOT NULL,
+            claimed_until TEXT
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_status_outbox_request ON status_outbox (request_id, id)",
+    )
+
+    def __init__(
+            self,
+            db_path: str = config_settings.STATUS_OUTBOX_PATH,
+            batch_size: int = config_settings.STATUS_OUTBOX_BATCH_SIZE,
+            max_attempts: int = config_settings.STATUS_OUTBOX_MAX_ATTEMPTS,
+            timeout: float = config_settings.STATUS_OUTBOX_TIMEOUT,
+            flush_interval: float = config_settings.STATUS_OUTBOX_FLUSH_INTERVAL,
+    ) -> None:
+        super().__init__(db_path)
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+        self.flush_interval = flush_interval
+        self._thread: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now()
+
+    def enqueue(self, status_api_path: str, request_status: RequestStatus, is_progress: bool = False) -> None:
+        now = self._now().isoformat()
+        request_id = str(request_status.request_id)
+        payload = request_status.model_dump_json()
+
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                if is_progress:
+                    updated = connection.execute(
+                        "UPDATE status_outbox SET payload = ?, status_api_path = ? "
+                        "WHERE request_id = ? AND is_progress = 1 AND claimed_until IS NULL",
+                        (payload, status_api_path, request_id),
+                    ).rowcount
+                    if updated:
+                        connection.execute("COMMIT")
+                        return
+                else:
+                    # A final status makes any undelivered progress for the request obsolete.
+                    connection.execute(
+                        "DELETE FROM status_outbox WHERE request_id = ? AND is_progress = 1 AND claimed_until IS NULL",
+                        (request_id,),
+                    )
+
+                connection.execute(
+                    "INSERT INTO status_outbox (request_id, status_api_path, payload, is_progress, next_attempt_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (request_id, status_api_path, payload, int(is_progress), now),
+                )
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+
+        self.start()
+        self._wake.set()
+
+    def _claim_batch(self) -> List[sqlite3.Row]:
+        now = self._now()
+
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                rows = connection.execute(
+                    "SELECT * FROM status_outbox AS o "
+                    "WHERE o.next_attempt_at <= ? AND (o.claimed_until IS NULL OR o.claimed_until < ?) "
+                    "AND o.id = (SELECT MIN(id) FROM status_outbox WHERE request_id = o.request_id) "
+                    "ORDER BY o.id LIMIT ?",
+                    (now.isoformat(), now.isoformat(), self.batch_size),
+                ).fetchall()
+
+                # Another process may share the outbox; the lease keeps it from sending the same rows.
+                claimed_until = (now + timedelta(seconds=self.timeout * 3)).isoformat()
+                connection.executemany(
+                    "UPDATE status_outbox SET claimed_until = ? WHERE id = ?",
+                    [(claimed_until, row["id"]) for row in rows],
+                )
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+
+        return rows
+
+    def _record_results(self, rows: List[sqlite3.Row], settled: List[bool]) -> None:
+        now = self._now()
+
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            for row, success in zip(rows, settled):
+                attempts = row["attempts"] + 1
+                if success or attempts >= self.max_attempts:
+                    if not success:
+                        logger.error(
+                            f"Dropping status update for request {row['request_id']} "
+                            f"after {attempts} attempts: {row['payload']}"
+                        )
+                    connection.execute("DELETE FROM status_outbox WHERE id = ?", (row["id"],))
+                else:
+                    connection.execute(
+                        "UPDATE status_outbox SET attempts = ?, next_attempt_at = ?, claimed_until = NULL "
+                        "WHERE id = ?",
+                        (attempts, (now + timedelta(seconds=min(2 ** attempts, 300))).isoformat(), row["id"]),
+                    )
+            connection.execute("COMMIT")
+
+    @staticmethod
+    async def _deliver(client: httpx.AsyncClient, row: sqlite3.Row) -> bool:
+        """Post one update; returns False when it should be retried."""
+        status_api_url = f"{config_settings.API_HOSTNAME}/{row['status_api_path']}"
+        try:
+            response = await client.post(status_api_url, json=json.loads(row["payload"]))
+        except httpx.HTTPError as e:
+            logger.warning(f"Status update for request {row['request_id']} to {status_api_url} failed: {e}")
+            return False
+
+        if response.status_code == 200:
+            logger.info(f"Delivered status update for request {row['request_id']} to {status_api_url}")
+            return True
+
+        logger.error(
+            f"Status update for request {row['request_id']} to {status_api_url} failed with "
+            f"status code: \"{response.status_code}\" and response: \"{response.text}\""
+        )
+        # Client errors will not succeed on retry.
+        return 400 <= response.status_code < 500 and response.status_code != 429
+
+    async def _run(self) -> None:
+        async with httpx.AsyncClient(
+            timeout=httpx.Timeout(self.timeout),
+            limits=httpx.Limits(max_connections=self.batch_size, max_keepalive_connections=self.batch_size),
+        ) as client:
+            while not self._stop.is_set():
+                try:
+                    rows = await asyncio.to_thread(self._claim_batch)
+                    if rows:
+                        settled = await asyncio.gather(*(self._deliver(client, row) for row in rows))
+                        await asyncio.to_thread(self._record_results, rows, list(settled))
+                        continue
+                except Exception:
+                    logger.exception("Status outbox delivery cycle failed")
+
+                await asyncio.to_thread(self._wake.wait, self.flush_interval)
+                self._wake.clear()
+
+    def start(self) -> None:
+        """Start the delivery thread if it is not running in this process."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=lambda: asyncio.run(self._run()),
+                name="status-outbox",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def pending(self) -> int:
+        with self._connect() as connection:
+            return connection.execute("SELECT COUNT(*) FROM status_outbox").fetchone()[0]
+
+
+status_outbox = StatusOutbox()
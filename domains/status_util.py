@@ -9,6 +9,19 @@ def call_update_status_api(
         status_api_path: str,
         request_status: RequestStatus,
 ) -> None:
+    """
+    Report a request status to API_HOSTNAME.
+
+    With STATUS_OUTBOX_STATUS enabled the update is persisted to the status outbox and
+    delivered in the background, so callers never wait on the status API.
+    """
+    if config_settings.STATUS_OUTBOX_STATUS:
+        from domains.status_outbox import status_outbox
+
+        logger.info(f"Queueing status update for API_PATH: {status_api_path} and data: {request_status}")
+        status_outbox.enqueue(status_api_path, request_status)
+        return
+
     try:
         status_api_url = f"{config_settings.API_HOSTNAME}/{status_api_path}"
         logger.info(
@@ -20,6 +33,7 @@ def call_update_status_api(
         response = requests.post(
             status_api_url,
             json=request_status.model_dump(),
+            timeout=config_settings.STATUS_OUTBOX_TIMEOUT,
         )
 
         if response.status_code == 200:
@@ -38,4 +52,22 @@ def call_update_status_api(
                 f'response: "{response.text}"'
             )
     except requests.exceptions.RequestException as e:
-        logger.exception("Error occurred during the API request", e)
\ No newline at end of file
+        logger.exception("Error occurred during the API request", e)
+
+
+def report_progress(
+        status_api_path: str,
+        request_status: RequestStatus,
+) -> None:
+    """
+    Report intermediate progress of a request through the status outbox.
+
+    Only the latest undelivered progress update of a request is kept, so this is cheap to
+    call once per batch. Progress is not reported when the outbox is disabled.
+    """
+    if not config_settings.STATUS_OUTBOX_STATUS:
+        return
+
+    from domains.status_outbox import status_outbox
+
+    status_outbox.enqueue(status_api_path, request_status, is_progress=True)
@@ -0,0 +1,73 @@
+import hashlib
+import uuid
+from typing import Iterable, Set
+
+from domains.settings import config_settings
+from domains.sqlite_store import SQLiteStore
+
+
+# Fixed namespace so the same file and content always map to the same vector id.
+CHUNK_ID_NAMESPACE = uuid.UUID("6f1c3b52-3f0e-4c4b-9d62-2a8f3f1f5e7a")
+
+
+def compute_content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def compute_chunk_id(file_name: str, content_hash: str) -> str:
+    """Stable vector id of a chunk; a UUID so it is valid for both Pinecone and Weaviate."""
+    return str(uuid.uuid5(CHUNK_ID_NAMESPACE, f"{file_name}:{content_hash}"))
+
+
+class NamespaceManifest(SQLiteStore):
+    """Local record of which chunk ids of which file are stored in each index namespace."""
+
+    schema = (
+        """
+        CREATE TABLE IF NOT EXISTS namespace_chunks (
+            index_name TEXT NOT NULL,
+            namespace TEXT NOT NULL,
+            file_name TEXT NOT NULL,
+            chunk_id TEXT NOT NULL,
+            PRIMARY KEY (index_name, namespace, file_name, chunk_id)
+        )
+        """,
+    )
+
+    def __init__(self, db_path: str = config_settings.INJESTION_MANIFEST_PATH) -> None:
+        super().__init__(db_path)
+
+    def get_chunk_ids(self, index_name: str, namespace: str, file_name: str) -> Set[str]:
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT chunk_id FROM namespace_chunks "
+                "WHERE index_name = ? AND namespace = ? AND file_name = ?",
+                (index_name, namespace, file_name),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def add_chunk_ids(self, index_name: str, namespace: str, file_name: str, chunk_ids: Iterable[str]) -> None:
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO namespace_chunks "
+                "(index_name, namespace, file_name, chunk_id) VALUES (?, ?, ?, ?)",
+                [(index_name, namespace, file_name, chunk_id) for chunk_id in chunk_ids],
+            )
+
+    def remove_chunk_ids(self, index_name: str, namespace: str, file_name: str, chunk_ids: Iterable[str]) -> None:
+        with self._connect() as connection:
+            connection.executemany(
+                "DELETE FROM namespace_chunks "
+                "WHERE index_name = ? AND namespace = ? AND file_name = ? AND chunk_id = ?",
+                [(index_name, namespace, file_name, chunk_id) for chunk_id in chunk_ids],
+            )
+
+    def clear_namespace(self, index_name: str, namespace: str) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "DELETE FROM namespace_chunks WHERE index_name = ? AND namespace = ?",
+                (index_name, namespace),
+            )
+
+
+namespace_manifest = NamespaceManifest()
@@ -0,0 +1,74 @@
+import threading
+import time
+from typing import Callable, Dict, Hashable, Iterable
+
+from domains.settings import config_settings
+
+
+class VectorDBMetadataCache:
+    """
+    TTL cache of control-plane facts: which collections exist, which tenants or
+    namespaces a collection or index has.
+
+    Only facts that were observed to be true are cached. A name that is not in the cache
+    is checked remotely, so a collection or tenant created by another process is never
+    reported missing and created twice. This process updates the cache itself when it
+    creates or deletes something, and entries expire after ``ttl`` seconds to pick up
+    deletions made elsewhere.
+    """
+
+    def __init__(
+            self,
+            ttl: float = config_settings.VECTOR_DB_METADATA_CACHE_TTL,
+            enabled: bool = config_settings.VECTOR_DB_METADATA_CACHE_STATUS,
+    ) -> None:
+        self.ttl = ttl
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Hashable, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def contains(self, key: Hashable, name: str, check: Callable[[], bool]) -> bool:
+        """Whether ``name`` exists under ``key``, asking ``check`` only when it is not cached."""
+        if self.enabled:
+            with self._lock:
+                expires_at = self._entries.get(key, {}).get(name)
+                if expires_at is not None and expires_at >= time.monotonic():
+                    self.hits += 1
+                    return True
+                self.misses += 1
+
+        exists = check()
+        if exists:
+            self.add(key, name)
+        return exists
+
+    def add(self, key: Hashable, name: str) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries.setdefault(key, {})[name] = time.monotonic() + self.ttl
+
+    def replace(self, key: Hashable, names: Iterable[str]) -> None:
+        """Store a complete listing fetched from the server."""
+        if not self.enabled:
+            return
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = {name: expires_at for name in names}
+
+    def discard(self, key: Hashable, name: str) -> None:
+        with self._lock:
+            self._entries.get(key, {}).pop(name, None)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+vector_db_metadata_cache = VectorDBMetadataCache()
@@ -23,6 +23,9 @@ class PushToDatabaseResponseDto(BaseModel):
     status: bool = False
     message: Optional[str] = None
     document_ids: Optional[List[str]] = None
+    total_documents: Optional[int] = None
+    skipped_documents: Optional[int] = None
+    deleted_documents: Optional[int] = None
     timestamp: Optional[str] = None
     index: Optional[str] = None
     namespace: Optional[str] = None
@@ -32,7 +35,7 @@ class PushToDatabaseResponseDto(BaseModel):
 class PineconeConfig:
     index_name: str = config_settings.PINECONE_INDEX_NAME
     namespace: str = config_settings.PINECONE_DEFAULT_DEV_NAMESPACE
-    dimension: int = 1536
+    dimension: int = config_settings.EMBEDDING_DIMENSION
     metric: str = config_settings.PINECONE_INDEX_METRIC_TYPE
     cloud: str = config_settings.PINECONE_INDEX_CLOUD_NAME
     region: str = config_settings.PINECONE_INDEX_REGION_NAME
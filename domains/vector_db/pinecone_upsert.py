@@ -0,0 +1,131 @@
+import threading
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Set
+
+from langchain_core.embeddings import Embeddings
+from loguru import logger
+from pinecone import Pinecone
+
+from domains.handler import retry_with_custom_backoff
+from domains.settings import config_settings
+
+
+@retry_with_custom_backoff()
+def _upsert_batch(index: Any, vectors: List[Dict[str, Any]], namespace: str) -> int:
+    index.upsert(vectors=vectors, namespace=namespace)
+    return len(vectors)
+
+
+class PineconeUpsertEngine:
+    """
+    Embeds and upserts documents into Pinecone through one long-lived client.
+
+    Texts are embedded ``embedding_chunk_size`` at a time. The resulting vectors are cut
+    into ``batch_size`` upserts and sent from a pool of ``pool_size`` threads while the
+    next chunk is being embedded. Each upsert batch is retried on its own, so a transient
+    failure costs one batch rather than the whole push.
+    """
+
+    def __init__(
+            self,
+            batch_size: int = config_settings.PINECONE_UPSERT_BATCH_SIZE,
+            embedding_chunk_size: int = config_settings.PINECONE_EMBEDDING_CHUNK_SIZE,
+            pool_size: int = config_settings.PINECONE_UPSERT_POOL_SIZE,
+            text_key: str = "text",
+    ) -> None:
+        self.batch_size = batch_size
+        self.embedding_chunk_size = embedding_chunk_size
+        self.pool_size = pool_size
+        self.text_key = text_key
+        self._client: Optional[Pinecone] = None
+        self._indexes: Dict[str, Any] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> Pinecone:
+        with self._lock:
+            if self._client is None:
+                self._client = Pinecone(api_key=config_settings.PINECONE_API_KEY)
+                logger.info("Successfully initialized Pinecone upsert client")
+            return self._client
+
+    def get_index(self, index_name: str) -> Any:
+        """Return a cached handle to ``index_name`` so its connection pool is reused."""
+        client = self.client
+        with self._lock:
+            if index_name not in self._indexes:
+                self._indexes[index_name] = client.Index(index_name, pool_threads=self.pool_size)
+            return self._indexes[index_name]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.pool_size,
+                    thread_name_prefix="pinecone-upsert",
+                )
+            return self._executor
+
+    def upsert_texts(
+            self,
+            texts: List[str],
+            metadatas: List[dict],
+            embeddings: Embeddings,
+            index_name: str,
+            namespace: str,
+            ids: Optional[List[str]] = None,
+    ) -> List[str]:
+        ids = ids or [str(uuid.uuid4()) for _ in texts]
+        index = self.get_index(index_name)
+        executor = self._get_executor()
+        in_flight: Set[Future] = set()
+        upserted = 0
+
+        def collect(done: Set[Future]) -> None:
+            nonlocal upserted
+            for future in done:
+                in_flight.discard(future)
+                upserted += future.result()
+
+        try:
+            for chunk_start in range(0, len(texts), self.embedding_chunk_size):
+                chunk_stop = chunk_start + self.embedding_chunk_size
+                chunk_texts = texts[chunk_start:chunk_stop]
+                vectors = embeddings.embed_documents(chunk_texts)
+
+                records = [
+                    {
+                        "id": vector_id,
+                        "values": vector,
+                        "metadata": {**metadata, self.text_key: text},
+                    }
+                    for vector_id, vector, metadata, text in zip(
+                        ids[chunk_start:chunk_stop], vectors, metadatas[chunk_start:chunk_stop], chunk_texts
+                    )
+                ]
+
+                for batch_start in range(0, len(records), self.batch_size):
+                    # Bound the number of queued batches so memory stays flat on huge pushes.
+                    if len(in_flight) >= self.pool_size * 2:
+                        collect(wait(in_flight, return_when=FIRST_COMPLETED).done)
+
+                    in_flight.add(executor.submit(
+                        _upsert_batch,
+                        index,
+                        records[batch_start:batch_start + self.batch_size],
+                        namespace,
+                    ))
+
+            collect(wait(in_flight).done)
+        except Exception:
+            for future in in_flight:
+                future.cancel()
+            raise
+
+        logger.info(f"Upserted {upserted} vectors into {index_name}/{namespace}")
+        return ids
+
+
+pinecone_upsert_engine = PineconeUpsertEngine()
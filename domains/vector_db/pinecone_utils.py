@@ -16,7 +16,7 @@ from langchain_weaviate.vectorstores import WeaviateVectorStore
 from langchain_pinecone import PineconeVectorStore
 
 from domains.vector_db.weaviate_utils import manager_client
-from domains.injestion.utils import get_embeddings
+from domains.injestion.utils import get_query_embeddings
 
 
 @lru_cache(maxsize=32)
@@ -51,7 +51,7 @@ def load_index(
         return WeaviateVectorStore(
             client=weaviate_client,
             index_name=index_name,
-            embedding=get_embeddings(),
+            embedding=get_query_embeddings(),
             use_multi_tenancy=config_settings.WEAVIATE_MULTI_TENANCY_STATUS,
             text_key=config_settings.WEAVIATE_TEXT_KEY,
         )
@@ -60,7 +60,7 @@ def load_index(
         # load a pinecone index
         return Pinecone.from_existing_index(
             index_name=index_name,
-            embedding=get_embeddings(model_key="EMBEDDING_MODEL"),
+            embedding=get_query_embeddings(model_key="EMBEDDING_MODEL_NAME"),
             namespace=namespace,
         )
 
@@ -82,7 +82,7 @@ async def get_docsearch(
             docsearch = WeaviateVectorStore(
                 client=weaviate_client,
                 index_name=index_name,
-                embedding=get_embeddings(),
+                embedding=get_query_embeddings(),
                 use_multi_tenancy=config_settings.WEAVIATE_MULTI_TENANCY_STATUS,
                 text_key=config_settings.WEAVIATE_TEXT_KEY,
             )
@@ -93,7 +93,7 @@ async def get_docsearch(
             # Initialize PineconeVectorStore
             docsearch = PineconeVectorStore.from_existing_index(
                 index_name=index_name,
-                embedding=get_embeddings(model_key="EMBEDDING_MODEL"),
+                embedding=get_query_embeddings(model_key="EMBEDDING_MODEL_NAME"),
             )
             yield docsearch
 
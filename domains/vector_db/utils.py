@@ -262,8 +262,10 @@
 #         raise Exception(f"Vector database operation failed: {str(e)}")
 
 
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Optional, Union
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Union
 import atexit
 import ssl
 from contextlib import suppress
@@ -271,16 +273,20 @@ from dataclasses import dataclass
 
 from pinecone import Pinecone, ServerlessSpec
 from pinecone.exceptions import PineconeApiException
-from langchain_weaviate.vectorstores import WeaviateVectorStore
-from langchain_community.vectorstores import Pinecone as PineconeVectorStore
+from langchain_core.documents import Document
 from loguru import logger
+from weaviate.classes.query import Filter
 
 from domains.vector_db.models import PineconeConfig
-from domains.injestion.utils import get_embeddings
+from domains.injestion.utils import get_cached_embeddings
 from domains.settings import config_settings
 from domains.vector_db.exception import VectorDBOperationError
 from domains.vector_db.models import PushToDatabaseResponseDto
 from domains.vector_db.weaviate_utils import manager_client
+from domains.vector_db.metadata_cache import vector_db_metadata_cache
+from domains.vector_db.manifest import compute_chunk_id, compute_content_hash, namespace_manifest
+from domains.vector_db.pinecone_upsert import pinecone_upsert_engine
+from domains.vector_db.weaviate_batch import weaviate_batch_importer
 from domains.handler import retry_with_custom_backoff
 
 
@@ -318,7 +324,8 @@ def validate_and_create_index(
 
     try:
         pc = initialize_pinecone()
-        indexes = [index.get("name") for index in pc.list_indexes()]
+        dimensions = {index.get("name"): index.get("dimension") for index in pc.list_indexes()}
+        indexes = list(dimensions)
         logger.info(f"Existing indexes: {indexes}")
 
         config = PineconeConfig(index_name=index_name)
@@ -331,6 +338,12 @@ def validate_and_create_index(
                 except Exception as e:
                     logger.error(f"Failed to handle existing index: {e}")
                     return False
+            elif dimensions[index_name] not in (None, config.dimension):
+                logger.error(
+                    f"Index {index_name} has dimension {dimensions[index_name]} but EMBEDDING_DIMENSION is "
+                    f"{config.dimension}; drop the index or set EMBEDDING_DIMENSION to match"
+                )
+                return False
             return True
 
         create_pinecone_index(pc, config)
@@ -347,37 +360,49 @@ def cleanup_ssl_sockets() -> None:
             sock.close()
 
 
+def _pinecone_namespace_exists(loaded_index: Any, index_name: str, namespace: str) -> bool:
+    """Check ``namespace`` with one describe_index_stats call, caching every namespace it lists."""
+    namespaces = list(loaded_index.describe_index_stats()["namespaces"].keys())
+    vector_db_metadata_cache.replace(("pinecone", "namespaces", index_name), namespaces)
+    return namespace in namespaces
+
+
 def handle_pinecone_push(
         texts: List,
         meta_datas: List,
         config: PineconeConfig,
-        drop_namespace: bool
+        drop_namespace: bool,
+        ids: Optional[List[str]] = None,
 ) -> PushToDatabaseResponseDto:
     if drop_namespace:
-        pinecone_vs = initialize_pinecone()
-        loaded_index = pinecone_vs.Index(config.index_name)
+        loaded_index = pinecone_upsert_engine.get_index(config.index_name)
 
         if loaded_index is None:
             raise VectorDBOperationError(f"Index {config.index_name} not found")
 
-        namespaces = list(loaded_index.describe_index_stats(namespace=config.namespace)["namespaces"].keys())
-
-        if config.namespace in namespaces:
+        if vector_db_metadata_cache.contains(
+                ("pinecone", "namespaces", config.index_name),
+                config.namespace,
+                lambda: _pinecone_namespace_exists(loaded_index, config.index_name, config.namespace),
+        ):
             loaded_index.delete(delete_all=True, namespace=config.namespace)
+            vector_db_metadata_cache.discard(("pinecone", "namespaces", config.index_name), config.namespace)
             logger.info(f"Deleted namespace: {config.namespace} from index: {config.index_name}")
 
-    PineconeVectorStore.from_texts(
-        [t.page_content for t in texts],
-        get_embeddings(model_key="EMBEDDING_MODEL_NAME"),
-        meta_datas,
+    document_ids = pinecone_upsert_engine.upsert_texts(
+        texts=[t.page_content for t in texts],
+        metadatas=meta_datas,
+        embeddings=get_cached_embeddings(model_key="EMBEDDING_MODEL_NAME"),
         index_name=config.index_name,
         namespace=config.namespace,
+        ids=ids,
     )
+    vector_db_metadata_cache.add(("pinecone", "namespaces", config.index_name), config.namespace)
 
     return PushToDatabaseResponseDto(
         status=True,
         message="Documents pushed successfully",
-        document_ids=None,
+        document_ids=document_ids,
         timestamp=datetime.now().isoformat(),
         index=config.index_name,
         namespace=config.namespace
@@ -388,35 +413,32 @@ def handle_weaviate_push(
         texts: List,
         index_name: str,
         namespace: str,
-        drop_namespace: bool
+        drop_namespace: bool,
+        ids: Optional[List[str]] = None,
 ) -> PushToDatabaseResponseDto:
     try:
         client = manager_client.manager.get_client()
 
-        if manager_client.manager.validate_collection(collection_name=index_name):
-            if drop_namespace:
-                if manager_client.manager.validate_partition_name(
-                        partition_name=namespace,
-                        index_name=index_name
-                ):
-                    update_status = manager_client.manager.handle_partition_update(
-                        index_name=index_name,
-                        partition_name=namespace,
-                        delete_existing=True
-                    )
-                    if not update_status:
-                        raise VectorDBOperationError("Failed to update/delete existing partition")
-
-        vector_store = WeaviateVectorStore(
+        # validate_partition_name checks the collection too; both answers come from the metadata cache.
+        if drop_namespace and manager_client.manager.validate_partition_name(
+                partition_name=namespace,
+                index_name=index_name
+        ):
+            if not manager_client.manager.delete_partition(index_name=index_name, partition_name=namespace):
+                raise VectorDBOperationError("Failed to update/delete existing partition")
+
+        manager_client.manager.ensure_collection(index_name, multi_tenancy=True)
+        manager_client.manager.ensure_partition(partition_name=namespace, index_name=index_name)
+
+        document_ids = weaviate_batch_importer.import_documents(
             client=client,
+            documents=texts,
+            embeddings=get_cached_embeddings(),
             index_name=index_name,
-            embedding=get_embeddings(),
-            use_multi_tenancy=True,
-            text_key="text",
+            tenant=namespace,
+            ids=ids,
         )
 
-        document_ids = vector_store.add_documents(documents=texts, tenant=namespace)
-
         return PushToDatabaseResponseDto(
             status=True,
             message="Documents ingested successfully",
@@ -434,6 +456,7 @@ def push_to_database(
         index_name: str = config_settings.PINECONE_INDEX_NAME,
         namespace: str = config_settings.PINECONE_DEFAULT_DEV_NAMESPACE,
         drop_namespace: bool = config_settings.DELETE_NAMESPACE_STATUS,
+        ids: Optional[List[str]] = None,
 ) -> PushToDatabaseResponseDto:
     try:
         meta_datas = [text.metadata for text in texts]
@@ -441,10 +464,10 @@ def push_to_database(
 
         if config_settings.VECTOR_DATABASE_TO_USE == "pinecone":
             config = PineconeConfig(index_name=index_name, namespace=namespace)
-            return handle_pinecone_push(texts, meta_datas, config, drop_namespace)
+            return handle_pinecone_push(texts, meta_datas, config, drop_namespace, ids=ids)
 
         elif config_settings.VECTOR_DATABASE_TO_USE == "weaviate":
-            return handle_weaviate_push(texts, index_name, namespace, drop_namespace)
+            return handle_weaviate_push(texts, index_name, namespace, drop_namespace, ids=ids)
 
         else:
             return PushToDatabaseResponseDto(
@@ -463,4 +486,168 @@ def push_to_database(
             timestamp=datetime.now().isoformat(),
             index=index_name,
             namespace=namespace
-        )
\ No newline at end of file
+        )
+
+
+def delete_from_database(
+        ids: List[str],
+        index_name: str = config_settings.PINECONE_INDEX_NAME,
+        namespace: str = config_settings.PINECONE_DEFAULT_DEV_NAMESPACE,
+        batch_size: int = 1000,
+) -> None:
+    """Delete individual vectors by id from a namespace (Pinecone) or tenant (Weaviate)."""
+    if not ids:
+        return
+
+    if config_settings.VECTOR_DATABASE_TO_USE == "pinecone":
+        loaded_index = pinecone_upsert_engine.get_index(index_name)
+        for start in range(0, len(ids), batch_size):
+            loaded_index.delete(ids=ids[start:start + batch_size], namespace=namespace)
+
+    elif config_settings.VECTOR_DATABASE_TO_USE == "weaviate":
+        collection = manager_client.manager.get_client().collections.get(index_name).with_tenant(namespace)
+        for start in range(0, len(ids), batch_size):
+            collection.data.delete_many(where=Filter.by_id().contains_any(ids[start:start + batch_size]))
+
+    else:
+        raise VectorDBOperationError(f"Unsupported vector database: {config_settings.VECTOR_DATABASE_TO_USE}")
+
+    logger.info(f"Deleted {len(ids)} vectors from {index_name}/{namespace}")
+
+
+def _batched(documents: Iterable[Document], batch_size: int) -> Iterator[List[Document]]:
+    documents = iter(documents)
+    while batch := list(islice(documents, batch_size)):
+        yield batch
+
+
+def push_to_database_in_batches(
+        documents: Iterable[Document],
+        index_name: str = config_settings.PINECONE_INDEX_NAME,
+        namespace: str = config_settings.PINECONE_DEFAULT_DEV_NAMESPACE,
+        drop_namespace: bool = config_settings.DELETE_NAMESPACE_STATUS,
+        batch_size: int = config_settings.INJESTION_BATCH_SIZE,
+        on_batch_pushed: Optional[Callable[[int], None]] = None,
+        incremental: bool = config_settings.INCREMENTAL_INJESTION_STATUS,
+        start_batch: int = 0,
+        on_batch_committed: Optional[Callable[[int, List[str]], None]] = None,
+        incomplete_files: Optional[Set[str]] = None,
+) -> PushToDatabaseResponseDto:
+    """
+    Embed and push a (possibly lazy) stream of documents in bounded batches.
+
+    Only one batch is held in memory at a time and each batch is searchable as soon as it
+    is pushed. The namespace is dropped at most once, before the first batch.
+
+    In incremental mode every chunk gets a content hash and a stable id derived from its
+    file name and content. Chunks already recorded in the namespace manifest are skipped,
+    and chunks recorded for a file but no longer produced by it are deleted at the end.
+
+    Batches before ``start_batch`` were committed by an earlier attempt: they are still
+    read so the batch boundaries line up, but not pushed again. ``on_batch_committed`` is
+    called with the index and vector ids of every batch once it is in the vector store.
+
+    ``incomplete_files`` names files whose chunks stopped short of the end of the file,
+    e.g. because parsing failed partway. The caller may fill it while ``documents`` is
+    being read. Their unseen chunks are not stale, so the final sweep leaves them alone.
+    """
+    namespace = namespace or config_settings.PINECONE_DEFAULT_DEV_NAMESPACE
+    document_ids: List[str] = []
+    total_documents = 0
+    skipped_documents = 0
+    first_batch = True
+
+    if incremental and drop_namespace:
+        namespace_manifest.clear_namespace(index_name, namespace)
+
+    stored_ids_by_file: Dict[str, Set[str]] = {}
+    seen_ids_by_file: Dict[str, Set[str]] = defaultdict(set)
+
+    for batch_index, batch in enumerate(_batched(documents, batch_size)):
+        total_documents += len(batch)
+        batch_ids = None
+
+        if incremental:
+            pending = []
+            for document in batch:
+                file_name = document.metadata.get("file_name", "")
+                content_hash = compute_content_hash(document.page_content)
+                chunk_id = compute_chunk_id(file_name, content_hash)
+                document.metadata["content_hash"] = content_hash
+
+                if file_name not in stored_ids_by_file:
+                    stored_ids_by_file[file_name] = namespace_manifest.get_chunk_ids(index_name, namespace, file_name)
+
+                if chunk_id in stored_ids_by_file[file_name] or chunk_id in seen_ids_by_file[file_name]:
+                    skipped_documents += 1
+                else:
+                    pending.append((document, chunk_id))
+                seen_ids_by_file[file_name].add(chunk_id)
+
+            batch = [document for document, _ in pending]
+            batch_ids = [chunk_id for _, chunk_id in pending]
+
+        if batch_index < start_batch:
+            if not incremental:
+                skipped_documents += len(batch)
+            continue
+
+        if batch:
+            response = push_to_database(
+                texts=batch,
+                index_name=index_name,
+                namespace=namespace,
+                drop_namespace=drop_namespace and first_batch,
+                ids=batch_ids,
+            )
+            first_batch = False
+
+            if not response.status:
+                response.total_documents = total_documents - len(batch)
+                return response
+
+            document_ids.extend(response.document_ids or [])
+
+            if incremental:
+                pushed_ids_by_file: Dict[str, List[str]] = defaultdict(list)
+                for document, chunk_id in pending:
+                    pushed_ids_by_file[document.metadata.get("file_name", "")].append(chunk_id)
+                for file_name, chunk_ids in pushed_ids_by_file.items():
+                    namespace_manifest.add_chunk_ids(index_name, namespace, file_name, chunk_ids)
+
+        if on_batch_committed:
+            on_batch_committed(batch_index, (response.document_ids or []) if batch else [])
+
+        logger.info(f"Processed batch of {len(batch)} documents ({total_documents} so far) for {index_name}/{namespace}")
+
+        if on_batch_pushed:
+            on_batch_pushed(total_documents)
+
+    deleted_documents = 0
+    for file_name, seen_ids in seen_ids_by_file.items():
+        if incomplete_files and file_name in incomplete_files:
+            logger.warning(f"Keeping the stored chunks of {file_name}: its chunks did not all arrive")
+            continue
+        stale_ids = sorted(stored_ids_by_file.get(file_name, set()) - seen_ids)
+        if stale_ids:
+            delete_from_database(stale_ids, index_name=index_name, namespace=namespace)
+            namespace_manifest.remove_chunk_ids(index_name, namespace, file_name, stale_ids)
+            deleted_documents += len(stale_ids)
+
+    if incremental:
+        logger.info(
+            f"Incremental injestion into {index_name}/{namespace}: {total_documents - skipped_documents} "
+            f"pushed, {skipped_documents} unchanged, {deleted_documents} stale deleted"
+        )
+
+    return PushToDatabaseResponseDto(
+        status=True,
+        message="Documents pushed successfully",
+        document_ids=document_ids or None,
+        total_documents=total_documents,
+        skipped_documents=skipped_documents,
+        deleted_documents=deleted_documents,
+        timestamp=datetime.now().isoformat(),
+        index=index_name,
+        namespace=namespace
+    )
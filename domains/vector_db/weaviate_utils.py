@@ -3,30 +3,52 @@ import atexit
 from typing import Optional
 from domains.settings import config_settings
 from domains.vector_db.models import ConnectionResponseDto, ClientResponseDto
+from domains.vector_db.metadata_cache import vector_db_metadata_cache
 from weaviate.exceptions import WeaviateConnectionError
 from loguru import logger
 from weaviate.config import AdditionalConfig
+from weaviate.classes.tenants import Tenant
+from langchain_weaviate.vectorstores import _default_schema
 from contextlib import contextmanager
 
 
 
+_COLLECTIONS_KEY = ("weaviate", "collections")
+
+
+def _tenants_key(index_name: str) -> tuple:
+    return "weaviate", "tenants", index_name
+
+
 class WeaviateConnectionManager:
-    """Manages Weaviate database connections with proper resource cleanup."""
+    """
+    Manages Weaviate database connections with proper resource cleanup.
+
+    Collection and tenant existence checks go through the vector db metadata cache, so
+    repeated pushes to the same tenant make no schema round-trips until the entries expire.
+    """
 
     def __init__(self) -> None:
         self._client: Optional[weaviate.WeaviateClient] = None
         self._additional_config = AdditionalConfig()
         atexit.register(self.close)
 
+    def _collection_exists(self, collection_name: str) -> bool:
+        if not self._client:
+            self.connect()
+        exists = self._client.collections.exists(collection_name)
+        logger.debug(f"Collection {collection_name} {'exists' if exists else 'does not exist'}")
+        return exists
+
+    def _partition_exists(self, partition_name: str, index_name: str) -> bool:
+        return self._client.collections.get(index_name).tenants.exists(partition_name)
+
     def validate_collection(self, collection_name: str) -> bool:
         """Validate if a collection exists without using context manager."""
         try:
-            if not self._client:
-                self.connect()
-            exists = self._client.collections.exists(collection_name)
-            logger.debug(f"Collection {collection_name} {'exists' if exists else 'does not exist'}")
-
-            return exists
+            return vector_db_metadata_cache.contains(
+                _COLLECTIONS_KEY, collection_name, lambda: self._collection_exists(collection_name)
+            )
         except Exception as e:
             logger.error(f"Error validating collection {collection_name}: {str(e)}")
             raise
@@ -82,12 +104,41 @@ class WeaviateConnectionManager:
             finally:
                 self._client = None
 
+    def ensure_collection(self, collection_name: str, multi_tenancy: bool = True) -> None:
+        """Create the collection with the LangChain default schema if it does not exist."""
+        try:
+            if self.validate_collection(collection_name):
+                return
+
+            schema = _default_schema(collection_name)
+            schema["MultiTenancyConfig"] = {"enabled": multi_tenancy}
+            self._client.collections.create_from_dict(schema)
+            vector_db_metadata_cache.add(_COLLECTIONS_KEY, collection_name)
+            logger.info(f"Collection {collection_name} created successfully")
+        except Exception as e:
+            logger.error(f"Error creating collection {collection_name}: {str(e)}")
+            raise
+
+    def ensure_partition(self, partition_name: str, index_name: str) -> None:
+        """Create the tenant in the collection if it does not exist."""
+        try:
+            if self.validate_partition_name(partition_name, index_name):
+                return
+
+            self._client.collections.get(index_name).tenants.create(tenants=[Tenant(name=partition_name)])
+            vector_db_metadata_cache.add(_tenants_key(index_name), partition_name)
+            logger.info(f"Partition {partition_name} created successfully")
+        except Exception as e:
+            logger.error(f"Error creating partition {partition_name}: {str(e)}")
+            raise
+
     def get_partition_names(self, index_name: str) -> list:
         """Get all tenant names for a collection."""
         try:
             if self.validate_collection(index_name):
-                tenants = self._client.collections.get(index_name).tenants.get()
-                return list(tenants.keys())
+                tenants = list(self._client.collections.get(index_name).tenants.get().keys())
+                vector_db_metadata_cache.replace(_tenants_key(index_name), tenants)
+                return tenants
             return []
         except Exception as e:
             logger.error(f"Error getting partition names: {str(e)}")
@@ -99,7 +150,9 @@ class WeaviateConnectionManager:
             if not self.validate_collection(index_name):
                 return False
 
-            return self._client.collections.get(index_name).tenants.exists(partition_name)
+            return vector_db_metadata_cache.contains(
+                _tenants_key(index_name), partition_name, lambda: self._partition_exists(partition_name, index_name)
+            )
         except Exception as e:
             logger.error(f"Error validating partition {partition_name}: {str(e)}")
             raise
@@ -112,9 +165,10 @@ class WeaviateConnectionManager:
                 return False
 
             self._client.collections.get(index_name).tenants.remove(partition_name)
+            vector_db_metadata_cache.discard(_tenants_key(index_name), partition_name)
 
-            # Verify deletion
-            exists = self.validate_partition_name(partition_name, index_name)
+            # Verify deletion against the server, not the cache
+            exists = self._partition_exists(partition_name, index_name)
             if not exists:
                 logger.info(f"Partition {partition_name} deleted successfully")
                 return True
@@ -134,9 +188,11 @@ class WeaviateConnectionManager:
                 return False
 
             self._client.collections.delete(index_name)
+            vector_db_metadata_cache.discard(_COLLECTIONS_KEY, index_name)
+            vector_db_metadata_cache.invalidate(_tenants_key(index_name))
             logger.info(f"Collection {index_name} deleted successfully")
 
-            if self.validate_collection(index_name):
+            if self._collection_exists(index_name):
                 logger.error(f"Failed to delete collection {index_name}")
                 return False
             return True
@@ -1,7 +1,11 @@
+import asyncio
+
 import fastapi
 import loguru
 import uvicorn
 
+from contextlib import asynccontextmanager
+
 from fastapi import Query, UploadFile, File
 from domains.agents.routes import router as agents_router
 from fastapi import WebSocket, WebSocketDisconnect, HTTPException
@@ -12,9 +16,26 @@ from domains.settings import config_settings
 from domains.injestion.routes import router as injestion_router
 from domains.retreival.routes import run_rag, RagUseCase, Message
 from domains.agents.routes import react_orchestrator
+from domains.status_outbox import status_outbox
+from domains.injestion.embedding_registry import embeddings_registry
+from domains.injestion.utils import validate_embedding_dimension
 from loguru import logger
 
-app = fastapi.FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: fastapi.FastAPI):
+    validate_embedding_dimension()
+    # Deliver status updates left in the outbox by a previous run.
+    status_outbox.start()
+    if config_settings.EMBEDDING_WARMUP_STATUS:
+        await asyncio.to_thread(embeddings_registry.warm)
+    yield
+    status_outbox.stop()
+    await embeddings_registry.aclose()
+    embeddings_registry.close()
+
+
+app = fastapi.FastAPI(lifespan=lifespan)
 vectorstore: Optional[VectorStore] = None
 
 
@@ -0,0 +1,2 @@
+# The injestion package wires the vector db modules, so it has to be imported first.
+import domains.injestion  # noqa: F401
@@ -0,0 +1,121 @@
+from typing import Dict, List
+
+import pytest
+from langchain_core.documents import Document
+
+import domains.injestion.routes as routes
+import domains.vector_db.utils as vector_db_utils
+from domains.injestion.job_queue import InjestionJobQueue
+from domains.injestion.models import BulkInjestRequestDto, InjestRequestDto
+from domains.models import RequestStatusEnum
+from domains.vector_db.manifest import NamespaceManifest
+from domains.settings import config_settings
+from domains.vector_db.models import PushToDatabaseResponseDto
+
+
+@pytest.fixture
+def vector_store(monkeypatch, tmp_path) -> Dict[str, str]:
+    """An in-memory vector store and a temporary manifest behind push_to_database_in_batches."""
+    stored: Dict[str, str] = {}
+
+    def push_to_database(texts: List[Document], ids: List[str], **kwargs) -> PushToDatabaseResponseDto:
+        stored.update(zip(ids, (text.page_content for text in texts)))
+        return PushToDatabaseResponseDto(status=True, document_ids=ids)
+
+    def delete_from_database(ids: List[str], **kwargs) -> None:
+        for chunk_id in ids:
+            stored.pop(chunk_id, None)
+
+    monkeypatch.setattr(vector_db_utils, "push_to_database", push_to_database)
+    monkeypatch.setattr(vector_db_utils, "delete_from_database", delete_from_database)
+    monkeypatch.setattr(vector_db_utils, "namespace_manifest", NamespaceManifest(str(tmp_path / "manifest.db")))
+    monkeypatch.setattr(routes, "call_update_status_api", lambda **kwargs: None)
+    return stored
+
+
+def _loader(chunks: int, fail_after: int = None):
+    def lazy_file_loader(file_name: str, **kwargs):
+        for position in range(chunks):
+            if position == fail_after:
+                raise ValueError("corrupt page")
+            yield Document(page_content=f"chunk {position} of {file_name}", metadata={"file_name": file_name})
+
+    return lazy_file_loader
+
+
+def _request(file_name: str) -> InjestRequestDto:
+    return InjestRequestDto(
+        request_id=1,
+        pre_signed_url=f"/data/{file_name}",
+        file_name=file_name,
+        original_file_name=file_name,
+        file_type="pdf",
+        process_type="pdf",
+        namespace="tests",
+    )
+
+
+def test_file_failing_partway_keeps_its_stored_chunks(monkeypatch, vector_store):
+    monkeypatch.setattr(routes, "lazy_file_loader", _loader(10))
+    routes.bulk_load_files_push_to_db([_request("a.pdf")])
+    assert len(vector_store) == 10
+
+    monkeypatch.setattr(routes, "lazy_file_loader", _loader(10, fail_after=3))
+    statuses = routes.bulk_load_files_push_to_db([_request("a.pdf")])
+
+    assert statuses[0].status == RequestStatusEnum.FAILED
+    assert len(vector_store) == 10
+
+
+def test_failed_batch_only_fails_the_files_it_held(monkeypatch, vector_store):
+    monkeypatch.setattr(routes, "lazy_file_loader", _loader(4))
+    # One parse thread and batches of one file each, so a.pdf is committed before b.pdf is pushed.
+    monkeypatch.setattr(config_settings, "BULK_INJESTION_PARSE_WORKERS", 1)
+    monkeypatch.setattr(config_settings, "INJESTION_BATCH_SIZE", 4)
+
+    def push_to_database(texts: List[Document], ids: List[str], **kwargs) -> PushToDatabaseResponseDto:
+        if any("b.pdf" in text.page_content for text in texts):
+            return PushToDatabaseResponseDto(status=False, message="upsert rejected")
+        vector_store.update(zip(ids, (text.page_content for text in texts)))
+        return PushToDatabaseResponseDto(status=True, document_ids=ids)
+
+    monkeypatch.setattr(vector_db_utils, "push_to_database", push_to_database)
+    progress = []
+
+    statuses = routes.bulk_load_files_push_to_db(
+        [_request("a.pdf"), _request("b.pdf")], progress_callback=progress.append
+    )
+
+    assert statuses[0].status == RequestStatusEnum.COMPLETED
+    assert statuses[1].status == RequestStatusEnum.FAILED
+    assert statuses[1].error_detail.startswith("Batch 1 ")
+    assert list(progress[-1]["completed_files"]) == ["a.pdf"]
+
+
+def test_resumed_job_skips_completed_files(monkeypatch, vector_store):
+    parsed = []
+
+    def lazy_file_loader(file_name: str, **kwargs):
+        parsed.append(file_name)
+        yield from _loader(2)(file_name)
+
+    monkeypatch.setattr(routes, "lazy_file_loader", lazy_file_loader)
+
+    statuses = routes.bulk_load_files_push_to_db(
+        [_request("a.pdf"), _request("b.pdf")],
+        completed_files={"a.pdf": {"total_pages": 1, "total_chunks": 2}},
+    )
+
+    assert parsed == ["b.pdf"]
+    assert [status.status for status in statuses] == [RequestStatusEnum.COMPLETED] * 2
+
+
+def test_bulk_jobs_round_trip_through_the_queue(tmp_path):
+    queue = InjestionJobQueue(str(tmp_path / "jobs.db"))
+    job_id = queue.enqueue(BulkInjestRequestDto(request_id=1, namespace="tests", files=[_request("a.pdf")]))
+
+    claimed_id, request = queue.claim_next(["bulk"])
+
+    assert claimed_id == job_id
+    assert isinstance(request, BulkInjestRequestDto)
+    assert request.files[0].file_name == "a.pdf"
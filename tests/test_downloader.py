@@ -0,0 +1,90 @@
+import asyncio
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from domains.injestion.downloader import URLDownloader
+
+BODY = bytes(range(256)) * 400
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Serves BODY with Range support; the behaviour of each request is set by the test."""
+
+    # Per request: "cut" sends half the body and drops the connection, "misplaced" answers
+    # a Range request from the wrong offset, anything else serves the request correctly.
+    script: list = []
+    ranges: list = []
+
+    def do_GET(self) -> None:
+        behaviour = self.script.pop(0) if self.script else "serve"
+        match = re.match(r"bytes=(\d+)-", self.headers.get("Range", ""))
+        start = int(match.group(1)) if match else None
+        self.ranges.append(start)
+
+        if behaviour == "misplaced" and start:
+            start -= 100
+        if start is None:
+            self.send_response(200)
+            start = 0
+        else:
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(BODY) - 1}/{len(BODY)}")
+        self.send_header("Content-Length", str(len(BODY) - start))
+        self.end_headers()
+
+        if behaviour == "cut":
+            self.wfile.write(BODY[start:start + (len(BODY) - start) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(BODY[start:])
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server():
+    RangeHandler.script = []
+    RangeHandler.ranges = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/document.pdf"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def downloader(tmp_path):
+    return URLDownloader(download_folder=str(tmp_path), chunk_size=1024, max_retries=3)
+
+
+def test_interrupted_download_resumes_from_the_partial_file(server, downloader):
+    RangeHandler.script = ["cut"]
+
+    path = downloader.download(server)
+
+    assert path.read_bytes() == BODY
+    assert RangeHandler.ranges == [None, len(BODY) // 2]
+
+
+def test_interrupted_async_download_resumes_from_the_partial_file(server, downloader):
+    RangeHandler.script = ["cut"]
+
+    path = asyncio.run(downloader.adownload(server))
+
+    assert path.read_bytes() == BODY
+    assert RangeHandler.ranges == [None, len(BODY) // 2]
+
+
+def test_misplaced_range_falls_back_to_a_full_download(server, downloader):
+    RangeHandler.script = ["cut", "misplaced"]
+
+    path = downloader.download(server)
+
+    assert path.read_bytes() == BODY
+    assert RangeHandler.ranges == [None, len(BODY) // 2, None]
@@ -0,0 +1,36 @@
+import pytest
+
+from domains.injestion.utils import validate_embedding_dimension
+from domains.settings import config_settings
+
+
+@pytest.fixture
+def embedding_model(monkeypatch):
+    def configure(service: str, model_name: str, dimension: int) -> None:
+        monkeypatch.setattr(config_settings, "EMBEDDING_SERVICE", service)
+        monkeypatch.setitem(config_settings.LLMS, "EMBEDDING_MODEL_NAME", model_name)
+        monkeypatch.setattr(config_settings, "EMBEDDING_DIMENSION", dimension)
+
+    return configure
+
+
+def test_shortenable_model_accepts_a_smaller_dimension(embedding_model):
+    embedding_model("openai", "text-embedding-3-large", 1024)
+
+    validate_embedding_dimension()
+
+
+def test_dimension_above_the_native_width_is_rejected(embedding_model):
+    embedding_model("openai", "text-embedding-3-small", 3072)
+
+    with pytest.raises(ValueError):
+        validate_embedding_dimension()
+
+
+def test_model_that_cannot_shorten_only_accepts_the_default(embedding_model):
+    embedding_model("openai", "text-embedding-ada-002", 1536)
+    validate_embedding_dimension()
+
+    embedding_model("openai", "text-embedding-ada-002", 512)
+    with pytest.raises(ValueError):
+        validate_embedding_dimension()
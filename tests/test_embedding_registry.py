@@ -0,0 +1,40 @@
+import asyncio
+
+from domains.injestion.embedding_registry import EmbeddingsRegistry
+from domains.settings import config_settings
+
+
+def test_each_loop_closes_its_async_client(monkeypatch):
+    monkeypatch.setattr(config_settings, "EMBEDDING_SERVICE", "openai")
+    monkeypatch.setattr(config_settings, "OPENAI_API_KEY", "sk-test")
+    registry = EmbeddingsRegistry()
+
+    async def use_and_close():
+        registry.get()
+        client = registry._async_clients[asyncio.get_running_loop()]
+        await registry.aclose()
+        return client
+
+    clients = [asyncio.run(use_and_close()) for _ in range(2)]
+
+    assert clients[0] is not clients[1]
+    assert all(client.is_closed for client in clients)
+    assert len(registry._async_clients) == 0
+
+
+def test_close_closes_clients_of_idle_loops(monkeypatch):
+    monkeypatch.setattr(config_settings, "EMBEDDING_SERVICE", "openai")
+    monkeypatch.setattr(config_settings, "OPENAI_API_KEY", "sk-test")
+    registry = EmbeddingsRegistry()
+    loop = asyncio.new_event_loop()
+
+    async def use():
+        registry.get()
+        return registry._async_clients[asyncio.get_running_loop()]
+
+    try:
+        client = loop.run_until_complete(use())
+        registry.close()
+        assert client.is_closed
+    finally:
+        loop.close()
@@ -0,0 +1,63 @@
+import asyncio
+import heapq
+import threading
+import time
+
+from domains.injestion.embedding_scheduler import BULK, INTERACTIVE, EmbeddingScheduler, SharedBudget
+
+
+def test_processes_share_one_budget(tmp_path):
+    # Two schedulers on one database stand in for the API process and a worker.
+    path = str(tmp_path / "budget.db")
+    api = EmbeddingScheduler(6000, 600, budget=SharedBudget(6000, 600, path))
+    worker = EmbeddingScheduler(6000, 600, budget=SharedBudget(6000, 600, path))
+
+    api.acquire(6000)
+
+    assert worker.budget.take(600, 1, BULK) > 0
+
+
+def test_waiting_interactive_caller_holds_back_bulk_callers(tmp_path):
+    path = str(tmp_path / "budget.db")
+    api = SharedBudget(6000, 600, path)
+    worker = SharedBudget(6000, 600, path)
+
+    assert api.take(6000, 1, INTERACTIVE) == 0
+    interactive_wait = api.take(100, 1, INTERACTIVE)
+    assert interactive_wait > 0
+    # The bucket has refilled enough for the bulk call by now, but the interactive caller goes first.
+    assert worker.take(1, 1, BULK) >= interactive_wait
+
+
+def test_async_acquire_waits_for_the_budget():
+    scheduler = EmbeddingScheduler(60_000, 6000)
+
+    async def acquire_all():
+        # The last call waits a fifth of a second for the bucket to refill.
+        await asyncio.gather(*(scheduler.aacquire(tokens) for tokens in (30_000, 30_000, 200)))
+
+    asyncio.run(acquire_all())
+
+    assert scheduler.stats()["waiting"] == 0
+
+
+def test_waiter_recovers_from_a_missed_wakeup():
+    class SilentScheduler(EmbeddingScheduler):
+        MAX_WAIT = 0.05
+
+        def _dequeue(self, ticket):
+            # Leave the queue without notifying, as when the notify lands before the waiter sleeps.
+            with self._condition:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+
+    scheduler = SilentScheduler(60_000, 6000)
+    # A caller ahead in the queue that leaves without notifying the one behind it.
+    head = scheduler._enqueue(INTERACTIVE)
+    follower = threading.Thread(target=scheduler.acquire, args=(10,), daemon=True)
+    follower.start()
+    time.sleep(0.1)
+    scheduler._dequeue(head)
+
+    follower.join(timeout=2)
+    assert not follower.is_alive()
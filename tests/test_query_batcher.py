@@ -0,0 +1,64 @@
+import asyncio
+
+import pinecone
+from langchain_community.vectorstores import Pinecone
+
+import domains.vector_db.pinecone_utils as pinecone_utils
+from benchmarks.fakes import FakeEmbeddings, InMemoryIndex
+from domains.injestion.query_batcher import CoalescedQueryEmbeddings, QueryEmbeddingBatcher
+from domains.settings import config_settings
+
+TEXTS = [
+    "How do I reset my password",
+    "What are the office opening hours",
+    "Who approves travel expenses",
+    "Where is the quarterly report stored",
+]
+
+
+def test_concurrent_retrievals_share_one_provider_call(monkeypatch):
+    index = InMemoryIndex()
+    index.upsert(
+        [
+            {"id": str(position), "values": vector, "metadata": {"text": text}}
+            for position, (text, vector) in enumerate(zip(TEXTS, FakeEmbeddings().embed_documents(TEXTS)))
+        ],
+        namespace="tests",
+    )
+
+    provider = FakeEmbeddings(latency_ms=20)
+    batcher = QueryEmbeddingBatcher(window_ms=50, max_batch_size=64)
+    embeddings = CoalescedQueryEmbeddings(underlying=lambda: provider, model_name="fake", batcher=batcher)
+
+    monkeypatch.setattr(pinecone, "Index", InMemoryIndex, raising=False)
+    monkeypatch.setattr(config_settings, "VECTOR_DATABASE_TO_USE", "pinecone")
+    monkeypatch.setattr(
+        pinecone_utils, "load_index",
+        lambda index_name, namespace=None: Pinecone(index=index, embedding=embeddings, text_key="text"),
+    )
+
+    async def retrieve_all():
+        return await asyncio.gather(*(
+            pinecone_utils.get_related_docs_with_score(
+                index_name="tests", namespace="tests", question=text, total_docs_to_retrieve=1
+            )
+            for text in TEXTS
+        ))
+
+    results = asyncio.run(retrieve_all())
+
+    assert [related[0][0].page_content for related in results] == TEXTS
+    assert provider.calls == 1
+    assert batcher.stats()["batches"] == 1
+
+
+def test_batch_failure_reaches_every_caller():
+    class FailingEmbeddings(FakeEmbeddings):
+        def embed_documents(self, texts):
+            raise RuntimeError("provider unavailable")
+
+    batcher = QueryEmbeddingBatcher(window_ms=10, max_batch_size=64)
+    futures = [batcher.submit(FailingEmbeddings(), "fake", text) for text in TEXTS]
+
+    for future in futures:
+        assert isinstance(future.exception(timeout=5), RuntimeError)
@@ -0,0 +1,46 @@
+import random
+
+import pytest
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from benchmarks.corpus import generate_paragraphs
+from benchmarks.text_splitter import FRAGMENTS
+from domains.injestion.splitter import FastTextSplitter
+from domains.injestion.utils import get_text_splitter
+from domains.settings import config_settings
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_random_texts_split_like_recursive_splitter(seed):
+    # Short texts of separators and words of mixed lengths hit the recursion and overlap edge cases.
+    rng = random.Random(seed)
+    for _ in range(250):
+        text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 500)))
+        chunk_size = rng.randint(1, 80)
+        chunk_overlap = rng.randint(0, chunk_size)
+
+        expected = RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap).split_text(text)
+        actual = FastTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap).split_text(text)
+
+        assert actual == expected, (chunk_size, chunk_overlap, text)
+
+
+def test_documents_split_like_recursive_splitter():
+    paragraphs = generate_paragraphs(60, words_per_paragraph=80) + generate_paragraphs(6, words_per_paragraph=600, seed=1)
+    documents = [
+        Document(page_content="\n\n".join(paragraphs[page::6]), metadata={"page": page}) for page in range(6)
+    ]
+
+    expected = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200, add_start_index=True)
+    actual = FastTextSplitter(chunk_size=1000, chunk_overlap=200, add_start_index=True)
+
+    assert actual.split_documents(documents) == expected.split_documents(documents)
+
+
+def test_shared_splitter_follows_the_configured_engine(monkeypatch):
+    monkeypatch.setattr(config_settings, "TEXT_SPLITTER_ENGINE", "fast")
+    assert isinstance(get_text_splitter(1000, 200), FastTextSplitter)
+
+    monkeypatch.setattr(config_settings, "TEXT_SPLITTER_ENGINE", "recursive")
+    assert type(get_text_splitter(1000, 200)) is RecursiveCharacterTextSplitter